@@ -0,0 +1,111 @@
+# File: gunicorn.conf.py
+
+"""
+Description:
+Gunicorn configuration for running the Nuvai API with multiple worker processes.
+
+Usage (from the project root):
+    gunicorn -c backend/gunicorn.conf.py "backend.server:create_app()"
+
+Features:
+- Worker count and bind address from the environment (GUNICORN_WORKERS, API_PORT)
+- Prometheus multi-process mode: workers share PROMETHEUS_MULTIPROC_DIR so /metrics
+  aggregates all of them; the directory is emptied on start and dead workers are marked
+- One log collector process started by the master; workers ship their log lines to it
+  over a Unix socket instead of each rotating logs/nuvai.log on their own
+- Pre-warming (backend/src/prewarm.py): with preload_app (GUNICORN_PRELOAD, default on)
+  the master compiles every scanner's rules before forking, so workers share them
+  copy-on-write; each worker then opens its pools and runs a dummy scan per language
+  before it accepts traffic (NUVAI_PREWARM=false disables both)
+
+Note that with preload_app the app is imported before on_starting runs, i.e. before the
+log collector exists; master-side work that should be logged belongs in when_ready.
+"""
+
+import gc
+import multiprocessing
+import os
+import shutil
+import time
+
+bind = f"0.0.0.0:{os.getenv('API_PORT', 5000)}"
+workers = int(os.getenv("GUNICORN_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+preload_app = os.getenv("GUNICORN_PRELOAD", "true").lower() in ("1", "true", "yes")
+
+# Must be set before the app (and backend.src.nuvai.utils.logger) is imported
+os.environ.setdefault(
+    "NUVAI_LOG_SOCKET",
+    os.path.join(os.getenv("NUVAI_LOG_DIR", "logs"), "nuvai-log.sock"),
+)
+
+# Must also be set before prometheus_client is imported by the app
+os.environ.setdefault(
+    "PROMETHEUS_MULTIPROC_DIR",
+    os.path.join(os.getenv("NUVAI_LOG_DIR", "logs"), "prometheus"),
+)
+if not os.environ.get("NUVAI_METRICS_DIR_READY"):
+    # Samples left by a previous run would be added to this one; keep them across reloads (HUP)
+    shutil.rmtree(os.environ["PROMETHEUS_MULTIPROC_DIR"], ignore_errors=True)
+    os.makedirs(os.environ["PROMETHEUS_MULTIPROC_DIR"], exist_ok=True)
+    os.environ["NUVAI_METRICS_DIR_READY"] = "1"
+
+_collector = None
+
+
+def on_starting(server):
+    global _collector
+    from backend.src.nuvai.utils.log_collector import run_collector
+
+    socket_path = os.environ["NUVAI_LOG_SOCKET"]
+    os.makedirs(os.path.dirname(socket_path) or ".", exist_ok=True)
+    _collector = multiprocessing.get_context("fork").Process(
+        target=run_collector, args=(socket_path,), name="nuvai-log-collector", daemon=True
+    )
+    _collector.start()
+
+    # Give the collector a moment to bind so the first worker records are not dropped
+    deadline = time.monotonic() + 5
+    while not os.path.exists(socket_path) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    server.log.info("Log collector started (pid %s) on %s", _collector.pid, socket_path)
+
+
+def when_ready(server):
+    if not preload_app:
+        return  # the master never imports the app; workers warm up on their own
+    from backend.src.prewarm import PREWARM_ENABLED, compile_rule_packs
+
+    if PREWARM_ENABLED:
+        timings = compile_rule_packs()
+        server.log.info("Rule packs compiled before fork in %s ms", timings["rule_packs"])
+    # Keep everything loaded so far out of the collector's reach: fewer copy-on-write
+    # page faults in workers when a collection would otherwise touch shared objects
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    if preload_app:
+        from backend.src.prewarm import reset_after_fork
+
+        reset_after_fork()
+
+
+def post_worker_init(worker):
+    # Runs once the worker has loaded the app and right before it starts accepting
+    from backend.src.prewarm import PREWARM_ENABLED, warm_worker
+
+    if PREWARM_ENABLED:
+        warm_worker()
+
+
+def child_exit(server, worker):
+    from backend.src.metrics import mark_worker_dead
+
+    mark_worker_dead(worker.pid)
+
+
+def on_exit(server):
+    # Workers are gone; let the collector write out what it has received
+    if _collector is not None and _collector.is_alive():
+        _collector.terminate()
+        _collector.join(timeout=10)
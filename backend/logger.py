@@ -8,7 +8,7 @@ and includes filters to avoid logging sensitive data (e.g., passwords, tokens).
 
 Security Features:
 - Filters logs for sensitive keywords (e.g., password, token, secret)
-- Supports log rotation to prevent disk overflow
+- Supports log rotation to prevent disk overflow (one writer per deployment, see log_collector.py)
 - Uses different verbosity levels based on environment (dev/staging/prod)
 - Allows future integration with external logging services (e.g., ELK, Splunk)
 - Custom logger names for better tracing across modules
@@ -18,22 +18,21 @@ Security Features:
 
 import logging
 import os
-import re
 import stat
-from logging.handlers import RotatingFileHandler
+
+from backend.src.nuvai.utils.logger import get_logger, LOG_FILE, LOG_SOCKET
+from backend.src.nuvai.utils.redaction import STRICT_ATTR
 
 # Filter sensitive data from logs
 class SensitiveDataFilter(logging.Filter):
-    SENSITIVE_PATTERNS = [
-        re.compile(r'(password|token|secret|api[_-]?key)', re.IGNORECASE)
-    ]
+    """
+    Replaces any message that mentions a sensitive keyword (password, token, secret,
+    api key, ...) with a fixed notice. The check is deferred to formatting time, so
+    records never emitted are not rendered or scanned on the calling thread.
+    """
 
     def filter(self, record):
-        msg = str(record.getMessage())
-        for pattern in self.SENSITIVE_PATTERNS:
-            if pattern.search(msg):
-                record.msg = "[FILTERED] Sensitive information removed from log."
-                break
+        setattr(record, STRICT_ATTR, True)
         return True
 
 def set_secure_permissions(file_path):
@@ -43,34 +42,22 @@ def set_secure_permissions(file_path):
         print(f"Warning: Unable to set permissions for {file_path}: {e}")
 
 def setup_logger(name="nuvai", log_level="INFO"):
-    logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, log_level.upper(), logging.INFO))
-
-    formatter = logging.Formatter(
-        "%(asctime)s - %(levelname)s - %(name)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
-    )
-
-    # Console Handler
-    console_handler = logging.StreamHandler()
-    console_handler.setFormatter(formatter)
-    console_handler.addFilter(SensitiveDataFilter())
-
-    # File Handler with rotation
-    log_dir = os.path.join(os.path.expanduser("~"), ".nuvai_logs")
-    os.makedirs(log_dir, exist_ok=True)
-    file_path = os.path.join(log_dir, "nuvai.log")
+    """
+    Configure a logger on the shared Nuvai pipeline (backend.src.nuvai.utils.logger).
 
-    file_handler = RotatingFileHandler(file_path, maxBytes=1_000_000, backupCount=5)
-    file_handler.setFormatter(formatter)
-    file_handler.addFilter(SensitiveDataFilter())
-
-    set_secure_permissions(file_path)
-
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    This module used to attach its own RotatingFileHandler on ~/.nuvai_logs/nuvai.log,
+    which every gunicorn worker rotated independently. All output now goes through the
+    one queue listener per process, and through the log collector when NUVAI_LOG_SOCKET is set.
+    """
+    logger = get_logger(name)
+    logger.setLevel(getattr(logging, log_level.upper(), logging.INFO))
+    if not any(isinstance(f, SensitiveDataFilter) for f in logger.filters):
+        logger.addFilter(SensitiveDataFilter())
     logger.propagate = False
 
+    if not LOG_SOCKET:
+        set_secure_permissions(LOG_FILE)
+
     return logger
 
 # Example usage
@@ -0,0 +1,67 @@
+# file: analysis_routes.py
+
+import json
+from flask import Blueprint, request, jsonify, Response, stream_with_context
+from backend.src.ai_analyzer import stream_scan_analysis, DEFAULT_MODEL
+from backend.src.ai_client import get_ai_client, CircuitOpenError
+from backend.src.local_analyzer import requires_model_analysis, summarize_locally
+from backend.src.nuvai.utils.logger import get_logger
+
+analysis_blueprint = Blueprint("analysis", __name__)
+logger = get_logger(__name__)
+
+
+def sse_event(event: str, data) -> str:
+    """Encode a single Server-Sent Events frame."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@analysis_blueprint.route("/stream", methods=["POST"])
+def stream_analysis():
+    scan_result = request.get_json(silent=True)
+    if not scan_result or not isinstance(scan_result.get("vulnerabilities"), list):
+        logger.warning("Invalid scan result received for streaming analysis")
+        return jsonify({"message": "A scan result with a 'vulnerabilities' list is required."}), 400
+
+    scan_result.setdefault("filename", "unknown")
+    scan_result.setdefault("language", "unknown")
+    force_model = bool(scan_result.pop("force_model", False)) or request.args.get("model") == "1"
+
+    if not force_model and not requires_model_analysis(scan_result):
+        local = summarize_locally(scan_result)
+        body = sse_event("start", {"model_used": local["model_used"]})
+        body += sse_event("token", {"content": local["ai_analysis"]})
+        body += sse_event("done", local)
+        return Response(body, mimetype="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+    def generate():
+        tokens = stream_scan_analysis(scan_result)
+        try:
+            yield sse_event("start", {"model_used": DEFAULT_MODEL})
+            for token in tokens:
+                yield sse_event("token", {"content": token})
+            yield sse_event("done", {"model_used": DEFAULT_MODEL})
+        except CircuitOpenError:
+            local = {**summarize_locally(scan_result), "fallback": True}
+            yield sse_event("token", {"content": local["ai_analysis"]})
+            yield sse_event("done", local)
+        except GeneratorExit:
+            logger.info(f"Client disconnected, cancelling analysis of '{scan_result['filename']}'")
+            raise
+        except Exception as e:
+            logger.exception("Streaming AI analysis failed")
+            yield sse_event("error", {"message": f"Error performing AI analysis: {str(e)}"})
+        finally:
+            tokens.close()
+
+    response = Response(stream_with_context(generate()), mimetype="text/event-stream")
+    response.headers["Cache-Control"] = "no-cache"
+    response.headers["X-Accel-Buffering"] = "no"
+    return response
+
+
+@analysis_blueprint.route("/health", methods=["GET"])
+def ai_health():
+    health = get_ai_client().health()
+    status = 503 if health["circuit"]["state"] == "open" else 200
+    return jsonify(health), status
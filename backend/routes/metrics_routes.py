@@ -0,0 +1,23 @@
+# file: metrics_routes.py
+
+import hmac
+import os
+from flask import Blueprint, request, jsonify, Response
+from backend.src.metrics import render_metrics
+
+metrics_blueprint = Blueprint("metrics", __name__)
+
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
+
+@metrics_blueprint.route("/metrics", methods=["GET"])
+def metrics():
+    if METRICS_TOKEN:
+        supplied = request.headers.get("Authorization", "").removeprefix("Bearer ").strip()
+        if not hmac.compare_digest(supplied.encode(), METRICS_TOKEN.encode()):
+            return jsonify({"message": "Unauthorized"}), 401
+
+    body, content_type = render_metrics()
+    if body is None:
+        return jsonify({"message": "Metrics are unavailable: prometheus_client is not installed."}), 503
+    return Response(body, content_type=content_type)
@@ -0,0 +1,40 @@
+# file: profile_routes.py
+
+from flask import Blueprint, request, jsonify, Response, send_file
+from backend.src.request_profiler import (
+    is_admin_token, list_profiles, profile_path, render_text, render_collapsed,
+)
+from backend.src.nuvai.utils.logger import get_logger
+
+profile_blueprint = Blueprint("profiles", __name__)
+logger = get_logger(__name__)
+
+
+@profile_blueprint.before_request
+def require_admin():
+    supplied = request.headers.get("Authorization", "").removeprefix("Bearer ")
+    if not is_admin_token(supplied):
+        logger.warning(f"Unauthorized profile access from IP: {request.remote_addr}")
+        return jsonify({"message": "Unauthorized"}), 401
+
+
+@profile_blueprint.route("", methods=["GET"])
+def get_profiles():
+    return jsonify(list_profiles())
+
+
+@profile_blueprint.route("/<profile_id>", methods=["GET"])
+def get_profile(profile_id):
+    path = profile_path(profile_id)
+    if not path:
+        return jsonify({"message": "Profile not found."}), 404
+
+    fmt = request.args.get("format", "pstats")
+    if fmt == "pstats":
+        return send_file(path, mimetype="application/octet-stream", as_attachment=True,
+                         download_name=f"{profile_id}.prof")
+    if fmt == "collapsed":
+        return Response(render_collapsed(path), mimetype="text/plain")
+    if fmt == "text":
+        return Response(render_text(path), mimetype="text/plain")
+    return jsonify({"message": "Unknown format. Use pstats, collapsed or text."}), 400
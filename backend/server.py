@@ -1,18 +1,28 @@
 # File: server.py
 
 import os
+import time
 import uuid
-from flask import Flask, request, jsonify
+from collections import Counter
+from flask import Flask, request, jsonify, g
 from flask_cors import CORS
 from dotenv import load_dotenv
 from werkzeug.utils import secure_filename
 
 from backend.routes.auth_routes import auth_blueprint
 from backend.routes.reset_password_secure import reset_blueprint
+from backend.routes.analysis_routes import analysis_blueprint
+from backend.routes.metrics_routes import metrics_blueprint
+from backend.routes.profile_routes import profile_blueprint
 from backend.config import get_config, validate_config
 from backend.src.nuvai import scan_code
 from backend.src.nuvai.utils import get_language
-from backend.src.nuvai.utils.logger import get_logger
+from backend.src.nuvai.finding import as_dict
+from backend.src.nuvai.utils.logger import get_logger, log_queue
+from backend.src.nuvai.utils.log_sampling import begin_request_log, end_request_log, get_request_summary
+from backend.src import metrics
+from backend.src.server_timing import StageTimer, SERVER_TIMING_ENABLED
+from backend.src.request_profiler import start_request_profile, finish_request_profile, PROFILE_ID_HEADER
 from backend.src.core.db import init_db
 
 logger = get_logger(__name__)
@@ -39,10 +49,13 @@ def create_app():
 
     app.register_blueprint(reset_blueprint, url_prefix="/auth")
     app.register_blueprint(auth_blueprint, url_prefix="/auth")
+    app.register_blueprint(analysis_blueprint, url_prefix="/analyze")
+    app.register_blueprint(metrics_blueprint)
+    app.register_blueprint(profile_blueprint, url_prefix="/admin/profiles")
 
     @app.route("/")
     def health_check():
-        logger.info("Health check endpoint called")
+        logger.debug("Health check endpoint called")
         return jsonify({
             "status": "ok",
             "version": "1.0.0",
@@ -51,7 +64,48 @@ def create_app():
 
     @app.before_request
     def log_request_info():
-        logger.info(f"Incoming request: {request.method} {request.path} from IP: {request.remote_addr}")
+        g.request_started = time.perf_counter()
+        g.route = request.url_rule.rule if request.url_rule else "<unmatched>"
+        begin_request_log(g.route)
+        metrics.REQUESTS_IN_FLIGHT.inc()
+        logger.debug(f"Incoming request: {request.method} {request.path} from IP: {request.remote_addr}")
+        if g.route == "/scan":
+            g.request_profile = start_request_profile(request.headers)
+
+    @app.after_request
+    def store_request_profile(response):
+        profile = g.pop("request_profile", None)
+        if profile is not None:
+            response.headers[PROFILE_ID_HEADER] = finish_request_profile(profile, g.route)
+        return response
+
+    @app.after_request
+    def record_request_metrics(response):
+        # Per-request INFO lines are replaced by one summary record per route and window
+        started = g.get("request_started")
+        if started is not None:
+            duration = time.perf_counter() - started
+            get_request_summary().observe(g.route, response.status_code, duration * 1000)
+            metrics.REQUESTS.labels(g.route, request.method, response.status_code).inc()
+            metrics.REQUEST_LATENCY.labels(g.route, request.method).observe(duration)
+        metrics.LOG_QUEUE_DEPTH.set(log_queue.qsize())
+        return response
+
+    @app.after_request
+    def add_server_timing(response):
+        timer = g.get("stage_timer")
+        if timer is not None and SERVER_TIMING_ENABLED:
+            response.headers["Server-Timing"] = timer.header_value()
+        return response
+
+    @app.teardown_request
+    def clear_request_log(exc):
+        profile = g.pop("request_profile", None)
+        if profile is not None:
+            profile.profiler.disable()  # request failed before after_request ran
+        if g.get("request_started") is not None:
+            metrics.REQUESTS_IN_FLIGHT.dec()
+        end_request_log()
 
     @app.after_request
     def set_cors_and_security_headers(response):
@@ -62,6 +116,7 @@ def create_app():
             response.headers["Access-Control-Allow-Credentials"] = "true"
             response.headers["Access-Control-Allow-Headers"] = "Content-Type, Authorization, X-Requested-With, X-CSRF-Token"
             response.headers["Access-Control-Allow-Methods"] = "GET, POST, PUT, DELETE, OPTIONS"
+            response.headers["Timing-Allow-Origin"] = origin
 
         response.headers["Content-Security-Policy"] = (
             "default-src 'none'; "
@@ -84,50 +139,70 @@ def create_app():
 
     @app.route("/scan", methods=["POST"])
     def scan_file_or_files():
-        logger.info("Received scan request")
+        timer = g.stage_timer = StageTimer(g.get("request_started"))
+        logger.debug("Received scan request")
         if not request.files:
             logger.warning("No file(s) uploaded")
             return jsonify({"error": "No file(s) uploaded"}), 400
 
         file_items = list(request.files.items())
+        timer.mark("upload")
+        include_timings = request.args.get("timings") == "1"
         if len(file_items) == 1:
             _, file = file_items[0]
-            return scan_single_file(file)
+            return scan_single_file(file, timer, include_timings)
 
-        results = [scan_and_return(file) for _, file in file_items]
-        return jsonify(results)
+        results = [scan_and_return(file, timer, include_timings) for _, file in file_items]
+        response = jsonify(results)
+        timer.mark("serialize")
+        return response
 
-    def scan_single_file(file):
-        result = scan_and_return(file)
-        return jsonify(result)
+    def scan_single_file(file, timer, include_timings=False):
+        result = scan_and_return(file, timer, include_timings)
+        response = jsonify(result)
+        timer.mark("serialize")
+        return response
+
+    def record_scan_metrics(language, size, duration, findings):
+        label = language or "unknown"
+        metrics.SCAN_DURATION.labels(label).observe(duration)
+        metrics.SCAN_BYTES.labels(label).inc(size)
+        metrics.SCAN_FILE_SIZE.labels(label).observe(size)
+        for severity, count in Counter(f.rule.severity.name.lower() for f in findings).items():
+            metrics.FINDINGS.labels(label, severity).inc(count)
 
-    def scan_and_return(file):
+    def scan_and_return(file, request_timer=None, include_timings=False):
         original_filename = secure_filename(file.filename)
         file_id = uuid.uuid4().hex
         filename = f"{file_id}_{original_filename}"
         file_path = os.path.join(UPLOAD_FOLDER, filename)
+        timer = StageTimer()
 
         try:
             file.save(file_path)
+            timer.mark("save")
             with open(file_path, "r", encoding="utf-8") as f:
                 code = f.read()
+            timer.mark("decode")
 
             language = get_language(original_filename, code)
-            logger.info(f"Scanning file '{original_filename}' (language: {language})")
+            timer.mark("get_language")
+            logger.debug(f"Scanning file '{original_filename}' (language: {language})")
             findings = scan_code(code, language)
+            scan_seconds = timer.mark("scan_code")
+            record_scan_metrics(language, os.path.getsize(file_path), scan_seconds, findings)
 
-            normalized = [{
-                "severity": f.get("severity") or f.get("level", "info").lower(),
-                "title": f.get("title") or f.get("type", "Untitled Finding"),
-                "description": f.get("description") or f.get("message", "No description provided."),
-                "recommendation": f.get("recommendation", "No recommendation available.")
-            } for f in findings]
+            normalized = [as_dict(f, "api") for f in findings]
+            timer.mark("normalize")
 
-            return {
+            result = {
                 "filename": original_filename,
                 "language": language,
                 "vulnerabilities": normalized
             }
+            if include_timings:
+                result["timings"] = timer.as_ms()
+            return result
 
         except UnicodeDecodeError:
             logger.warning(f"Invalid encoding in file '{original_filename}'")
@@ -145,6 +220,9 @@ def create_app():
             if os.path.exists(file_path):
                 os.remove(file_path)
                 logger.debug(f"Temporary file '{file_path}' deleted")
+            timer.mark("cleanup")
+            if request_timer is not None:
+                request_timer.merge(timer)
 
     return app
 
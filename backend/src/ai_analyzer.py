@@ -1,12 +1,12 @@
-import openai
-from openai import OpenAI
 import os
-from typing import Dict, Any
+from typing import Dict, Any, Iterator
+from backend.src.ai_client import get_ai_client, CircuitOpenError
+from backend.src.local_analyzer import requires_model_analysis, summarize_locally, remember_analyzed
+from backend.src.nuvai.aggregate import FindingAggregator
+from backend.src.nuvai.finding import Finding, one_off_rule
+from backend.src.nuvai.utils.logger import get_logger
 
-# Initialize OpenAI client
-client = OpenAI(
-    api_key=os.getenv("OPENAI_API_KEY"),
-)
+logger = get_logger(__name__)
 
 DEFAULT_MODEL ="gpt-4o-2024-08-06" # "gpt-3.5-turbo"  # Changed from "gpt-4"
 DEFAULT_TEMPERATURE = 0.7
@@ -23,25 +23,22 @@ demo_object = {
     "model_used": DEFAULT_MODEL
 }
 
-def analyze_scan_results(scan_result: Dict[str, Any]) -> Dict[str, Any]:
+def analyze_scan_results(scan_result: Dict[str, Any], force_model: bool = False) -> Dict[str, Any]:
     """
-    Analyze scan results using OpenAI API
+    Analyze scan results, using the local summary unless the OpenAI API adds value
+    (severity/novelty thresholds crossed, or force_model requested)
     """
+    if not force_model and not requires_model_analysis(scan_result):
+        return summarize_locally(scan_result)
+
     try:
-        scan_text = f"""
-        File: {scan_result['filename']}
-        Language: {scan_result['language']}
-        Vulnerabilities Found: {len(scan_result['vulnerabilities'])}
-        
-        Detailed Findings:
-        {format_vulnerabilities(scan_result['vulnerabilities'])}
-        """
+        scan_text = build_scan_prompt(scan_result)
         # return demo_object
         model_to_use = DEFAULT_MODEL
         print(f"[DEBUG] Attempting to use model: {model_to_use}")
         
         print(f"[DEBUG] Making API call with model {model_to_use}")
-        response = client.chat.completions.create(
+        response = get_ai_client().create_chat_completion(
             model=model_to_use,
             temperature=DEFAULT_TEMPERATURE,
             max_tokens=DEFAULT_MAX_TOKENS,
@@ -52,6 +49,7 @@ def analyze_scan_results(scan_result: Dict[str, Any]) -> Dict[str, Any]:
         )
   
         ai_analysis = response.choices[0].message.content
+        remember_analyzed(scan_result['vulnerabilities'])
         print('AI Response:',{
             "ai_analysis": ai_analysis,
             "model_used": model_to_use
@@ -61,23 +59,71 @@ def analyze_scan_results(scan_result: Dict[str, Any]) -> Dict[str, Any]:
             "model_used": model_to_use
         }
 
+    except CircuitOpenError as e:
+        logger.warning("AI upstream unavailable, using local analysis: %s", e)
+        return {**summarize_locally(scan_result), "fallback": True}
+
     except Exception as e:
-        print(f"[DEBUG] Fatal error in analyze_scan_results: {str(e)}")
+        logger.warning("AI analysis failed, using local analysis: %s", e)
         return {
-            "ai_analysis": f"Error performing AI analysis: {str(e)}",
-            "error": True
+            **summarize_locally(scan_result),
+            "fallback": True,
+            "error": f"Error performing AI analysis: {str(e)}"
         }
 
+def stream_scan_analysis(scan_result: Dict[str, Any]) -> Iterator[str]:
+    """
+    Stream the AI analysis of a scan result token by token.
+
+    The upstream completion is closed as soon as the consumer stops iterating
+    (e.g. the HTTP client disconnected), so abandoned generations stop billing.
+    """
+    stream = get_ai_client().stream_chat_completion(
+        model=DEFAULT_MODEL,
+        temperature=DEFAULT_TEMPERATURE,
+        max_tokens=DEFAULT_MAX_TOKENS,
+        messages=[
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": build_scan_prompt(scan_result)}
+        ]
+    )
+    try:
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            token = chunk.choices[0].delta.content
+            if token:
+                yield token
+        remember_analyzed(scan_result['vulnerabilities'])
+    finally:
+        stream.close()
+
+def build_scan_prompt(scan_result: Dict[str, Any]) -> str:
+    """
+    Build the user prompt describing a single file's scan result
+    """
+    return f"""
+        File: {scan_result['filename']}
+        Language: {scan_result['language']}
+        Vulnerabilities Found: {len(scan_result['vulnerabilities'])}
+        
+        Detailed Findings:
+        {format_vulnerabilities(scan_result['vulnerabilities'])}
+        """
+
 def format_vulnerabilities(vulnerabilities: list) -> str:
     """
-    Format vulnerabilities list for better AI processing
+    Format vulnerabilities list for better AI processing.
+    Findings are aggregated by rule, most severe first, with occurrence and file counts
+    instead of being repeated; the prompt lists at most 25 rules
     """
-    formatted = []
+    rules = {}
+    aggregate = FindingAggregator()
     for v in vulnerabilities:
-        formatted.append(f"""
-        Severity: {v['severity'].upper()}
-        Finding: {v['title']}
-        Description: {v['description']}
-        Recommendation: {v['recommendation']}
-        """)
-    return "\n".join(formatted)
+        key = (v['severity'].upper(), v['title'], v['description'], v['recommendation'])
+        rule = rules.get(key)
+        if rule is None:
+            # Client-supplied text: one-off rules keep the interned rule table bounded
+            rule = rules[key] = one_off_rule(*key)
+        aggregate.add(Finding(rule, line=v.get('line'), file=v.get('file')))
+    return aggregate.to_prompt_text()
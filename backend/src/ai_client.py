@@ -0,0 +1,275 @@
+"""
+Resilient OpenAI client wrapper for Nuvai.
+
+Wraps the OpenAI SDK with:
+- A shared, pooled keep-alive HTTP client (one per worker process)
+- Per-call deadlines covering all retry attempts
+- Jittered exponential backoff for retryable errors (timeouts, connection
+  errors, rate limits, 5xx)
+- A circuit breaker that fails fast while the upstream is unhealthy, so
+  callers can fall back to the local analysis immediately
+- A health snapshot for monitoring endpoints
+
+Configuration (environment):
+- OPENAI_API_KEY / OPENAI_BASE_URL: credentials and endpoint (a local fake server works)
+- AI_TIMEOUT_SECONDS: overall per-call deadline (default: 30)
+- AI_CONNECT_TIMEOUT_SECONDS: TCP/TLS connect timeout (default: 5)
+- AI_MAX_RETRIES: retries after the first attempt (default: 2)
+- AI_POOL_SIZE: keep-alive connections kept per worker (default: 10)
+- AI_BREAKER_FAILURES: consecutive failures that open the circuit (default: 5)
+- AI_BREAKER_RESET_SECONDS: time before a half-open probe is allowed (default: 30)
+"""
+
+import os
+import random
+import threading
+import time
+from typing import Any, Dict, Iterator, Optional
+
+from backend.src.metrics import AI_CALL_LATENCY, AI_CALLS_REJECTED
+
+
+def retryable_errors() -> tuple:
+    # The SDK is imported with the first client rather than with this module: it is
+    # the slowest import of the API and most processes never call the AI upstream
+    import openai
+
+    return (
+        openai.APIConnectionError,  # includes APITimeoutError
+        openai.RateLimitError,
+        openai.InternalServerError,
+    )
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when the circuit breaker rejects a call without contacting the upstream."""
+
+
+class CircuitBreaker:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                return self.HALF_OPEN
+            return self._state
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN and time.monotonic() - self._opened_at < self.reset_timeout:
+                return False
+            # Half-open: let exactly one probe through
+            if self._probe_in_flight:
+                return False
+            self._state = self.HALF_OPEN
+            self._probe_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._probe_in_flight = False
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+
+    def snapshot(self) -> Dict[str, Any]:
+        state = self.state
+        with self._lock:
+            return {
+                "state": state,
+                "consecutive_failures": self._failures,
+                "retry_in_seconds": (
+                    max(0.0, round(self.reset_timeout - (time.monotonic() - self._opened_at), 2))
+                    if state == self.OPEN else 0.0
+                ),
+            }
+
+
+class ResilientAIClient:
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        timeout: float = 30.0,
+        connect_timeout: float = 5.0,
+        max_retries: int = 2,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+        pool_size: int = 10,
+        breaker: Optional[CircuitBreaker] = None,
+    ):
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.breaker = breaker or CircuitBreaker()
+
+        import httpx
+        import openai
+
+        self._httpx = httpx
+        self._openai = openai
+        self._retryable = retryable_errors()
+        self._http_client = httpx.Client(
+            timeout=httpx.Timeout(timeout, connect=connect_timeout),
+            limits=httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=pool_size,
+                keepalive_expiry=60.0,
+            ),
+        )
+        # Retries are handled here so they share one deadline and the breaker
+        self._client = openai.OpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            max_retries=0,
+            http_client=self._http_client,
+        )
+
+        self._stats_lock = threading.Lock()
+        self._calls = 0
+        self._failures = 0
+        self._rejected = 0
+        self._last_error: Optional[str] = None
+        self._last_latency_ms: Optional[float] = None
+
+    def _backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def _record(self, started: float, error: Optional[Exception] = None, count_call: bool = True) -> None:
+        with self._stats_lock:
+            if count_call:
+                elapsed = time.monotonic() - started
+                self._calls += 1
+                self._last_latency_ms = round(elapsed * 1000, 2)
+                AI_CALL_LATENCY.labels("error" if error is not None else "success").observe(elapsed)
+            if error is not None:
+                self._failures += 1
+                self._last_error = f"{type(error).__name__}: {error}"
+        # Client-side errors (4xx other than 429) say nothing about upstream health
+        if error is None or (isinstance(error, self._openai.APIStatusError) and not isinstance(error, self._retryable)):
+            self.breaker.record_success()
+        else:
+            self.breaker.record_failure()
+
+    def _call(self, request, deadline: Optional[float]):
+        """Run request(timeout) with retries until it succeeds or the deadline passes."""
+        if not self.breaker.allow_request():
+            with self._stats_lock:
+                self._rejected += 1
+            AI_CALLS_REJECTED.inc()
+            raise CircuitOpenError("AI upstream circuit is open; failing fast.")
+
+        started = time.monotonic()
+        expires = started + (deadline or self.timeout)
+        attempt = 0
+        while True:
+            remaining = expires - time.monotonic()
+            try:
+                if remaining <= 0:
+                    raise self._openai.APITimeoutError(
+                        request=self._httpx.Request("POST", str(self._client.base_url))
+                    )
+                result = request(remaining)
+                self._record(started)
+                return result
+            except self._retryable as e:
+                delay = self._backoff(attempt)
+                if attempt >= self.max_retries or time.monotonic() + delay >= expires:
+                    self._record(started, e)
+                    raise
+                attempt += 1
+                time.sleep(delay)
+            except Exception as e:
+                self._record(started, e)
+                raise
+
+    def create_chat_completion(self, deadline: Optional[float] = None, **kwargs):
+        """Non-streaming chat completion bounded by `deadline` seconds (all attempts)."""
+        return self._call(
+            lambda remaining: self._client.chat.completions.create(timeout=remaining, **kwargs),
+            deadline,
+        )
+
+    def stream_chat_completion(self, deadline: Optional[float] = None, **kwargs) -> Iterator[Any]:
+        """
+        Streaming chat completion. Retries only cover opening the stream; the
+        deadline then bounds each read. Closing the returned iterator closes
+        the upstream response.
+        """
+        stream = self._call(
+            lambda remaining: self._client.chat.completions.create(stream=True, timeout=remaining, **kwargs),
+            deadline,
+        )
+        return self._consume(stream)
+
+    def _consume(self, stream) -> Iterator[Any]:
+        started = time.monotonic()
+        try:
+            for chunk in stream:
+                yield chunk
+        except Exception as e:
+            self._record(started, e, count_call=False)
+            raise
+        finally:
+            stream.close()
+
+    def health(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            stats = {
+                "calls": self._calls,
+                "failures": self._failures,
+                "rejected": self._rejected,
+                "last_error": self._last_error,
+                "last_latency_ms": self._last_latency_ms,
+            }
+        return {"circuit": self.breaker.snapshot(), **stats}
+
+    def close(self) -> None:
+        self._http_client.close()
+
+
+_client: Optional[ResilientAIClient] = None
+_client_lock = threading.Lock()
+
+
+def get_ai_client() -> ResilientAIClient:
+    """Return the worker-wide AI client, creating it on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = ResilientAIClient(
+                    api_key=os.getenv("OPENAI_API_KEY"),
+                    base_url=os.getenv("OPENAI_BASE_URL") or None,
+                    timeout=float(os.getenv("AI_TIMEOUT_SECONDS", 30)),
+                    connect_timeout=float(os.getenv("AI_CONNECT_TIMEOUT_SECONDS", 5)),
+                    max_retries=int(os.getenv("AI_MAX_RETRIES", 2)),
+                    pool_size=int(os.getenv("AI_POOL_SIZE", 10)),
+                    breaker=CircuitBreaker(
+                        failure_threshold=int(os.getenv("AI_BREAKER_FAILURES", 5)),
+                        reset_timeout=float(os.getenv("AI_BREAKER_RESET_SECONDS", 30)),
+                    ),
+                )
+    return _client
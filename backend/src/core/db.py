@@ -5,6 +5,7 @@ Follows ISO/IEC 27001, NIST, and OWASP security guidelines.
 
 import os
 import logging
+import threading
 from pathlib import Path
 from dotenv import load_dotenv
 from sqlalchemy import create_engine
@@ -29,31 +30,60 @@ logger.debug(f"DATABASE_URL: {os.getenv('DATABASE_URL')}")
 # === Base ORM Class ===
 Base = declarative_base()
 
-# === Load DATABASE_URL from environment ===
-DATABASE_URL = os.getenv("DATABASE_URL")
-
-if not DATABASE_URL:
-    logger.critical("❌ DATABASE_URL is not set. Please check your .env file.")
-    raise EnvironmentError("DATABASE_URL environment variable missing.")
-
-# === SQLAlchemy Engine Configuration ===
-try:
-    engine = create_engine(
-        DATABASE_URL,
-        pool_pre_ping=True,
-        pool_recycle=1800,
-        connect_args={"connect_timeout": 10},
-        future=True,  # Enables SQLAlchemy 2.0-style usage
-    )
-    logger.info("✅ SQLAlchemy engine initialized.")
-except Exception as e:
-    logger.exception("❌ Engine creation failed.")
-    raise e
+# === SQLAlchemy Engine (created on first use) ===
+# Importing models or the API does not build the engine (or import the DB driver);
+# a missing DATABASE_URL is reported when the database is first needed.
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_engine():
+    """Return the process-wide SQLAlchemy engine, creating it on first use."""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                database_url = os.getenv("DATABASE_URL")
+                if not database_url:
+                    logger.critical("❌ DATABASE_URL is not set. Please check your .env file.")
+                    raise EnvironmentError("DATABASE_URL environment variable missing.")
+
+                # sqlite3 (local development, load tests) takes `timeout` instead of `connect_timeout`
+                connect_args = {"timeout": 10} if database_url.startswith("sqlite") else {"connect_timeout": 10}
+                try:
+                    _engine = create_engine(
+                        database_url,
+                        pool_pre_ping=True,
+                        pool_recycle=1800,
+                        connect_args=connect_args,
+                        future=True,  # Enables SQLAlchemy 2.0-style usage
+                    )
+                    logger.info("✅ SQLAlchemy engine initialized.")
+                except Exception as e:
+                    logger.exception("❌ Engine creation failed.")
+                    raise e
+    return _engine
+
+
+def dispose_engine_after_fork():
+    """
+    Forget pooled connections inherited from a parent process (e.g. a preloading
+    gunicorn master) without closing them, so the parent's connections stay usable.
+    """
+    if _engine is not None:
+        _engine.dispose(close=False)
+
 
 # === Session Factory ===
-SessionLocal = scoped_session(
-    sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
-)
+_session_factory = sessionmaker(autocommit=False, autoflush=False, future=True)
+
+
+def _create_session(**kwargs):
+    # Bound here rather than in sessionmaker() so the engine is only built with the first session
+    return _session_factory(bind=get_engine(), **kwargs)
+
+
+SessionLocal = scoped_session(_create_session)
 
 # === Dependency: Used in routes (via FastAPI or Flask) ===
 def get_db():
@@ -73,7 +103,7 @@ def get_db():
 # === Create Tables (Manual call or for dev/testing) ===
 def init_db():
     try:
-        Base.metadata.create_all(bind=engine)
+        Base.metadata.create_all(bind=get_engine())
         logger.info("📦 Database schema created.")
     except Exception as e:
         logger.exception("❌ Failed to create database schema.")
@@ -0,0 +1,134 @@
+"""
+Deterministic, template-driven analysis of scan results for Nuvai.
+
+Produces the same summary / risk assessment / prioritized recommendations
+structure as the AI analysis, built purely from the rule metadata attached
+to each finding. The remote model is only consulted when the scan crosses
+the configured severity or novelty thresholds (see `requires_model_analysis`).
+
+Configuration (environment):
+- AI_MODEL_MIN_SEVERITY: lowest severity that warrants a model call (default: high)
+- AI_NOVELTY_THRESHOLD: number of finding types not yet analysed by the model
+  in this worker that warrants a model call (default: 0, disabled)
+"""
+
+import os
+from collections import Counter, OrderedDict
+from typing import Dict, Any, List
+
+from backend.src.metrics import record_cache_lookup
+
+LOCAL_MODEL_NAME = "nuvai-local"
+
+SEVERITY_RANK = {
+    "critical": 5,
+    "high": 4,
+    "error": 4,
+    "medium": 3,
+    "warning": 2,
+    "low": 1,
+    "info": 0,
+    "tip": 0,
+}
+
+RISK_RATINGS = ["None", "Low", "Medium", "Medium", "High", "Critical"]
+
+AI_MODEL_MIN_SEVERITY = os.getenv("AI_MODEL_MIN_SEVERITY", "high").lower()
+AI_NOVELTY_THRESHOLD = int(os.getenv("AI_NOVELTY_THRESHOLD", 0))
+MAX_KNOWN_TITLES = 1024
+
+# Finding types already analysed by the remote model in this worker
+_known_titles = OrderedDict()
+
+
+def severity_rank(severity: str) -> int:
+    return SEVERITY_RANK.get((severity or "info").lower(), 0)
+
+
+def count_novel_findings(vulnerabilities: List[Dict[str, Any]]) -> int:
+    """Count distinct finding types the model has not analysed yet."""
+    titles = {v.get("title") for v in vulnerabilities}
+    novel = len(titles - _known_titles.keys())
+    record_cache_lookup("ai_known_titles", hit=True, count=len(titles) - novel)
+    record_cache_lookup("ai_known_titles", hit=False, count=novel)
+    return novel
+
+
+def remember_analyzed(vulnerabilities: List[Dict[str, Any]]) -> None:
+    """Record finding types the model has analysed (bounded, LRU)."""
+    for v in vulnerabilities:
+        title = v.get("title")
+        _known_titles[title] = True
+        _known_titles.move_to_end(title)
+    while len(_known_titles) > MAX_KNOWN_TITLES:
+        _known_titles.popitem(last=False)
+
+
+def requires_model_analysis(scan_result: Dict[str, Any]) -> bool:
+    """
+    Decide whether the remote model adds value over the local summary.
+    """
+    vulnerabilities = scan_result.get("vulnerabilities") or []
+    if not vulnerabilities:
+        return False
+
+    min_rank = SEVERITY_RANK.get(AI_MODEL_MIN_SEVERITY, SEVERITY_RANK["high"])
+    if any(severity_rank(v.get("severity")) >= min_rank for v in vulnerabilities):
+        return True
+
+    if AI_NOVELTY_THRESHOLD and count_novel_findings(vulnerabilities) >= AI_NOVELTY_THRESHOLD:
+        return True
+
+    return False
+
+
+def summarize_locally(scan_result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build a summary, risk rating and prioritized recommendations without any model call.
+    """
+    vulnerabilities = scan_result.get("vulnerabilities") or []
+    actionable = [v for v in vulnerabilities if severity_rank(v.get("severity")) > 0]
+
+    severities = Counter((v.get("severity") or "info").lower() for v in vulnerabilities)
+    top_rank = max((severity_rank(v.get("severity")) for v in vulnerabilities), default=0)
+    risk_rating = RISK_RATINGS[top_rank]
+
+    # Deduplicate recommendations, most severe and most frequent first
+    grouped = {}
+    for v in actionable:
+        key = v.get("recommendation", "")
+        rank, count, title = grouped.get(key, (0, 0, v.get("title", "")))
+        grouped[key] = (max(rank, severity_rank(v.get("severity"))), count + 1, title)
+    recommendations = [
+        f"[{RISK_RATINGS[rank].upper()}] {title}: {recommendation}"
+        for recommendation, (rank, count, title) in sorted(
+            grouped.items(), key=lambda item: (-item[1][0], -item[1][1], item[1][2])
+        )
+    ]
+
+    breakdown = ", ".join(
+        f"{count} {severity.upper()}" for severity, count in
+        sorted(severities.items(), key=lambda item: -SEVERITY_RANK.get(item[0], 0))
+    )
+    summary = (
+        f"{len(actionable)} actionable finding(s) in {scan_result.get('filename', 'the file')}"
+        f" ({scan_result.get('language', 'unknown')}). Breakdown: {breakdown or 'none'}."
+    )
+
+    lines = [
+        "1. Summary",
+        summary,
+        "",
+        "2. Risk Assessment",
+        f"Overall risk: {risk_rating}.",
+        "",
+        "3. Prioritized Recommendations",
+    ]
+    lines += [f"- {r}" for r in recommendations] or ["- Continue following secure coding practices."]
+
+    return {
+        "ai_analysis": "\n".join(lines),
+        "model_used": LOCAL_MODEL_NAME,
+        "risk_rating": risk_rating,
+        "recommendations": recommendations,
+    }
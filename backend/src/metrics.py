@@ -0,0 +1,124 @@
+"""
+Prometheus metrics for the Nuvai API.
+
+Exposes request, scan, cache, log-queue and AI client metrics for the /metrics
+endpoint. Recording a sample is a dictionary lookup plus an atomic add, so
+instrumentation stays on the hot path.
+
+Multi-process (gunicorn) mode:
+- Set PROMETHEUS_MULTIPROC_DIR to an empty, writable directory before the
+  app is imported (backend/gunicorn.conf.py does this). Every worker writes
+  its samples to memory-mapped files there and /metrics aggregates all of
+  them, whichever worker serves the scrape.
+
+prometheus_client is optional: without it every metric is a no-op and
+/metrics answers 503.
+
+Configuration (environment):
+- PROMETHEUS_MULTIPROC_DIR: shared sample directory for multi-process mode
+- METRICS_TOKEN: if set, /metrics requires "Authorization: Bearer <token>"
+"""
+
+import os
+
+try:
+    from prometheus_client import (
+        CONTENT_TYPE_LATEST,
+        REGISTRY,
+        CollectorRegistry,
+        Counter,
+        Gauge,
+        Histogram,
+        generate_latest,
+        multiprocess,
+    )
+    METRICS_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    METRICS_AVAILABLE = False
+    CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class _NoopMetric:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def labels(self, *args, **kwargs):
+        return self
+
+    def inc(self, amount=1):
+        pass
+
+    def dec(self, amount=1):
+        pass
+
+    def set(self, value):
+        pass
+
+    def observe(self, amount):
+        pass
+
+
+if not METRICS_AVAILABLE:
+    Counter = Gauge = Histogram = _NoopMetric
+
+# Seconds; scans of large uploads and AI calls need the long tail
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+SIZE_BUCKETS = (1_000, 10_000, 100_000, 1_000_000, 10_000_000, 100_000_000)
+
+REQUESTS = Counter(
+    "nuvai_http_requests_total", "HTTP requests handled", ["route", "method", "status"]
+)
+REQUEST_LATENCY = Histogram(
+    "nuvai_http_request_duration_seconds", "HTTP request latency", ["route", "method"],
+    buckets=LATENCY_BUCKETS,
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    "nuvai_http_requests_in_flight", "Requests currently being handled", multiprocess_mode="livesum"
+)
+
+SCAN_DURATION = Histogram(
+    "nuvai_scan_duration_seconds", "Time spent in scan_code per file", ["language"],
+    buckets=LATENCY_BUCKETS,
+)
+SCAN_BYTES = Counter("nuvai_scan_bytes_total", "Source bytes scanned", ["language"])
+SCAN_FILE_SIZE = Histogram(
+    "nuvai_scan_file_size_bytes", "Size of scanned files", ["language"], buckets=SIZE_BUCKETS
+)
+FINDINGS = Counter("nuvai_findings_total", "Findings reported", ["language", "severity"])
+
+CACHE_LOOKUPS = Counter("nuvai_cache_lookups_total", "Cache lookups by outcome", ["cache", "result"])
+
+# Log records only: scans and AI calls run inline in the request, so their backlog shows
+# up as nuvai_http_requests_in_flight rather than in a queue of their own
+LOG_QUEUE_DEPTH = Gauge(
+    "nuvai_log_queue_depth", "Log records waiting for the log listener thread", multiprocess_mode="livesum"
+)
+
+AI_CALL_LATENCY = Histogram(
+    "nuvai_ai_call_duration_seconds", "AI upstream call latency, all retries included", ["outcome"],
+    buckets=LATENCY_BUCKETS,
+)
+AI_CALLS_REJECTED = Counter("nuvai_ai_calls_rejected_total", "AI calls rejected by the open circuit")
+
+
+def record_cache_lookup(cache: str, hit: bool, count: int = 1) -> None:
+    if count:
+        CACHE_LOOKUPS.labels(cache, "hit" if hit else "miss").inc(count)
+
+
+def render_metrics():
+    """Return (body, content_type) for a scrape, aggregated across workers when configured."""
+    if not METRICS_AVAILABLE:
+        return None, CONTENT_TYPE_LATEST
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_worker_dead(pid: int) -> None:
+    """gunicorn child_exit hook: drop the live gauges of a finished worker."""
+    if METRICS_AVAILABLE and os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(pid)
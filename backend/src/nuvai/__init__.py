@@ -1,28 +1,81 @@
-from .nuvai import get_language, scan_code
-
 """
 This file is auto-generated by update_init.py
 Do not edit manually.
+
+Modules are imported on first attribute access (PEP 562), so importing the
+package does not load every scanner.
 """
 
-from .scanner import *
-from .javascript_scanner import *
-from .typescript_scanner import *
-from .php_scanner import *
-from .python_scanner import *
-from .report_saver import *
-from .html_scanner import *
-from .cpp_scanner import *
-from .jsx_scanner import *
+import importlib
+
+_EXPORTS = {
+    "CONTENT_SIGNATURES": "scanner",
+    "CppScanner": "cpp_scanner",
+    "Finding": "finding",
+    "FindingAggregator": "aggregate",
+    "GUIDANCE_RULE": "scanner",
+    "HTMLScanner": "html_scanner",
+    "JSXScanner": "jsx_scanner",
+    "JavaScriptScanner": "javascript_scanner",
+    "MISSING_INPUT_RULE": "scanner",
+    "NO_ISSUES_RULE": "scanner",
+    "NO_LOCATION": "aggregate",
+    "PHPScanner": "php_scanner",
+    "PythonScanner": "python_scanner",
+    "Rule": "finding",
+    "RuleOccurrences": "aggregate",
+    "RuleProfile": "profiler",
+    "RuleStats": "profiler",
+    "SCANNER_ERROR_RULE": "scanner",
+    "SCHEMAS": "finding",
+    "SUPPORTED_LANGUAGES": "scanner",
+    "Severity": "finding",
+    "TypeScriptScanner": "typescript_scanner",
+    "as_dict": "finding",
+    "disable_profiling": "profiler",
+    "enable_profiling": "profiler",
+    "ensure_report_directory": "report_saver",
+    "generate_filename": "report_saver",
+    "get_active_profile": "profiler",
+    "get_language": "scanner",
+    "get_languge": "nuvai",
+    "intern_rule": "finding",
+    "logger": "scanner",
+    "one_off_rule": "finding",
+    "profiling": "profiler",
+    "save_report": "report_saver",
+    "scan_code": "scanner",
+    "scan_python": "scan_code",
+}
 
 __all__ = [
-    "scanner",
+    "aggregate",
+    "cpp_scanner",
+    "finding",
+    "html_scanner",
     "javascript_scanner",
-    "typescript_scanner",
+    "jsx_scanner",
+    "nuvai",
     "php_scanner",
+    "profiler",
     "python_scanner",
     "report_saver",
-    "html_scanner",
-    "cpp_scanner",
-    "jsx_scanner"
-]
\ No newline at end of file
+    "scan_code",
+    "scanner",
+    "typescript_scanner"
+]
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is not None:
+        value = getattr(importlib.import_module(f".{module}", __name__), name)
+        globals()[name] = value
+        return value
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS) | set(__all__))
@@ -0,0 +1,165 @@
+"""
+File: finding.py
+
+Description:
+Compact in-memory representation of scan findings for the Nuvai engine.
+
+A scan can produce millions of findings, but only a few hundred distinct rules. Each
+Finding therefore only stores its location (offsets, line, file, language) in __slots__
+and references a shared, interned Rule that holds the severity and the message and
+recommendation text.
+
+Features:
+- Severity enum with a meaningful ordering (TIP < INFO < ... < CRITICAL)
+- Rule objects interned by (level, type, message, recommendation); per-input error
+  text gets a one-off Rule instead, so the table stays bounded
+- One canonical serializer (Finding.to_dict) for report and API key schemas, with
+  opt-in rule id and location keys
+- Read-only mapping access (finding["level"], finding.get("file")) for existing dict consumers
+"""
+
+import re
+from enum import IntEnum
+from typing import Dict, Optional
+
+
+class Severity(IntEnum):
+    TIP = 0
+    INFO = 1
+    LOW = 2
+    WARNING = 3
+    MEDIUM = 4
+    HIGH = 5
+    ERROR = 6
+    CRITICAL = 7
+
+    @classmethod
+    def parse(cls, level: str) -> "Severity":
+        return cls.__members__.get(str(level).upper(), cls.INFO)
+
+
+class Rule:
+    __slots__ = ("id", "severity", "type", "message", "recommendation")
+
+    def __init__(self, rule_id: str, severity: Severity, ftype: str, message: str, recommendation: str):
+        self.id = rule_id
+        self.severity = severity
+        self.type = ftype
+        self.message = message
+        self.recommendation = recommendation
+
+    def __repr__(self):
+        return f"<Rule {self.id} [{self.severity.name}]>"
+
+
+_RULES: Dict[tuple, Rule] = {}
+_RULE_IDS = set()
+
+
+def _slug(ftype: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", ftype.lower()).strip("-") or "finding"
+
+
+def intern_rule(level: str, ftype: str, message: str, recommendation: str) -> Rule:
+    """
+    Return the shared Rule for this metadata, creating it on first use. The table is
+    never evicted, so only rules with static text belong here; see one_off_rule().
+    """
+    key = (level, ftype, message, recommendation)
+    rule = _RULES.get(key)
+    if rule is None:
+        base_id = _slug(ftype)
+        rule_id, n = base_id, 2
+        while rule_id in _RULE_IDS:
+            rule_id, n = f"{base_id}-{n}", n + 1
+        _RULE_IDS.add(rule_id)
+        rule = _RULES[key] = Rule(rule_id, Severity.parse(level), ftype, message, recommendation)
+    return rule
+
+
+def one_off_rule(level: str, ftype: str, message: str, recommendation: str) -> Rule:
+    """Unshared Rule for text built from the input (error details, language names)."""
+    return Rule(_slug(ftype), Severity.parse(level), ftype, message, recommendation)
+
+
+# Output key names per serialization schema
+SCHEMAS = {
+    # Scanner / report schema used by run.py and report_saver
+    "report": ("level", "type", "message", "recommendation"),
+    # API schema returned by the Flask /scan endpoint
+    "api": ("severity", "title", "description", "recommendation"),
+}
+
+
+class Finding:
+    __slots__ = ("rule", "start", "end", "line", "file", "language")
+
+    def __init__(self, rule: Rule, start: Optional[int] = None, end: Optional[int] = None,
+                 line: Optional[int] = None, file: Optional[str] = None, language: Optional[str] = None):
+        self.rule = rule
+        self.start = start
+        self.end = end
+        self.line = line
+        self.file = file
+        self.language = language
+
+    @property
+    def severity(self) -> Severity:
+        return self.rule.severity
+
+    def to_dict(self, schema: str = "report", locations: bool = False) -> Dict:
+        """
+        Canonical serializer. The rule id and location keys (file, language, line, start,
+        end) are opt-in: they roughly double the size of large reports.
+        """
+        level_key, type_key, message_key, recommendation_key = SCHEMAS[schema]
+        rule = self.rule
+        data = {
+            level_key: rule.severity.name.lower() if schema == "api" else rule.severity.name,
+            type_key: rule.type,
+            message_key: rule.message,
+            recommendation_key: rule.recommendation,
+        }
+        if not locations:
+            return data
+        data["rule_id"] = rule.id
+        if self.file is not None:
+            data["file"] = self.file
+        if self.language is not None:
+            data["language"] = self.language
+        if self.line is not None:
+            data["line"] = self.line
+            data["start"] = self.start
+            data["end"] = self.end
+        return data
+
+    # Read-only mapping access for code written against the former dict findings
+    def __getitem__(self, key: str):
+        if key == "level":
+            return self.rule.severity.name
+        if key == "type":
+            return self.rule.type
+        if key == "message":
+            return self.rule.message
+        if key == "recommendation":
+            return self.rule.recommendation
+        if key == "rule_id":
+            return self.rule.id
+        if key in Finding.__slots__:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def get(self, key: str, default=None):
+        try:
+            value = self[key]
+        except KeyError:
+            return default
+        return default if value is None else value
+
+    def __repr__(self):
+        return f"<Finding {self.rule.id} line={self.line} file={self.file}>"
+
+
+def as_dict(finding, schema: str = "report", locations: bool = False) -> Dict:
+    """Serialize a Finding, passing plain dict findings (e.g. controller errors) through."""
+    return finding.to_dict(schema, locations) if isinstance(finding, Finding) else finding
@@ -23,11 +23,13 @@ Note: Regex-based detection. Future updates may incorporate AST-based analysis.
 """
 
 import re
+from .finding import Finding, intern_rule
 
 class JavaScriptScanner:
     def __init__(self, code):
         self.code = code
         self.findings = []
+        self._match = None
 
     def run_all_checks(self):
         self.check_dangerous_eval()
@@ -42,50 +44,57 @@ class JavaScriptScanner:
         self.check_unvalidated_user_content()
         return self.findings
 
+    def search(self, pattern, flags=0):
+        match = re.search(pattern, self.code, flags)
+        if match:
+            self._match = match
+        return match
+
     def add_finding(self, level, ftype, message, recommendation):
-        self.findings.append({
-            "level": level,
-            "type": ftype,
-            "message": message,
-            "recommendation": recommendation
-        })
+        # Locate the finding at the last successful search() of the current check
+        match, self._match = self._match, None
+        finding = Finding(intern_rule(level, ftype, message, recommendation))
+        if match:
+            finding.start, finding.end = match.span()
+            finding.line = self.code.count("\n", 0, finding.start) + 1
+        self.findings.append(finding)
 
     def check_dangerous_eval(self):
-        if re.search(r'\b(eval|Function|setTimeout|setInterval)\s*\(', self.code):
+        if self.search(r'\b(eval|Function|setTimeout|setInterval)\s*\('):
             self.add_finding("CRITICAL", "Dynamic Code Execution", "Use of eval or similar constructs detected.", "Avoid dynamic code execution. Use strict logic paths.")
 
     def check_dom_xss(self):
-        if re.search(r'(innerHTML|outerHTML|document\.write)', self.code):
+        if self.search(r'(innerHTML|outerHTML|document\.write)'):
             self.add_finding("HIGH", "DOM-based XSS", "Direct DOM manipulation using unsanitized data.", "Avoid setting HTML using user input. Sanitize all dynamic content.")
 
     def check_insecure_storage(self):
-        if re.search(r'(localStorage|sessionStorage|document\.cookie)', self.code):
+        if self.search(r'(localStorage|sessionStorage|document\.cookie)'):
             self.add_finding("WARNING", "Insecure Storage Usage", "Sensitive data accessed from browser storage.", "Avoid using local/session storage or cookies for secrets.")
 
     def check_hardcoded_secrets(self):
-        if re.search(r'(api|token|secret|key|password)\s*[:=]\s*["\']\w{8,}["\']', self.code, re.IGNORECASE):
+        if self.search(r'(api|token|secret|key|password)\s*[:=]\s*["\']\w{8,}["\']', re.IGNORECASE):
             self.add_finding("HIGH", "Hardcoded Secret", "Sensitive key or token found in source code.", "Store secrets in secure backend or config files.")
 
     def check_debug_statements(self):
-        if re.search(r'(console\.log|debugger)', self.code):
+        if self.search(r'(console\.log|debugger)'):
             self.add_finding("INFO", "Debug Statement Detected", "Debugging code found.", "Remove console.log or debugger statements before deployment.")
 
     def check_insecure_http(self):
-        if re.search(r'fetch\("http:|axios\.get\("http:', self.code):
+        if self.search(r'fetch\("http:|axios\.get\("http:'):
             self.add_finding("HIGH", "Insecure HTTP Request", "HTTP connection used instead of HTTPS.", "Use secure HTTPS URLs for all network requests.")
 
     def check_unsanitized_url_params(self):
-        if re.search(r'location\.search|URLSearchParams', self.code) and not re.search(r'sanitize|encode', self.code):
+        if self.search(r'location\.search|URLSearchParams') and not self.search(r'sanitize|encode'):
             self.add_finding("HIGH", "Unsanitized URL Parameter", "Use of URL parameters without validation.", "Validate or sanitize user input from URLs.")
 
     def check_xmlhttp_request(self):
-        if re.search(r'new\s+XMLHttpRequest\(\)', self.code):
+        if self.search(r'new\s+XMLHttpRequest\(\)'):
             self.add_finding("WARNING", "Unrestricted XMLHttpRequest", "Raw XHR usage found.", "Use fetch() with proper CORS and security headers.")
 
     def check_unprotected_navigation(self):
-        if re.search(r'(location\.href|window\.name)\s*=\s*', self.code):
+        if self.search(r'(location\.href|window\.name)\s*=\s*'):
             self.add_finding("MEDIUM", "Uncontrolled Redirect", "URL redirection logic found.", "Avoid assigning user input to location.href or window.name.")
 
     def check_unvalidated_user_content(self):
-        if re.search(r'(userInput|userData|data)\s*[:=]', self.code) and re.search(r'(innerHTML|document\.write)', self.code):
+        if self.search(r'(userInput|userData|data)\s*[:=]') and self.search(r'(innerHTML|document\.write)'):
             self.add_finding("HIGH", "Unvalidated User Content", "Untrusted data written directly to DOM.", "Escape or sanitize all user-generated content.")
@@ -23,11 +23,13 @@ Note: Regex-based JSX inspection. Parsing-based React support planned for future
 """
 
 import re
+from .finding import Finding, intern_rule
 
 class JSXScanner:
     def __init__(self, code):
         self.code = code
         self.findings = []
+        self._match = None
 
     def run_all_checks(self):
         self.check_dangerously_set_inner_html()
@@ -43,54 +45,61 @@ class JSXScanner:
         self.check_user_input_reflection()
         return self.findings
 
+    def search(self, pattern, flags=0):
+        match = re.search(pattern, self.code, flags)
+        if match:
+            self._match = match
+        return match
+
     def add_finding(self, level, ftype, message, recommendation):
-        self.findings.append({
-            "level": level,
-            "type": ftype,
-            "message": message,
-            "recommendation": recommendation
-        })
+        # Locate the finding at the last successful search() of the current check
+        match, self._match = self._match, None
+        finding = Finding(intern_rule(level, ftype, message, recommendation))
+        if match:
+            finding.start, finding.end = match.span()
+            finding.line = self.code.count("\n", 0, finding.start) + 1
+        self.findings.append(finding)
 
     def check_dangerously_set_inner_html(self):
-        if re.search(r'dangerouslySetInnerHTML\s*=\s*\{', self.code):
+        if self.search(r'dangerouslySetInnerHTML\s*=\s*\{'):
             self.add_finding("CRITICAL", "dangerouslySetInnerHTML", "Use of dangerouslySetInnerHTML detected.", "Avoid direct HTML injection. Sanitize inputs and use libraries like DOMPurify.")
 
     def check_unescaped_props(self):
-        if re.search(r'\{\s*(props|this\.props|state|this\.state)\.[a-zA-Z0-9_]+\s*\}', self.code):
+        if self.search(r'\{\s*(props|this\.props|state|this\.state)\.[a-zA-Z0-9_]+\s*\}'):
             self.add_finding("HIGH", "Unescaped Prop Rendering", "Unescaped prop/state rendered directly.", "Ensure user input is sanitized before rendering.")
 
     def check_inline_event_handlers(self):
-        if re.search(r'on\w+\s*=\s*\{\s*\(.*\)\s*=>', self.code):
+        if self.search(r'on\w+\s*=\s*\{\s*\(.*\)\s*=>'):
             self.add_finding("MEDIUM", "Inline Event Handler", "Arrow function used directly in JSX event handler.", "Extract event logic into named functions outside JSX.")
 
     def check_debug_statements(self):
-        if re.search(r'console\.log|debugger', self.code):
+        if self.search(r'console\.log|debugger'):
             self.add_finding("INFO", "Debug Code Present", "console.log or debugger found.", "Remove debug statements before production.")
 
     def check_hardcoded_tokens(self):
-        if re.search(r'(token|apiKey|secret)\s*[:=]\s*["\']\w{8,}["\']', self.code):
+        if self.search(r'(token|apiKey|secret)\s*[:=]\s*["\']\w{8,}["\']'):
             self.add_finding("HIGH", "Hardcoded Secret", "Token or API key found in JSX component.", "Use .env variables or secure backend storage.")
 
     def check_insecure_storage(self):
-        if re.search(r'(localStorage|sessionStorage|document\.cookie)', self.code):
+        if self.search(r'(localStorage|sessionStorage|document\.cookie)'):
             self.add_finding("WARNING", "Insecure Storage Access", "Direct access to browser storage detected.", "Avoid storing sensitive values in unprotected storage.")
 
     def check_missing_key_prop(self):
-        if re.search(r'map\((\w+)\s*=>\s*<\w+', self.code) and not re.search(r'key\s*=\s*\{', self.code):
+        if self.search(r'map\((\w+)\s*=>\s*<\w+') and not self.search(r'key\s*=\s*\{'):
             self.add_finding("INFO", "Missing key Prop", "JSX array rendering missing key prop.", "Always assign a unique key when mapping lists.")
 
     def check_insecure_dom_access(self):
-        if re.search(r'(document|window)\.(getElementById|getElementsByClassName|querySelector)', self.code):
+        if self.search(r'(document|window)\.(getElementById|getElementsByClassName|querySelector)'):
             self.add_finding("WARNING", "Unsafe DOM Access", "DOM access via document/window detected.", "Use React refs or stateful logic instead.")
 
     def check_insecure_fetch(self):
-        if re.search(r'(fetch|axios)\(\s*["\']http:', self.code):
+        if self.search(r'(fetch|axios)\(\s*["\']http:'):
             self.add_finding("HIGH", "Insecure API Request", "API request made over HTTP.", "Use only secure HTTPS endpoints.")
 
     def check_dynamic_attributes(self):
-        if re.search(r'(href|src|ref)\s*=\s*\{\s*(props|state)', self.code):
+        if self.search(r'(href|src|ref)\s*=\s*\{\s*(props|state)'):
             self.add_finding("HIGH", "Dynamic Attribute Injection", "Dynamic assignment to href/src/ref.", "Ensure these attributes are validated and sanitized.")
 
     def check_user_input_reflection(self):
-        if re.search(r'\{\s*(user|data|input)\s*\}', self.code):
+        if self.search(r'\{\s*(user|data|input)\s*\}'):
             self.add_finding("HIGH", "User Input Reflection", "User input rendered directly.", "Escape or sanitize all reflected user content.")
@@ -0,0 +1,146 @@
+"""
+File: profiler.py
+
+Description:
+Per-rule timing profiler for the Nuvai scanning engine.
+
+When a profile is active, scan_code() runs each scanner with its check_* methods wrapped
+in timers, recording wall time, bytes processed and hit counts (findings added) per rule
+and per scanner. When no profile is active the dispatcher only pays one global lookup per
+file, so the hook stays compiled in.
+
+Features:
+- enable_profiling() / disable_profiling() or the profiling() context manager
+- Sorted plain-text table for the terminal (run.py --profile)
+- JSON export for comparing runs and tuning or retiring expensive rules
+"""
+
+import json
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+_active: Optional["RuleProfile"] = None
+
+
+class RuleStats:
+    __slots__ = ("scanner", "rule", "calls", "seconds", "bytes", "hits")
+
+    def __init__(self, scanner: str, rule: str):
+        self.scanner = scanner
+        self.rule = rule
+        self.calls = 0
+        self.seconds = 0.0
+        self.bytes = 0
+        self.hits = 0
+
+    def to_dict(self) -> Dict:
+        return {
+            "scanner": self.scanner,
+            "rule": self.rule,
+            "calls": self.calls,
+            "seconds": round(self.seconds, 6),
+            "bytes": self.bytes,
+            "hits": self.hits,
+            "mb_per_s": round(self.bytes / self.seconds / 1e6, 2) if self.seconds else None,
+        }
+
+
+class RuleProfile:
+    def __init__(self):
+        self.rules: Dict[tuple, RuleStats] = {}
+        self.scanners: Dict[str, RuleStats] = {}
+
+    def _stats(self, table, key, scanner, rule):
+        stats = table.get(key)
+        if stats is None:
+            stats = table[key] = RuleStats(scanner, rule)
+        return stats
+
+    def run(self, scanner) -> List:
+        """Run scanner.run_all_checks() with every check_* method timed."""
+        name = type(scanner).__name__
+        size = len(scanner.code)
+
+        for attr in dir(type(scanner)):
+            if attr.startswith("check_"):
+                # Instance attribute shadows the method for this scanner object only
+                setattr(scanner, attr, self._timed(scanner, name, attr, size))
+
+        started = time.perf_counter()
+        findings = scanner.run_all_checks()
+        total = self._stats(self.scanners, name, name, "*")
+        total.calls += 1
+        total.seconds += time.perf_counter() - started
+        total.bytes += size
+        total.hits += len(findings)
+        return findings
+
+    def _timed(self, scanner, name, attr, size):
+        check = getattr(scanner, attr)
+        stats = self._stats(self.rules, (name, attr), name, attr)
+        findings = scanner.findings
+
+        def timed_check(*args, **kwargs):
+            before = len(findings)
+            started = time.perf_counter()
+            try:
+                return check(*args, **kwargs)
+            finally:
+                stats.seconds += time.perf_counter() - started
+                stats.calls += 1
+                stats.bytes += size
+                stats.hits += len(findings) - before
+
+        return timed_check
+
+    def sorted_rules(self) -> List[RuleStats]:
+        return sorted(self.rules.values(), key=lambda s: s.seconds, reverse=True)
+
+    def to_dict(self) -> Dict:
+        return {
+            "scanners": [s.to_dict() for s in sorted(self.scanners.values(), key=lambda s: -s.seconds)],
+            "rules": [s.to_dict() for s in self.sorted_rules()],
+        }
+
+    def save(self, path: str) -> str:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        return path
+
+    def format_table(self, limit: Optional[int] = None) -> str:
+        total = sum(s.seconds for s in self.scanners.values()) or 1.0
+        rows = self.sorted_rules()[:limit]
+        lines = [f"{'Scanner':<18} {'Rule':<34} {'Calls':>7} {'Time (ms)':>11} {'Share':>7} {'MB/s':>9} {'Hits':>7}"]
+        for s in rows:
+            mb_per_s = f"{s.bytes / s.seconds / 1e6:.1f}" if s.seconds else "-"
+            lines.append(
+                f"{s.scanner:<18} {s.rule:<34} {s.calls:>7} {s.seconds * 1000:>11.2f} "
+                f"{s.seconds / total:>7.1%} {mb_per_s:>9} {s.hits:>7}"
+            )
+        return "\n".join(lines)
+
+
+def get_active_profile() -> Optional[RuleProfile]:
+    return _active
+
+
+def enable_profiling() -> RuleProfile:
+    global _active
+    _active = RuleProfile()
+    return _active
+
+
+def disable_profiling() -> Optional[RuleProfile]:
+    global _active
+    profile, _active = _active, None
+    return profile
+
+
+@contextmanager
+def profiling():
+    profile = enable_profiling()
+    try:
+        yield profile
+    finally:
+        disable_profiling()
@@ -19,6 +19,7 @@ Compatible with systems where pip is restricted (e.g., Kali Linux, Windows lockd
 
 import os
 from datetime import datetime
+from .finding import as_dict
 
 
 def ensure_report_directory():
@@ -41,7 +42,7 @@ def save_report(findings, extension):
     if extension == "json":
         import json
         with open(full_path, "w", encoding="utf-8") as f:
-            json.dump(findings, f, indent=4, ensure_ascii=False)
+            json.dump([as_dict(fnd) for fnd in findings], f, indent=4, ensure_ascii=False)
 
     elif extension == "txt":
         with open(full_path, "w", encoding="utf-8") as f:
@@ -23,11 +23,13 @@ Note: Regex-based scanner. Future improvements may use TypeScript AST parsing.
 """
 
 import re
+from .finding import Finding, intern_rule
 
 class TypeScriptScanner:
     def __init__(self, code):
         self.code = code
         self.findings = []
+        self._match = None
 
     def run_all_checks(self):
         self.check_dangerous_eval()
@@ -43,54 +45,61 @@ class TypeScriptScanner:
         self.check_sensitive_comments()
         return self.findings
 
+    def search(self, pattern, flags=0):
+        match = re.search(pattern, self.code, flags)
+        if match:
+            self._match = match
+        return match
+
     def add_finding(self, level, ftype, message, recommendation):
-        self.findings.append({
-            "level": level,
-            "type": ftype,
-            "message": message,
-            "recommendation": recommendation
-        })
+        # Locate the finding at the last successful search() of the current check
+        match, self._match = self._match, None
+        finding = Finding(intern_rule(level, ftype, message, recommendation))
+        if match:
+            finding.start, finding.end = match.span()
+            finding.line = self.code.count("\n", 0, finding.start) + 1
+        self.findings.append(finding)
 
     def check_dangerous_eval(self):
-        if re.search(r'(eval|new Function|setTimeout\s*\(\s*\")', self.code):
+        if self.search(r'(eval|new Function|setTimeout\s*\(\s*\")'):
             self.add_finding("CRITICAL", "Dynamic Code Execution", "Use of eval, new Function or setTimeout with string detected.", "Avoid dynamic code. Use strict logic flow.")
 
     def check_any_type_usage(self):
-        if re.search(r'\:\s*any\b|as\s+any\b', self.code):
+        if self.search(r'\:\s*any\b|as\s+any\b'):
             self.add_finding("WARNING", "Unsafe Typing", "TypeScript type 'any' used.", "Use explicit types to maintain type safety.")
 
     def check_unsanitized_input(self):
-        if re.search(r'(document|window)\.(getElementById|getElementsByClassName|querySelector).*\.value', self.code):
+        if self.search(r'(document|window)\.(getElementById|getElementsByClassName|querySelector).*\.value'):
             self.add_finding("HIGH", "Unsanitized DOM Input", "DOM input accessed without validation.", "Sanitize all user input before use.")
 
     def check_hardcoded_secrets(self):
-        if re.search(r'(api|token|secret|key|password)\s*[:=]\s*["\']\w{8,}["\']', self.code, re.IGNORECASE):
+        if self.search(r'(api|token|secret|key|password)\s*[:=]\s*["\']\w{8,}["\']', re.IGNORECASE):
             self.add_finding("HIGH", "Hardcoded Secret", "Detected secret/token directly in code.", "Move sensitive credentials to environment variables.")
 
     def check_insecure_requests(self):
-        if re.search(r'(fetch|axios)\(\s*\"http:', self.code):
+        if self.search(r'(fetch|axios)\(\s*\"http:'):
             self.add_finding("HIGH", "Insecure API Request", "HTTP request made without HTTPS.", "Always use secure HTTPS endpoints.")
 
     def check_null_checks(self):
-        if re.search(r'\w+\.\w+\s*\(', self.code) and not re.search(r'\?\.', self.code):
+        if self.search(r'\w+\.\w+\s*\(') and not self.search(r'\?\.'):
             self.add_finding("MEDIUM", "Missing Optional Chaining", "Function/property accessed without null check.", "Use optional chaining or explicit validation.")
 
     def check_unhandled_promises(self):
-        if re.search(r'\.then\(.*\)[^\.catch]', self.code):
+        if self.search(r'\.then\(.*\)[^\.catch]'):
             self.add_finding("WARNING", "Unhandled Promise Rejection", "Promise used without catch() or try/catch.", "Always handle promise errors explicitly.")
 
     def check_insecure_storage(self):
-        if re.search(r'(localStorage|sessionStorage|document\.cookie)', self.code):
+        if self.search(r'(localStorage|sessionStorage|document\.cookie)'):
             self.add_finding("WARNING", "Insecure Storage Usage", "Sensitive data stored in browser storage.", "Avoid storing secrets in local/session storage.")
 
     def check_debug_statements(self):
-        if re.search(r'console\.log|debugger', self.code):
+        if self.search(r'console\.log|debugger'):
             self.add_finding("INFO", "Debug Statement", "console.log/debugger detected in code.", "Remove debug statements before shipping code.")
 
     def check_unvalidated_navigation(self):
-        if re.search(r'(window\.location|document\.referrer)\s*=\s*', self.code):
+        if self.search(r'(window\.location|document\.referrer)\s*=\s*'):
             self.add_finding("HIGH", "Unvalidated Redirect", "Detected assignment to navigation location.", "Avoid redirecting users based on untrusted input.")
 
     def check_sensitive_comments(self):
-        if re.search(r'//.*(todo|password|debug)', self.code, re.IGNORECASE):
+        if self.search(r'//.*(todo|password|debug)', re.IGNORECASE):
             self.add_finding("INFO", "Sensitive Comment", "Potentially sensitive comment in code.", "Remove leftover debug or password hints.")
@@ -12,18 +12,21 @@ Security Compliance:
 - Includes S/MIME support (optional)
 - Token reuse prevention via Redis cache
 - Analytics hooks for future dashboards
+
+Configuration (environment):
+- REDIS_URL: Redis used for token replay protection (default: redis://localhost:6379)
+- REDIS_CONNECT_TIMEOUT_SECONDS: connect timeout to Redis (default: 1)
+- REDIS_SOCKET_TIMEOUT_SECONDS: timeout of each Redis command (default: 2)
 """
 
 import os
 import smtplib
 import ssl
-import redis
+import threading
 from email.message import EmailMessage
 from email.utils import make_msgid
 from urllib.parse import quote
 from dotenv import load_dotenv
-from cryptography.hazmat.primitives.serialization import load_pem_private_key
-from cryptography.hazmat.backends import default_backend
 from backend.src.nuvai.utils.logger import get_logger
 
 # Load environment variables
@@ -38,6 +41,8 @@ SMTP_USER = os.getenv("SMTP_USER")
 SMTP_PASSWORD = os.getenv("SMTP_PASSWORD")
 RESET_URL_BASE = os.getenv("RESET_URL_BASE", "http://localhost:5173/reset-password")
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379")
+REDIS_CONNECT_TIMEOUT = float(os.getenv("REDIS_CONNECT_TIMEOUT_SECONDS", 1))
+REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT_SECONDS", 2))
 SENDER_EMAIL = os.getenv("MAIL_FROM", SMTP_USER)
 
 # S/MIME optional
@@ -52,13 +57,38 @@ EMAIL_ENABLED = all([SMTP_SERVER, SMTP_USER, SMTP_PASSWORD])
 if not EMAIL_ENABLED:
     logger.warning("[EMAIL] SMTP configuration incomplete. Email features disabled.")
 
-try:
-    redis_client = redis.StrictRedis.from_url(REDIS_URL, decode_responses=True)
-    redis_client.ping()
-    REDIS_ENABLED = True
-except Exception as e:
-    logger.warning(f"[EMAIL] Redis unavailable: {e}")
-    REDIS_ENABLED = False
+# Redis is connected on first use, not at import: an unreachable Redis must not add a
+# connect timeout to every process start. The timeouts bound that first use (e.g. the
+# worker pre-warm) instead of leaving it to the OS TCP timeout
+_redis_client = None
+_redis_checked = False
+_redis_lock = threading.Lock()
+
+
+def get_redis_client():
+    """
+    Returns the Redis client used for token replay protection, or None if Redis
+    is unavailable. The connection is checked once per process.
+    """
+    global _redis_client, _redis_checked
+    if not _redis_checked:
+        with _redis_lock:
+            if not _redis_checked:
+                try:
+                    import redis
+
+                    client = redis.StrictRedis.from_url(
+                        REDIS_URL,
+                        decode_responses=True,
+                        socket_connect_timeout=REDIS_CONNECT_TIMEOUT,
+                        socket_timeout=REDIS_SOCKET_TIMEOUT,
+                    )
+                    client.ping()
+                    _redis_client = client
+                except Exception as e:
+                    logger.warning(f"[EMAIL] Redis unavailable: {e}")
+                _redis_checked = True
+    return _redis_client
 
 
 def send_reset_email(recipient_email: str, token: str) -> None:
@@ -70,12 +100,13 @@ def send_reset_email(recipient_email: str, token: str) -> None:
         logger.warning("Reset email skipped — SMTP not configured.")
         return
 
-    if REDIS_ENABLED and redis_client.get(token):
+    redis_client = get_redis_client()
+    if redis_client is not None and redis_client.get(token):
         logger.warning(f"Replay attempt blocked for token: {token[:6]}***")
         raise RuntimeError("Token has already been used or issued.")
 
     try:
-        if REDIS_ENABLED:
+        if redis_client is not None:
             redis_client.setex(token, RESET_TOKEN_TTL, "valid")
 
         safe_token = quote(token, safe="")
@@ -101,6 +132,9 @@ def send_reset_email(recipient_email: str, token: str) -> None:
 
         if SMIME_CERT_PATH and SMIME_KEY_PATH:
             try:
+                from cryptography.hazmat.primitives.serialization import load_pem_private_key
+                from cryptography.hazmat.backends import default_backend
+
                 with open(SMIME_KEY_PATH, "rb") as key_file:
                     load_pem_private_key(
                         key_file.read(),
@@ -0,0 +1,231 @@
+# File: log_collector.py
+
+"""
+Description:
+Single-writer log aggregation for multi-process deployments (e.g. gunicorn with 16+ workers).
+
+Every worker process used to own a RotatingFileHandler on the same nuvai.log. Rotation in
+one worker renamed the file under the others, so lines were lost or interleaved under load.
+With NUVAI_LOG_SOCKET set, workers instead ship already formatted and redacted lines to one
+collector over a local Unix socket. The collector is the only process that writes the file:
+it batches lines into a single write per wakeup and owns rotation.
+
+Features:
+- Length-prefixed JSON frames (no pickle: the socket never deserializes code)
+- One persistent connection per worker; reconnects with backoff, safe across fork()
+- Batched writes: up to NUVAI_LOG_BATCH_SIZE lines per write/flush
+- Rotation by size using the standard RotatingFileHandler rollover
+- Socket created with owner-only permissions
+- Clean shutdown: the listener is closed and every connection drained before the writer stops
+
+Usage:
+    python -m backend.src.nuvai.utils.log_collector      # standalone
+    gunicorn -c backend/gunicorn.conf.py ...              # started by the master
+"""
+
+import json
+import os
+import queue
+import signal
+import socket
+import socketserver
+import struct
+import threading
+from logging.handlers import RotatingFileHandler, SocketHandler
+
+FRAME_HEADER = struct.Struct(">L")
+MAX_FRAME_SIZE = 1024 * 1024
+BATCH_SIZE = int(os.getenv("NUVAI_LOG_BATCH_SIZE", 512))
+
+
+class LogShippingHandler(SocketHandler):
+    """
+    Sends formatted records to the collector socket. Formatting (and redaction) happens in
+    the worker, so raw arguments never leave the process. If the collector is unreachable,
+    records are dropped and the connection is retried with SocketHandler's backoff.
+    """
+
+    def __init__(self, socket_path):
+        # SocketHandler treats port=None as a Unix domain socket path
+        super().__init__(socket_path, None)
+        self._pid = os.getpid()
+
+    def makePickle(self, record):
+        data = json.dumps({"level": record.levelno, "line": self.format(record)}).encode("utf-8")
+        return FRAME_HEADER.pack(len(data)) + data
+
+    def emit(self, record):
+        if self._pid != os.getpid():
+            # A connection inherited across fork() is shared with the parent; open our own
+            self._pid = os.getpid()
+            if self.sock is not None:
+                self.sock.close()
+                self.sock = None
+        super().emit(record)
+
+
+class _FrameReader(socketserver.StreamRequestHandler):
+    def handle(self):
+        lines = self.server.lines
+        while True:
+            header = self.rfile.read(FRAME_HEADER.size)
+            if len(header) < FRAME_HEADER.size:
+                return
+            (size,) = FRAME_HEADER.unpack(header)
+            if size > MAX_FRAME_SIZE:
+                return  # malformed stream; drop the connection
+            data = self.rfile.read(size)
+            if len(data) < size:
+                return
+            try:
+                lines.put(json.loads(data)["line"])
+            except (ValueError, KeyError, TypeError):
+                continue
+
+
+class _CollectorServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+    # All workers connect at once on boot; the default backlog of 5 refuses some of them
+    request_queue_size = 1024
+
+    def __init__(self, *args, **kwargs):
+        self._connections = {}  # open worker connection -> its reader thread
+        self._connections_lock = threading.Lock()
+        super().__init__(*args, **kwargs)
+
+    def process_request(self, request, client_address):
+        # As ThreadingMixIn, but the reader thread is registered before it starts
+        thread = threading.Thread(target=self.process_request_thread, args=(request, client_address), daemon=True)
+        with self._connections_lock:
+            self._connections[request] = thread
+        thread.start()
+
+    def shutdown_request(self, request):
+        with self._connections_lock:
+            self._connections.pop(request, None)
+        super().shutdown_request(request)
+
+    def accept_pending(self):
+        """Hand connections still waiting in the listen backlog to readers (after shutdown())."""
+        self.socket.setblocking(False)
+        while True:
+            try:
+                request, client_address = self.get_request()
+            except OSError:  # BlockingIOError: backlog empty
+                return
+            request.setblocking(True)
+            self.process_request(request, client_address)
+
+    def close_connections(self, timeout):
+        """End every worker connection after what it already sent, and wait for the readers."""
+        with self._connections_lock:
+            connections = list(self._connections.items())
+        for request, _ in connections:
+            try:
+                request.shutdown(socket.SHUT_RD)  # buffered frames are still read, then EOF
+            except OSError:
+                pass
+        for _, thread in connections:
+            thread.join(timeout)
+
+
+class LogCollector:
+    """Receives lines from all workers and writes them to one rotating file."""
+
+    def __init__(self, socket_path, log_file, max_bytes, backup_count, batch_size=BATCH_SIZE):
+        self.socket_path = socket_path
+        self.batch_size = batch_size
+        self.lines = queue.SimpleQueue()
+        self._file = RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backup_count)
+        self._server = None
+        self._threads = []
+
+    def start(self):
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)  # stale socket from a previous run
+        old_umask = os.umask(0o177)
+        try:
+            self._server = _CollectorServer(self.socket_path, _FrameReader)
+        finally:
+            os.umask(old_umask)
+        self._server.lines = self.lines
+        self._threads = [
+            threading.Thread(target=self._server.serve_forever, name="nuvai-log-accept", daemon=True),
+            threading.Thread(target=self._write_loop, name="nuvai-log-writer", daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def _write_loop(self):
+        while True:
+            line = self.lines.get()
+            if line is None:
+                return
+            batch = [line]
+            stop = False
+            while len(batch) < self.batch_size:
+                try:
+                    line = self.lines.get_nowait()
+                except queue.Empty:
+                    break
+                if line is None:
+                    stop = True
+                    break
+                batch.append(line)
+            self._write(batch)
+            if stop:
+                return
+
+    def _write(self, batch):
+        handler = self._file
+        if handler.stream is None:
+            handler.stream = handler._open()
+        handler.stream.write("\n".join(batch) + "\n")
+        handler.stream.flush()
+        if handler.maxBytes and handler.stream.tell() >= handler.maxBytes:
+            handler.doRollover()
+
+    def stop(self):
+        """Stop accepting connections, write out everything received, close the file."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.accept_pending()
+            self._server.server_close()  # closes the listening socket
+            # Readers can still enqueue lines; the sentinel must come after their last one
+            self._server.close_connections(timeout=5)
+            self._server = None
+        self.lines.put(None)
+        for thread in self._threads:
+            thread.join(timeout=5)
+        self._file.close()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+    def serve(self):
+        """Run in the foreground until interrupted or terminated."""
+        stopped = threading.Event()
+        signal.signal(signal.SIGTERM, lambda *_: stopped.set())
+        self.start()
+        try:
+            stopped.wait()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+
+def run_collector(socket_path=None):
+    """Entry point for the collector process; configuration matches utils.logger."""
+    from backend.src.nuvai.utils import logger as nuvai_logger
+
+    LogCollector(
+        socket_path or nuvai_logger.LOG_SOCKET or nuvai_logger.DEFAULT_LOG_SOCKET,
+        nuvai_logger.LOG_FILE,
+        nuvai_logger.MAX_BYTES,
+        nuvai_logger.BACKUP_COUNT,
+    ).serve()
+
+
+if __name__ == "__main__":
+    run_collector()
@@ -0,0 +1,166 @@
+# File: log_sampling.py
+
+"""
+Description:
+Log volume control for the Nuvai API: per-level and per-route sampling, plus periodic
+request summary records that replace per-request INFO lines.
+
+Sampling is decided once per request, so a sampled request keeps all of its log lines and
+can still be followed end to end. ERROR and CRITICAL records and summary records are never
+sampled out.
+
+Configuration (environment):
+- NUVAI_LOG_SAMPLE_LEVELS: rates per level, e.g. "DEBUG=0.01,INFO=0.1" (default: 1 for all)
+- NUVAI_LOG_SAMPLE_ROUTES: rates per route, e.g. "/scan=0.01,/=0" (default: 1 for all)
+- NUVAI_LOG_SUMMARY_SECONDS: request summary window (default: 60, 0 disables)
+"""
+
+import atexit
+import logging
+import os
+import random
+import threading
+import time
+from contextvars import ContextVar
+
+SUMMARY_ATTR = "_nuvai_summary"
+MAX_LATENCY_SAMPLES = 10_000
+
+# (route, sampling roll) of the request being handled on this thread / task
+_request_context = ContextVar("nuvai_log_request", default=None)
+
+
+def parse_rates(spec: str) -> dict:
+    """Parse "KEY=rate,KEY=rate" into {KEY: float}; malformed entries are ignored."""
+    rates = {}
+    for item in (spec or "").split(","):
+        key, sep, value = item.strip().rpartition("=")
+        if not sep or not key:
+            continue
+        try:
+            rates[key.strip()] = min(1.0, max(0.0, float(value)))
+        except ValueError:
+            continue
+    return rates
+
+
+def _level_rates(spec: str) -> dict:
+    return {
+        logging.getLevelName(name.upper()): rate
+        for name, rate in parse_rates(spec).items()
+        if isinstance(logging.getLevelName(name.upper()), int)
+    }
+
+
+LEVEL_RATES = _level_rates(os.getenv("NUVAI_LOG_SAMPLE_LEVELS", ""))
+ROUTE_RATES = parse_rates(os.getenv("NUVAI_LOG_SAMPLE_ROUTES", ""))
+SUMMARY_SECONDS = float(os.getenv("NUVAI_LOG_SUMMARY_SECONDS", 60))
+
+
+def begin_request_log(route: str) -> None:
+    """Called at the start of a request; fixes the sampling decision for all its records."""
+    _request_context.set((route, random.random()))
+
+
+def end_request_log() -> None:
+    _request_context.set(None)
+
+
+class SamplingFilter(logging.Filter):
+    """Drops records by level and route rate; runs on the calling thread, so it stays O(1)."""
+
+    def __init__(self, level_rates=None, route_rates=None):
+        super().__init__()
+        self.level_rates = LEVEL_RATES if level_rates is None else level_rates
+        self.route_rates = ROUTE_RATES if route_rates is None else route_rates
+
+    def filter(self, record):
+        if record.levelno >= logging.ERROR or SUMMARY_ATTR in record.__dict__:
+            return True
+        rate = self.level_rates.get(record.levelno, 1.0)
+        context = _request_context.get()
+        if context is None:
+            roll = random.random()
+        else:
+            route, roll = context
+            rate *= self.route_rates.get(route, 1.0)
+        return roll < rate
+
+
+class RequestSummary:
+    """
+    Aggregates request counts, error counts and latency percentiles per route and emits
+    one summary record per route per window.
+    """
+
+    def __init__(self, logger: logging.Logger, window_seconds: float = SUMMARY_SECONDS):
+        self.logger = logger
+        self.window_seconds = window_seconds
+        self._lock = threading.Lock()
+        self._window_start = time.time()
+        self._routes = {}
+
+    def observe(self, route: str, status: int, duration_ms: float) -> None:
+        if not self.window_seconds:
+            return
+        with self._lock:
+            stats = self._routes.get(route)
+            if stats is None:
+                stats = self._routes[route] = {"count": 0, "errors": 0, "latencies": []}
+            stats["count"] += 1
+            if status >= 500:
+                stats["errors"] += 1
+            latencies = stats["latencies"]
+            if len(latencies) < MAX_LATENCY_SAMPLES:
+                latencies.append(duration_ms)
+            else:
+                # Reservoir sampling keeps the percentiles unbiased on busy routes
+                i = random.randrange(stats["count"])
+                if i < MAX_LATENCY_SAMPLES:
+                    latencies[i] = duration_ms
+            due = time.time() - self._window_start >= self.window_seconds
+        if due:
+            self.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            routes, self._routes = self._routes, {}
+            window_start, self._window_start = self._window_start, time.time()
+        window = round(time.time() - window_start, 1)
+        for route, stats in sorted(routes.items()):
+            latencies = sorted(stats["latencies"])
+            self.logger.info(
+                f"Request summary for {route}: {stats['count']} request(s) in {window}s",
+                extra={
+                    SUMMARY_ATTR: True,
+                    "event": "request_summary",
+                    "route": route,
+                    "window_s": window,
+                    "count": stats["count"],
+                    "errors": stats["errors"],
+                    "p50_ms": _percentile(latencies, 50),
+                    "p95_ms": _percentile(latencies, 95),
+                    "p99_ms": _percentile(latencies, 99),
+                    "max_ms": latencies[-1] if latencies else None,
+                },
+            )
+
+
+def _percentile(ordered, pct):
+    if not ordered:
+        return None
+    return round(ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))], 2)
+
+
+_summary = None
+
+
+def get_request_summary() -> RequestSummary:
+    """Process-wide summary aggregator, flushed at exit."""
+    global _summary
+    if _summary is None:
+        from backend.src.nuvai.utils.logger import get_logger
+
+        _summary = RequestSummary(get_logger("nuvai.requests"))
+        atexit.register(_summary.flush)
+    return _summary
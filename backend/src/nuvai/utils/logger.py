@@ -12,57 +12,160 @@ Security Compliance:
 Features:
 - Uses Python's built-in logging with RotatingFileHandler
 - Supports console + file logging
-- Redacts sensitive fields before logging
+- Redacts sensitive values before logging, only for emitted records (see redaction.py)
+- Structured fields passed via extra={...} are appended as key=value and redacted by key
 - Includes correlation IDs if available
 - Can be extended for SIEM integration or remote log shipping
 - Logs include UTC timestamp, level, message, and metadata
+- Multi-process safe: with NUVAI_LOG_SOCKET set, lines are shipped to a single
+  log collector that owns the file and its rotation (see log_collector.py)
+- NUVAI_LOG_FORMAT=json: one JSON object per line for log pipelines
+- Per-level / per-route sampling with errors always kept (see log_sampling.py)
+- Non-blocking: the hot path only enqueues records; formatting, redaction and I/O
+  run on a background QueueListener thread (disable with NUVAI_LOG_ASYNC=false)
 """
 
+import atexit
+import json
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+import threading
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 from datetime import datetime, timezone
-import re
+
+from backend.src.nuvai.utils.log_collector import LogShippingHandler
+from backend.src.nuvai.utils.redaction import default_redactor, SENSITIVE_KEYS
+from backend.src.nuvai.utils.log_sampling import SamplingFilter, LEVEL_RATES, ROUTE_RATES
 
 LOG_LEVEL = os.getenv("NUVAI_LOG_LEVEL", "INFO").upper()
 LOG_DIR = os.getenv("NUVAI_LOG_DIR", "logs")
 LOG_FILE = os.path.join(LOG_DIR, "nuvai.log")
 MAX_BYTES = int(os.getenv("NUVAI_LOG_MAX_BYTES", 1048576))  # 1MB
 BACKUP_COUNT = int(os.getenv("NUVAI_LOG_BACKUP_COUNT", 5))
+LOG_SOCKET = os.getenv("NUVAI_LOG_SOCKET")  # collector socket; unset = write the file directly
+DEFAULT_LOG_SOCKET = os.path.join(LOG_DIR, "nuvai-log.sock")
+LOG_FORMAT = os.getenv("NUVAI_LOG_FORMAT", "text").lower()  # text | json
+LOG_ASYNC = os.getenv("NUVAI_LOG_ASYNC", "true").lower() in ("1", "true", "yes")
 
 os.makedirs(LOG_DIR, exist_ok=True)
 
-# Regex patterns to redact sensitive values
-SENSITIVE_KEYS = ["password", "token", "secret", "authorization"]
-SENSITIVE_PATTERN = re.compile(rf"({'|'.join(SENSITIVE_KEYS)})(=|:)?\\s*[^\s,;]+", re.IGNORECASE)
-
 def redact_sensitive_data(msg):
-    return SENSITIVE_PATTERN.sub(r"\1=[REDACTED]", msg)
+    return default_redactor.redact_text(str(msg))
 
 class SecureFormatter(logging.Formatter):
     def format(self, record):
-        record.msg = redact_sensitive_data(str(record.msg))
-        timestamp = datetime.now(timezone.utc).isoformat()
-        return f"[{timestamp}] [{record.levelname}] {record.getMessage()}"
+        # Redaction runs once per emitted record and is shared by all handlers
+        message, fields = default_redactor.redact_record(record)
+        timestamp = datetime.fromtimestamp(record.created, timezone.utc).isoformat()
+        line = f"[{timestamp}] [{record.levelname}] {message}"
+        if fields:
+            line += " " + " ".join(f"{key}={value}" for key, value in fields.items())
+        return line
 
-def get_logger(name="nuvai"):
-    logger = logging.getLogger(name)
-    if logger.handlers:
-        return logger  # prevent duplicate handlers
-
-    logger.setLevel(getattr(logging, LOG_LEVEL, logging.INFO))
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line; structured fields become top-level keys."""
 
-    formatter = SecureFormatter()
+    def format(self, record):
+        message, fields = default_redactor.redact_record(record)
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": message,
+        }
+        entry.update(fields)
+        if record.exc_info:
+            entry["exc"] = default_redactor.redact_text(self.formatException(record.exc_info))
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+FORMATTERS = {"text": SecureFormatter, "json": JsonFormatter}
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    Enqueues records untouched. The stock QueueHandler.prepare() formats the message on
+    the calling thread; here all formatting is left to the listener thread.
+    """
+
+    def prepare(self, record):
+        return record
+
+# Shared pipeline: one queue and one listener thread per process
+log_queue = queue.SimpleQueue()
+_queue_handler = DeferredQueueHandler(log_queue)
+_listener = None
+_listener_lock = threading.Lock()
+# Only installed when sampling is configured, so unsampled deployments pay nothing
+_sampling_filter = SamplingFilter() if LEVEL_RATES or ROUTE_RATES else None
+
+def build_output_handlers():
+    formatter = FORMATTERS.get(LOG_FORMAT, SecureFormatter)()
 
     # Console handler
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
 
-    # File handler with rotation
-    file_handler = RotatingFileHandler(LOG_FILE, maxBytes=MAX_BYTES, backupCount=BACKUP_COUNT)
+    if LOG_SOCKET:
+        # Workers ship lines to the collector, which is the only writer of LOG_FILE
+        file_handler = LogShippingHandler(LOG_SOCKET)
+    else:
+        # File handler with rotation
+        file_handler = RotatingFileHandler(LOG_FILE, maxBytes=MAX_BYTES, backupCount=BACKUP_COUNT)
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+
+    return [console_handler, file_handler]
+
+def start_log_listener():
+    """Start the background listener (idempotent)."""
+    global _listener
+    with _listener_lock:
+        if _listener is None:
+            _listener = QueueListener(log_queue, *build_output_handlers(), respect_handler_level=True)
+            _listener.start()
+    return _listener
+
+def stop_log_listener():
+    """Drain the queue and stop the listener; called automatically at exit."""
+    global _listener
+    with _listener_lock:
+        if _listener is not None:
+            _listener.stop()
+            for handler in _listener.handlers:
+                handler.close()
+            _listener = None
+
+def _reset_after_fork():
+    # The listener thread does not survive fork(); gunicorn workers start their own
+    global _listener, _listener_lock
+    was_running = _listener is not None
+    _listener_lock = threading.Lock()
+    _listener = None
+    # Records still queued at fork time belong to the parent's listener
+    while not log_queue.empty():
+        log_queue.get_nowait()
+    if was_running:
+        start_log_listener()
+
+atexit.register(stop_log_listener)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+def get_logger(name="nuvai"):
+    logger = logging.getLogger(name)
+    if logger.handlers:
+        return logger  # prevent duplicate handlers
+
+    logger.setLevel(getattr(logging, LOG_LEVEL, logging.INFO))
+    if _sampling_filter is not None:
+        # Runs on the calling thread, before the record is queued
+        logger.addFilter(_sampling_filter)
+
+    if LOG_ASYNC:
+        start_log_listener()
+        logger.addHandler(_queue_handler)
+    else:
+        for handler in build_output_handlers():
+            logger.addHandler(handler)
 
     return logger
 
@@ -0,0 +1,93 @@
+# File: redaction.py
+
+"""
+Description:
+Redaction of sensitive values (passwords, tokens, secrets, credentials) in log records.
+
+Redaction only runs when a handler formats a record, so records dropped by level or
+filters cost nothing. The result is cached on the record and reused by every handler
+that emits it (console, file, collector).
+
+Features:
+- Keyword prefilter: messages without a sensitive keyword skip the regex entirely
+- One precompiled pattern redacts all key=value / key: value pairs in a single pass
+- Structured fields (extra={...} and mapping-style args) are redacted by key, no text scan
+- Strict mode (used by SensitiveDataFilter) drops the whole message instead
+"""
+
+import logging
+import re
+
+REDACTED = "[REDACTED]"
+FILTERED_MESSAGE = "[FILTERED] Sensitive information removed from log."
+
+SENSITIVE_KEYS = ("password", "passwd", "token", "secret", "authorization", "api_key", "apikey", "api-key")
+
+# Attributes every LogRecord has; anything else was passed through extra={...}
+STANDARD_RECORD_ATTRS = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime", "taskName"}
+
+# Cache attributes set on records by redact_record()
+CACHE_ATTR = "_nuvai_redacted"
+STRICT_ATTR = "_nuvai_strict_redaction"
+
+
+class Redactor:
+    def __init__(self, keys=SENSITIVE_KEYS):
+        self.keys = tuple(k.lower() for k in keys)
+        self.pattern = re.compile(
+            r"(?P<key>(?:%s)[\w-]*)"                  # password, access_token, api-key, ...
+            r"(?P<sep>[\"']?\s*[=:]\s*[\"']?)"        # =, :, "key": "
+            r"(?:bearer\s+|basic\s+)?"                # Authorization: Bearer <value>
+            r"[^\s,;&\"']+" % "|".join(re.escape(k) for k in self.keys),
+            re.IGNORECASE,
+        )
+
+    def mentions_sensitive(self, text: str) -> bool:
+        lowered = text.lower()
+        return any(key in lowered for key in self.keys)
+
+    def is_sensitive_key(self, key) -> bool:
+        return self.mentions_sensitive(str(key))
+
+    def redact_text(self, text: str) -> str:
+        if not self.mentions_sensitive(text):
+            return text
+        return self.pattern.sub(rf"\g<key>\g<sep>{REDACTED}", text)
+
+    def redact_mapping(self, mapping) -> dict:
+        return {k: REDACTED if self.is_sensitive_key(k) else v for k, v in mapping.items()}
+
+    def redact_record(self, record: logging.LogRecord):
+        """
+        Return (message, fields) for a record with sensitive values removed. Computed once
+        per record; later handlers get the cached result.
+        """
+        cached = record.__dict__.get(CACHE_ATTR)
+        if cached is not None:
+            return cached
+
+        args = record.args
+        if args and isinstance(args, dict):
+            record.args = self.redact_mapping(args)
+        try:
+            message = record.getMessage()
+        finally:
+            record.args = args
+
+        if record.__dict__.get(STRICT_ATTR):
+            if self.mentions_sensitive(message):
+                message = FILTERED_MESSAGE
+        else:
+            message = self.redact_text(message)
+
+        fields = {
+            k: REDACTED if self.is_sensitive_key(k) else v
+            for k, v in record.__dict__.items()
+            if k not in STANDARD_RECORD_ATTRS and not k.startswith("_")
+        }
+
+        cached = record.__dict__[CACHE_ATTR] = (message, fields)
+        return cached
+
+
+default_redactor = Redactor()
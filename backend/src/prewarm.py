@@ -0,0 +1,114 @@
+"""
+Pre-warming for API worker processes.
+
+Scanners, their rule regexes and the external connections are all set up on
+first use, which would otherwise land on the first requests a fresh worker
+serves after a deploy or scale-out. Pre-warming moves that work out of the
+request path:
+
+- compile_rule_packs() runs in the gunicorn master (with preload_app) before
+  workers are forked: it imports every scanner and runs each one on a small
+  clean sample, so the compiled patterns in the `re` cache and the interned
+  rules are inherited by all workers, shared copy-on-write.
+- reset_after_fork() runs first thing in each worker: connection pools the
+  master may have opened are dropped, never shared between processes.
+- warm_worker() runs in each worker before it accepts traffic: it opens the
+  database pool, connects to Redis, creates the AI client and runs one dummy
+  scan per language (cheap when the master already compiled the rules).
+
+Every step is best-effort: a failure is logged and never stops a worker
+from booting. Steps that reach the network are bounded by their client's
+connect timeout (e.g. REDIS_CONNECT_TIMEOUT_SECONDS), so an unreachable
+service delays boot by at most that long.
+
+Configuration (environment):
+- NUVAI_PREWARM: enable pre-warming (default: true)
+- NUVAI_PREWARM_DB_CONNECTIONS: database connections opened per worker (default: 1)
+"""
+
+import os
+import time
+from typing import Dict
+
+from backend.src.nuvai.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+PREWARM_ENABLED = os.getenv("NUVAI_PREWARM", "true").lower() in ("1", "true", "yes")
+PREWARM_DB_CONNECTIONS = int(os.getenv("NUVAI_PREWARM_DB_CONNECTIONS", 1))
+
+# Clean samples: no rule matches, so every rule's first pattern is compiled. Secondary
+# patterns only tried after a first match (e.g. the SSRF check's input() search) are
+# left to compile on first use; they are short and cheap to compile.
+WARMUP_SAMPLES = {
+    "python": "def total(items):\n    return sum(len(item) for item in items)\n",
+    "javascript": "function total(items) {\n  return items.reduce((a, b) => a + b, 0);\n}\n",
+    "typescript": "function total(items: number[]): number {\n  return items.length;\n}\n",
+    "jsx": "function Label({ name }) {\n  return <span className=\"label\">{name}</span>;\n}\n",
+    "php": "<?php\nfunction total(array $items) {\n    return count($items);\n}\n",
+    "html": "<!DOCTYPE html>\n<html lang=\"en\">\n<body>\n  <p>Warm-up</p>\n</body>\n</html>\n",
+    "cpp": "#include <vector>\nint total(const std::vector<int>& items) {\n    return items.size();\n}\n",
+}
+
+
+def _timed(name: str, step, timings: Dict[str, float]) -> None:
+    started = time.perf_counter()
+    try:
+        step()
+    except Exception as e:
+        logger.warning(f"Pre-warm step '{name}' failed: {e}")
+    timings[name] = round((time.perf_counter() - started) * 1000, 2)
+
+
+def _scan_samples() -> None:
+    from backend.src.nuvai.scanner import scan_code
+
+    for language, sample in WARMUP_SAMPLES.items():
+        scan_code(sample, language)
+
+
+def compile_rule_packs() -> Dict[str, float]:
+    """Import every scanner and compile its rules; call before forking workers."""
+    timings: Dict[str, float] = {}
+    _timed("rule_packs", _scan_samples, timings)
+    logger.info(f"Rule packs compiled for {len(WARMUP_SAMPLES)} languages in {timings['rule_packs']} ms")
+    return timings
+
+
+def reset_after_fork() -> None:
+    """Drop connection pools inherited from the master; they must not be shared."""
+    from backend.src.core.db import dispose_engine_after_fork
+
+    dispose_engine_after_fork()
+
+
+def _open_db_pool() -> None:
+    from backend.src.core.db import get_engine
+
+    engine = get_engine()
+    connections = [engine.connect() for _ in range(max(1, PREWARM_DB_CONNECTIONS))]
+    for connection in connections:
+        connection.close()  # back to the pool, still open
+
+
+def _connect_redis() -> None:
+    from backend.src.nuvai.utils.email_utils import get_redis_client
+
+    get_redis_client()
+
+
+def _create_ai_client() -> None:
+    from backend.src.ai_client import get_ai_client
+
+    get_ai_client()
+
+
+def warm_worker() -> Dict[str, float]:
+    """Open pools and run one scan per language; call before the worker accepts traffic."""
+    timings: Dict[str, float] = {}
+    _timed("db_pool", _open_db_pool, timings)
+    _timed("redis", _connect_redis, timings)
+    _timed("ai_client", _create_ai_client, timings)
+    _timed("scans", _scan_samples, timings)
+    logger.info(f"Worker {os.getpid()} pre-warmed: " + ", ".join(f"{k}={v}ms" for k, v in timings.items()))
+    return timings
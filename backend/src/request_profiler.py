@@ -0,0 +1,177 @@
+"""
+On-demand cProfile capture of single /scan requests for administrators.
+
+A request carrying `X-Nuvai-Profile: <ADMIN_API_TOKEN>` runs under
+cProfile; the stats are written to a bounded on-disk ring and the profile
+id is returned in the `X-Nuvai-Profile-Id` response header. Requests
+without the header only pay one header lookup.
+
+Stored profiles are served by the admin routes as raw pstats (for
+snakeviz, pstats, etc.), a text summary, or collapsed stacks for
+flamegraph.pl / speedscope.
+
+Configuration (environment):
+- ADMIN_API_TOKEN: shared admin secret; profiling is disabled when unset
+- PROFILE_DIR: ring directory (default: backend/tmp/profiles)
+- PROFILE_RING_SIZE: number of profiles kept (default: 20)
+"""
+
+import cProfile
+import hmac
+import io
+import os
+import pstats
+import re
+import time
+import uuid
+from typing import Dict, List, Optional
+
+from backend.src.nuvai.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+PROFILE_HEADER = "X-Nuvai-Profile"
+PROFILE_ID_HEADER = "X-Nuvai-Profile-Id"
+ADMIN_API_TOKEN = os.getenv("ADMIN_API_TOKEN", "")
+PROFILE_DIR = os.getenv("PROFILE_DIR", os.path.join(os.getcwd(), "backend", "tmp", "profiles"))
+PROFILE_RING_SIZE = int(os.getenv("PROFILE_RING_SIZE", 20))
+
+PROFILE_ID_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+MAX_STACK_DEPTH = 64
+MIN_STACK_MICROSECONDS = 1
+
+
+def is_admin_token(supplied: Optional[str]) -> bool:
+    if not ADMIN_API_TOKEN or not supplied:
+        return False
+    return hmac.compare_digest(supplied.strip().encode(), ADMIN_API_TOKEN.encode())
+
+
+class RequestProfile:
+    __slots__ = ("id", "profiler", "started")
+
+    def __init__(self):
+        self.id = uuid.uuid4().hex
+        self.profiler = cProfile.Profile()
+        self.started = time.time()
+
+
+def start_request_profile(headers) -> Optional[RequestProfile]:
+    """Start profiling if the request carries a valid admin profiling header."""
+    supplied = headers.get(PROFILE_HEADER)
+    if supplied is None:
+        return None
+    if not is_admin_token(supplied):
+        logger.warning("Ignoring profiling request with an invalid admin token")
+        return None
+
+    profile = RequestProfile()
+    try:
+        profile.profiler.enable()
+    except ValueError:
+        # Another profiler is already active on this thread
+        logger.warning("Profiler unavailable; request not profiled")
+        return None
+    return profile
+
+
+def finish_request_profile(profile: RequestProfile, route: str) -> str:
+    """Stop profiling, store the stats in the ring and return the profile id."""
+    profile.profiler.disable()
+    os.makedirs(PROFILE_DIR, mode=0o700, exist_ok=True)
+    # Sortable names: oldest first when listing the ring
+    filename = f"{int(profile.started * 1000):013d}_{profile.id}.prof"
+    profile.profiler.dump_stats(os.path.join(PROFILE_DIR, filename))
+    prune_profiles()
+    logger.info(f"Stored request profile {profile.id} for {route}")
+    return profile.id
+
+
+def _ring_files() -> List[str]:
+    try:
+        return sorted(f for f in os.listdir(PROFILE_DIR) if f.endswith(".prof"))
+    except FileNotFoundError:
+        return []
+
+
+def prune_profiles(keep: int = PROFILE_RING_SIZE) -> None:
+    files = _ring_files()
+    for filename in files[:max(0, len(files) - keep)]:
+        try:
+            os.remove(os.path.join(PROFILE_DIR, filename))
+        except FileNotFoundError:
+            pass  # pruned concurrently by another worker
+
+
+def list_profiles() -> List[Dict]:
+    profiles = []
+    for filename in reversed(_ring_files()):
+        stamp, _, rest = filename.partition("_")
+        path = os.path.join(PROFILE_DIR, filename)
+        try:
+            size = os.path.getsize(path)
+        except FileNotFoundError:
+            continue
+        profiles.append({"id": rest[:-len(".prof")], "created": int(stamp) / 1000, "size": size})
+    return profiles
+
+
+def profile_path(profile_id: str) -> Optional[str]:
+    if not PROFILE_ID_PATTERN.match(profile_id or ""):
+        return None
+    for filename in _ring_files():
+        if filename.endswith(f"_{profile_id}.prof"):
+            return os.path.join(PROFILE_DIR, filename)
+    return None
+
+
+def render_text(path: str, limit: int = 50) -> str:
+    out = io.StringIO()
+    stats = pstats.Stats(path, stream=out)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(limit)
+    return out.getvalue()
+
+
+def _frame_label(func) -> str:
+    filename, lineno, name = func
+    label = f"{name} ({os.path.basename(filename)}:{lineno})" if lineno else name
+    return label.replace(";", ":")
+
+
+def render_collapsed(path: str) -> str:
+    """
+    Collapsed stacks ("a;b;c <microseconds>") reconstructed from the pstats call graph.
+    cProfile only records caller/callee pairs, so time is split across call paths in
+    proportion to each edge's share of the callee's cumulative time.
+    """
+    stats = pstats.Stats(path).stats
+    callees: Dict[tuple, Dict[tuple, float]] = {}
+    for func, (_, _, _, _, callers) in stats.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, {})[func] = edge[3]
+
+    totals: Dict[str, int] = {}
+
+    def walk(func, stack, scale, path_funcs):
+        _, _, own, cumulative, _ = stats[func]
+        stack = stack + [_frame_label(func)]
+        micros = int(own * scale * 1e6)
+        if micros >= MIN_STACK_MICROSECONDS:
+            key = ";".join(stack)
+            totals[key] = totals.get(key, 0) + micros
+        if len(stack) >= MAX_STACK_DEPTH:
+            return
+        for callee, edge_cumulative in callees.get(func, {}).items():
+            callee_cumulative = stats[callee][3]
+            if callee not in path_funcs and callee_cumulative > 0:
+                child_scale = scale * edge_cumulative / callee_cumulative
+                if child_scale * callee_cumulative * 1e6 >= MIN_STACK_MICROSECONDS:
+                    path_funcs.add(callee)
+                    walk(callee, stack, child_scale, path_funcs)
+                    path_funcs.discard(callee)
+
+    roots = [func for func, entry in stats.items() if not entry[4]]
+    for root in roots:
+        walk(root, [], 1.0, {root})
+
+    return "\n".join(f"{stack} {micros}" for stack, micros in sorted(totals.items())) + "\n"
@@ -4,7 +4,12 @@ File: update_init.py
 Description:
 This utility script automatically updates the __init__.py file inside the
 src/nuvai/ directory. It scans all Python files in the directory, and generates
-import statements and an __all__ list so that Nuvai core modules can be easily imported.
+a lazy-loading __init__.py: every public name defined by a module is mapped to that
+module, and the module is only imported when the name (or the module itself) is first
+accessed. Importing the package therefore does not load every scanner.
+
+When two modules define the same name, the module that sorts last wins, as it did
+with the former star imports.
 
 Usage:
 Run this script manually whenever you add or remove files in src/nuvai/
@@ -13,37 +18,78 @@ Example:
 $ python3 update_init.py
 """
 
+import ast
 import os
 
-TARGET_DIR = "src/nuvai"
+TARGET_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "src", "nuvai")
 INIT_FILE = os.path.join(TARGET_DIR, "__init__.py")
 
 # Files to ignore
 EXCLUDE_FILES = {"__init__.py", "__pycache__"}
 
+
+def public_names(path):
+    """Names a star import would take from the module: __all__, or its public definitions."""
+    with open(path, "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    names = []
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            names.append(node.name)
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            for target in targets:
+                if isinstance(target, ast.Name):
+                    if target.id == "__all__" and isinstance(node.value, (ast.List, ast.Tuple)):
+                        return [elt.value for elt in node.value.elts if isinstance(elt, ast.Constant)]
+                    names.append(target.id)
+    return [n for n in dict.fromkeys(names) if not n.startswith("_")]
+
+
 # Collect module names
-modules = [
+modules = sorted(
     f[:-3] for f in os.listdir(TARGET_DIR)
     if f.endswith(".py") and f not in EXCLUDE_FILES
-]
+)
 
-# Build import lines
-import_lines = [f"from .{m} import *" for m in modules]
+# Map every exported name to its module; later modules override earlier ones
+exports = {}
+for m in modules:
+    for name in public_names(os.path.join(TARGET_DIR, f"{m}.py")):
+        exports[name] = m
 
 # Construct full content with better formatting
 content = (
     '"""\n'
     'This file is auto-generated by update_init.py\n'
     'Do not edit manually.\n'
+    '\n'
+    'Modules are imported on first attribute access (PEP 562), so importing the\n'
+    'package does not load every scanner.\n'
     '"""\n\n'
-    + "\n".join(import_lines)
-    + "\n\n__all__ = [\n"
+    'import importlib\n\n'
+    + "_EXPORTS = {\n"
+    + "".join(f'    "{name}": "{m}",\n' for name, m in sorted(exports.items()))
+    + "}\n\n"
+    + "__all__ = [\n"
     + ",\n".join([f'    \"{m}\"' for m in modules])
-    + "\n]"
+    + "\n]\n\n\n"
+    'def __getattr__(name):\n'
+    '    module = _EXPORTS.get(name)\n'
+    '    if module is not None:\n'
+    '        value = getattr(importlib.import_module(f".{module}", __name__), name)\n'
+    '        globals()[name] = value\n'
+    '        return value\n'
+    '    if name in __all__:\n'
+    '        return importlib.import_module(f".{name}", __name__)\n'
+    '    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")\n\n\n'
+    'def __dir__():\n'
+    '    return sorted(set(globals()) | set(_EXPORTS) | set(__all__))\n'
 )
 
 # Write to __init__.py
 with open(INIT_FILE, "w") as f:
     f.write(content)
 
-print(f"✅ {INIT_FILE} updated with {len(modules)} modules.")
\ No newline at end of file
+print(f"✅ {INIT_FILE} updated with {len(modules)} modules and {len(exports)} lazy names.")
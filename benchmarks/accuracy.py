@@ -0,0 +1,222 @@
+"""
+File: accuracy.py
+
+Description:
+Golden-corpus accuracy and latency harness for the Nuvai scanning engine.
+
+The corpus (benchmarks/golden/expected.json) labels every example file with the findings
+the engine must report, including their locations, plus two lists that keep the numbers
+honest about what the engine does not do yet:
+- known_misses: real issues in the file that no rule detects (they lower recall)
+- known_false_positives: findings the engine reports on safe code (they lower precision)
+
+One command scans every file, reports precision, recall and per-file latency, and exits
+non-zero when a labelled finding is missing, moved or changed severity, or when a new
+unlabelled finding appears. A performance change that passes this gate did not change results.
+
+Findings are matched on (type, line); whole-file findings (no location) on type alone.
+The engine's informational findings ("Security Guidance", "No Issues Detected") are ignored.
+
+Usage (from the project root):
+    python -m benchmarks.accuracy
+    python -m benchmarks.accuracy --engine backend --output accuracy.json
+    python -m benchmarks.accuracy --record    # relabel after an intended detection change
+"""
+
+import argparse
+import json
+import sys
+from typing import Dict, List, Optional, Tuple
+
+from benchmarks.run_benchmarks import measure, summarize
+
+DEFAULT_CORPUS = "benchmarks/golden/expected.json"
+IGNORED_TYPES = {"Security Guidance", "No Issues Detected"}
+ENGINES = ("src", "backend")
+
+
+def load_engine(name: str):
+    if name == "backend":
+        from backend.src.nuvai.scanner import get_language, scan_code
+    else:
+        from src.nuvai.scanner import get_language, scan_code
+    return get_language, scan_code
+
+
+def match_key(finding: Dict) -> Tuple:
+    return finding["type"], finding.get("line")
+
+
+def to_label(finding) -> Dict:
+    data = finding.to_dict(locations=True)
+    return {
+        "level": data["level"],
+        "type": data["type"],
+        "line": data.get("line"),
+        "start": data.get("start"),
+        "end": data.get("end"),
+    }
+
+
+def scan_file(path: str, scan_code, get_language) -> Tuple[str, List[Dict]]:
+    with open(path, "r", encoding="utf-8") as f:
+        code = f.read()
+    language = get_language(path, code)
+    reported = [to_label(f) for f in scan_code(code, language) if f["type"] not in IGNORED_TYPES]
+    return language, reported
+
+
+def score_file(entry: Dict, language: str, reported: List[Dict]) -> Dict:
+    expected = {match_key(f): f for f in entry.get("findings", [])}
+    known_fps = {match_key(f) for f in entry.get("known_false_positives", [])}
+    misses = entry.get("known_misses", [])
+    reported_by_key = {match_key(f): f for f in reported}
+
+    true_positives, changed = 0, []
+    for key, label in expected.items():
+        found = reported_by_key.get(key)
+        if found is None:
+            continue
+        true_positives += 1
+        if found != label:
+            changed.append({"expected": label, "reported": found})
+
+    false_positives = [f for key, f in reported_by_key.items() if key not in expected]
+    detected = true_positives + len(false_positives)
+    relevant = len(expected) + len(misses)
+    return {
+        "language": language,
+        "expected_language": entry.get("language"),
+        "true_positives": true_positives,
+        "false_positives": len(false_positives),
+        "false_negatives": relevant - true_positives,
+        "precision": true_positives / detected if detected else 1.0,
+        "recall": true_positives / relevant if relevant else 1.0,
+        # Gate failures: anything that differs from the labels
+        "missing": [label for key, label in expected.items() if key not in reported_by_key],
+        "unexpected": [f for f in false_positives if match_key(f) not in known_fps],
+        "changed": changed,
+    }
+
+
+def is_regression(result: Dict) -> bool:
+    return bool(
+        result["missing"] or result["unexpected"] or result["changed"]
+        or result["language"] != result["expected_language"]
+    )
+
+
+def evaluate(corpus: Dict, engine: str, repeat: int, min_time: float) -> Dict:
+    get_language, scan_code = load_engine(engine)
+    results = []
+    totals = {"true_positives": 0, "false_positives": 0, "false_negatives": 0}
+    for path, entry in corpus["files"].items():
+        language, reported = scan_file(path, scan_code, get_language)
+        result = {"file": path, **score_file(entry, language, reported)}
+
+        with open(path, "r", encoding="utf-8") as f:
+            code = f.read()
+        timing = summarize(measure(lambda: scan_code(code, language), repeat, min_time), len(code.encode()))
+        result.update({k: timing[k] for k in ("runs", "p50_ms", "p90_ms", "p99_ms")})
+
+        for key in totals:
+            totals[key] += result[key]
+        results.append(result)
+
+    detected = totals["true_positives"] + totals["false_positives"]
+    relevant = totals["true_positives"] + totals["false_negatives"]
+    return {
+        "engine": engine,
+        "files": results,
+        "totals": {
+            **totals,
+            "precision": totals["true_positives"] / detected if detected else 1.0,
+            "recall": totals["true_positives"] / relevant if relevant else 1.0,
+        },
+        "regressions": [r["file"] for r in results if is_regression(r)],
+    }
+
+
+def record(corpus: Dict, engine: str) -> Dict:
+    """Relabel every file with the engine's current findings, keeping known misses and false positives."""
+    get_language, scan_code = load_engine(engine)
+    for path, entry in corpus["files"].items():
+        language, reported = scan_file(path, scan_code, get_language)
+        known_fps = {match_key(f) for f in entry.get("known_false_positives", [])}
+        entry["language"] = language
+        entry["findings"] = [f for f in reported if match_key(f) not in known_fps]
+        entry["known_false_positives"] = [f for f in reported if match_key(f) in known_fps]
+    return corpus
+
+
+def format_finding(finding: Dict) -> str:
+    where = f"line {finding['line']}" if finding.get("line") is not None else "file"
+    return f"{finding.get('level', '?')} {finding['type']} ({where})"
+
+
+def print_report(report: Dict) -> None:
+    print(f"{'File':<40} {'Lang':<11} {'TP':>4} {'FP':>4} {'FN':>4} {'Prec':>6} {'Recall':>7} "
+          f"{'p50 (ms)':>9} {'p99 (ms)':>9}")
+    for r in report["files"]:
+        print(f"{r['file']:<40} {r['language']:<11} {r['true_positives']:>4} {r['false_positives']:>4} "
+              f"{r['false_negatives']:>4} {r['precision']:>6.1%} {r['recall']:>7.1%} "
+              f"{r['p50_ms']:>9.3f} {r['p99_ms']:>9.3f}")
+    t = report["totals"]
+    print(f"{'Total':<52} {t['true_positives']:>4} {t['false_positives']:>4} {t['false_negatives']:>4} "
+          f"{t['precision']:>6.1%} {t['recall']:>7.1%}")
+
+    for r in report["files"]:
+        if not is_regression(r):
+            continue
+        print(f"\n❌ {r['file']}")
+        if r["language"] != r["expected_language"]:
+            print(f"   language: expected {r['expected_language']}, detected {r['language']}")
+        for f in r["missing"]:
+            print(f"   missing:    {format_finding(f)}")
+        for f in r["unexpected"]:
+            print(f"   unexpected: {format_finding(f)}")
+        for c in r["changed"]:
+            e, g = c["expected"], c["reported"]
+            print(f"   changed:    {format_finding(e)} [{e['start']}:{e['end']}] -> "
+                  f"{g['level']} [{g['start']}:{g['end']}]")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Nuvai golden-corpus accuracy and latency")
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS)
+    parser.add_argument("--engine", choices=ENGINES, default="src",
+                        help="Scanner package: src.nuvai (CLI) or backend.src.nuvai (API)")
+    parser.add_argument("--repeat", type=int, default=20, help="Minimum timed scans per file (default: 20)")
+    parser.add_argument("--min-time", type=float, default=0.2,
+                        help="Minimum seconds spent timing each file (default: 0.2)")
+    parser.add_argument("--output", help="Also write the JSON report to this path")
+    parser.add_argument("--record", action="store_true",
+                        help="Overwrite the labelled findings with the engine's current output")
+    args = parser.parse_args(argv)
+
+    with open(args.corpus, "r", encoding="utf-8") as f:
+        corpus = json.load(f)
+
+    if args.record:
+        with open(args.corpus, "w", encoding="utf-8") as f:
+            json.dump(record(corpus, args.engine), f, indent=2)
+            f.write("\n")
+        print(f"📁 Golden corpus relabelled: {args.corpus} (review the diff before committing)")
+        return 0
+
+    report = evaluate(corpus, args.engine, args.repeat, args.min_time)
+    print_report(report)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n📁 Accuracy report saved to: {args.output}")
+
+    if report["regressions"]:
+        print(f"\n❌ Findings differ from the golden corpus in {len(report['regressions'])} file(s)")
+        return 1
+    print("\n✅ Findings match the golden corpus")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,215 @@
+"""
+File: compare.py
+
+Description:
+Performance regression gate for the Nuvai benchmark suite.
+
+Compares a benchmark run against the committed baseline (benchmarks/baseline.json) and
+exits non-zero when any benchmark got slower than the allowed percentage. A change only
+counts when it is also larger than the run-to-run noise of both runs (median absolute
+deviation), so a noisy machine does not fail the gate on its own.
+
+With --run, the cold-start budgets of benchmarks.import_time and the memory budgets of
+benchmarks.memory are checked as well; an import over budget (or failing) or a memory
+breach fails the gate too.
+
+Usage (from the project root):
+    python -m benchmarks.compare --run                          # run the baseline's cases, then compare
+    python -m benchmarks.compare --current benchmark_results.json --threshold 15
+    python -m benchmarks.compare --run --markdown summary.md    # e.g. for a CI job summary
+    python -m benchmarks.compare --run --update-baseline        # accept the current numbers
+    python -m benchmarks.compare --run --skip-import-time --skip-memory   # throughput only
+"""
+
+import argparse
+import json
+import math
+import sys
+from typing import Dict, List, Optional
+
+DEFAULT_BASELINE = "benchmarks/baseline.json"
+DEFAULT_THRESHOLD = 10.0  # percent
+NOISE_SIGMAS = 3.0
+DEFAULT_MIN_DELTA_MS = 0.05  # timer and scheduler jitter on microsecond-scale benchmarks
+MAD_TO_SIGMA = 1.4826  # MAD -> standard deviation for normally distributed noise
+
+
+def load(path: str) -> Dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare_result(base: Dict, current: Dict, threshold: float, min_delta_ms: float = DEFAULT_MIN_DELTA_MS) -> Dict:
+    base_median, current_median = base["median_s"], current["median_s"]
+    delta = current_median - base_median
+    delta_pct = delta / base_median * 100 if base_median else 0.0
+    noise = max(
+        NOISE_SIGMAS * MAD_TO_SIGMA * math.hypot(base.get("mad_s", 0.0), current.get("mad_s", 0.0)),
+        min_delta_ms / 1000,
+    )
+
+    if abs(delta) <= noise or abs(delta_pct) <= threshold:
+        status = "ok"
+    else:
+        status = "regression" if delta > 0 else "improvement"
+
+    return {
+        "name": current["name"],
+        "baseline_ms": base_median * 1000,
+        "current_ms": current_median * 1000,
+        "delta_pct": delta_pct,
+        "noise_ms": noise * 1000,
+        "status": status,
+    }
+
+
+def compare(baseline: Dict, current: Dict, threshold: float, min_delta_ms: float = DEFAULT_MIN_DELTA_MS) -> Dict:
+    base_by_name = {r["name"]: r for r in baseline["results"]}
+    current_by_name = {r["name"]: r for r in current["results"]}
+    rows = [
+        compare_result(base_by_name[name], current_by_name[name], threshold, min_delta_ms)
+        for name in base_by_name if name in current_by_name
+    ]
+    return {
+        "rows": rows,
+        "missing": sorted(base_by_name.keys() - current_by_name.keys()),
+        "new": sorted(current_by_name.keys() - base_by_name.keys()),
+        "regressions": [r for r in rows if r["status"] == "regression"],
+    }
+
+
+STATUS_LABELS = {"ok": "✅ ok", "regression": "❌ regression", "improvement": "🚀 improvement"}
+
+
+def to_markdown(comparison: Dict, baseline: Dict, current: Dict, threshold: float) -> str:
+    regressions = comparison["regressions"]
+    lines = [
+        "## Benchmark comparison",
+        "",
+        f"Baseline `{baseline['meta'].get('revision', '?')}` vs current `{current['meta'].get('revision', '?')}`, "
+        f"threshold {threshold:g}% (changes within {NOISE_SIGMAS:g}x MAD noise or the minimum delta are ignored).",
+        "",
+        f"**{len(regressions)} regression(s)** in {len(comparison['rows'])} benchmark(s).",
+        "",
+        "| Benchmark | Baseline (ms) | Current (ms) | Change | Noise (ms) | Status |",
+        "|---|---:|---:|---:|---:|---|",
+    ]
+    ordered = sorted(comparison["rows"], key=lambda r: (r["status"] != "regression", -r["delta_pct"]))
+    for r in ordered:
+        lines.append(
+            f"| `{r['name']}` | {r['baseline_ms']:.3f} | {r['current_ms']:.3f} | {r['delta_pct']:+.1f}% "
+            f"| {r['noise_ms']:.3f} | {STATUS_LABELS[r['status']]} |"
+        )
+    if comparison["missing"]:
+        lines += ["", "Not measured in the current run: " + ", ".join(f"`{n}`" for n in comparison["missing"])]
+    if comparison["new"]:
+        lines += ["", "Not in the baseline: " + ", ".join(f"`{n}`" for n in comparison["new"])]
+    return "\n".join(lines) + "\n"
+
+
+def run_like(baseline: Dict, rounds: int) -> Dict:
+    """Re-run the baseline's benchmark cases; samples of repeated rounds are pooled."""
+    from benchmarks.run_benchmarks import run, summarize
+
+    meta = baseline["meta"]
+    cases = sorted({(r["language"], r["size"], r["benchmark"]) for r in baseline["results"]})
+    pooled: Dict[str, Dict] = {}
+    report: Optional[Dict] = None
+    for _ in range(rounds):
+        for language, size, benchmark in cases:
+            report = run([language], [size], [benchmark], meta["density"], meta["seed"],
+                         meta["repeat"], meta["min_time_s"])
+            for result in report["results"]:
+                entry = pooled.setdefault(result["name"], result)
+                if entry is not result:
+                    entry["samples_s"].extend(result["samples_s"])
+
+    results = []
+    for result in pooled.values():
+        results.append({**result, **summarize(result["samples_s"], result.get("input_size", result["size"]))})
+    return {"meta": {**report["meta"], "rounds": rounds}, "results": results}
+
+
+def strip_samples(report: Dict) -> Dict:
+    return {**report, "results": [{k: v for k, v in r.items() if k != "samples_s"} for r in report["results"]]}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare benchmark results against the baseline")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--current", help="Results JSON from benchmarks.run_benchmarks")
+    source.add_argument("--run", action="store_true", help="Run the baseline's benchmarks now")
+    parser.add_argument("--rounds", type=int, default=1, help="Repeat the run and pool samples (with --run)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"Allowed slowdown in percent (default: {DEFAULT_THRESHOLD:g})")
+    parser.add_argument("--min-delta-ms", type=float, default=DEFAULT_MIN_DELTA_MS,
+                        help=f"Ignore absolute changes below this (default: {DEFAULT_MIN_DELTA_MS:g} ms)")
+    parser.add_argument("--markdown", help="Also write the markdown summary to this path")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Write the current results as the new baseline instead of comparing")
+    parser.add_argument("--skip-import-time", action="store_true",
+                        help="Do not check the cold-start (import time) budgets with --run")
+    parser.add_argument("--skip-memory", action="store_true",
+                        help="Do not check the memory budgets with --run")
+    args = parser.parse_args(argv)
+
+    if args.update_baseline and args.current:
+        # Bootstrapping from a saved run does not need an existing baseline
+        baseline, current = None, load(args.current)
+    else:
+        baseline = load(args.baseline)
+        current = run_like(baseline, max(1, args.rounds)) if args.run else load(args.current)
+
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(strip_samples(current), f, indent=2)
+        print(f"📁 Baseline updated: {args.baseline}")
+        return 0
+
+    comparison = compare(baseline, current, args.threshold, args.min_delta_ms)
+    summary = to_markdown(comparison, baseline, current, args.threshold)
+    print(summary)
+
+    import_failures = 0
+    if args.run and not args.skip_import_time:
+        from benchmarks import import_time
+
+        import_results = import_time.check_targets(list(import_time.TARGETS), import_time.DEFAULT_BUDGETS_MS)
+        import_failures = import_time.print_results(import_results)
+        import_summary = import_time.to_markdown(import_results)
+        print("\n" + import_summary)
+        summary += "\n" + import_summary
+
+    memory_breaches = 0
+    if args.run and not args.skip_memory:
+        from benchmarks import memory
+
+        memory_report = memory.check_budgets(on_result=memory.print_result)
+        memory_breaches = len(memory_report["breaches"])
+        memory_summary = memory.to_markdown(memory_report)
+        print("\n" + memory_summary)
+        summary += "\n" + memory_summary
+
+    if args.markdown:
+        with open(args.markdown, "w", encoding="utf-8") as f:
+            f.write(summary)
+
+    failed = False
+    if comparison["regressions"]:
+        print(f"❌ {len(comparison['regressions'])} benchmark(s) regressed by more than {args.threshold:g}%")
+        failed = True
+    if import_failures:
+        print(f"❌ {import_failures} import-time target(s) over budget or failing to import")
+        failed = True
+    if memory_breaches:
+        print(f"❌ {memory_breaches} memory measurement(s) over budget")
+        failed = True
+    if failed:
+        return 1
+    print("✅ No performance regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
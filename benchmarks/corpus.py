@@ -0,0 +1,212 @@
+"""
+File: corpus.py
+
+Description:
+Deterministic synthetic source files for benchmarking the Nuvai scanners.
+
+generate_source(language, size, density, seed) always returns the same text for the same
+arguments: benign, realistic-looking code assembled from per-language templates, with
+vulnerable lines (taken from the patterns the scanners look for) mixed in at the requested
+density. The text is exactly `size` characters long.
+
+Because each scanner rule reports its first match, density mostly changes how far a rule
+has to search before it matches: low densities are the worst case for scan time.
+"""
+
+import random
+
+LANGUAGES = ("python", "javascript", "typescript", "jsx", "php", "html", "cpp")
+
+FILE_EXTENSIONS = {
+    "python": ".py",
+    "javascript": ".js",
+    "typescript": ".ts",
+    "jsx": ".jsx",
+    "php": ".php",
+    "html": ".html",
+    "cpp": ".cpp",
+}
+
+# Benign building blocks; {name}, {other} and {n} are filled in deterministically
+BENIGN_TEMPLATES = {
+    "python": [
+        "def {name}({other}, limit={n}):\n    total = 0\n    for item in {other}[:limit]:\n        total += len(item)\n    return total\n\n",
+        "class {Name}:\n    def __init__(self, {other}):\n        self.{other} = {other}\n        self.count = {n}\n\n",
+        "{name}_values = [{n}, {n} * 2, {n} * 3]\n",
+        "# Compute the {name} summary for the {other} report\n",
+    ],
+    "javascript": [
+        "function {name}({other}) {{\n  const result = [];\n  for (let i = 0; i < {n}; i++) {{\n    result.push({other}[i] || 0);\n  }}\n  return result;\n}}\n\n",
+        "const {name}Config = {{ retries: {n}, label: \"{other}\" }};\n",
+        "// Update the {name} view when {other} changes\n",
+        "export const {name} = ({other}) => {other}.map((x) => x * {n});\n",
+    ],
+    "typescript": [
+        "interface {Name} {{\n  id: number;\n  {other}: string;\n}}\n\n",
+        "function {name}({other}: number[]): number {{\n  return {other}.reduce((a, b) => a + b, {n});\n}}\n\n",
+        "const {name}Limit: number = {n};\n",
+        "// Map {name} records into {other} entries\n",
+    ],
+    "jsx": [
+        "function {Name}({{ {other} }}) {{\n  return <div className=\"{name}\">{{{other}.length}} items</div>;\n}}\n\n",
+        "const {name}Items = [{n}, {n} + 1, {n} + 2];\n",
+        "// Render the {name} panel for {other}\n",
+    ],
+    "php": [
+        "function {name}(${other}) {{\n    $total = 0;\n    foreach (${other} as $item) {{\n        $total += {n};\n    }}\n    return $total;\n}}\n\n",
+        "${name}_limit = {n};\n",
+        "// Prepare the {name} listing for {other}\n",
+    ],
+    "html": [
+        "<section class=\"{name}\">\n  <h2>{Name} overview</h2>\n  <p>Showing {n} {other} entries.</p>\n</section>\n",
+        "<li class=\"{other}\">{Name} item {n}</li>\n",
+        "<!-- {name} block for {other} -->\n",
+    ],
+    "cpp": [
+        "int {name}(const std::vector<int>& {other}) {{\n    int total = 0;\n    for (int value : {other}) {{\n        total += value * {n};\n    }}\n    return total;\n}}\n\n",
+        "static const int {name}_limit = {n};\n",
+        "// Accumulate the {name} totals for {other}\n",
+    ],
+}
+
+# Vulnerable lines, one rule hit each
+VULNERABLE_LINES = {
+    "python": [
+        "eval(user_input)\n",
+        "os.system(user_input)\n",
+        "password = \"123456\"\n",
+        "data = pickle.loads(payload)\n",
+        "hashed = hashlib.md5(secret.encode()).hexdigest()\n",
+        "app.run(debug=True)\n",
+        "logging.info(\"password=%s\", password)\n",
+        "open(\"../../etc/passwd\", \"r\")\n",
+    ],
+    "javascript": [
+        "eval(code);\n",
+        "document.getElementById(\"out\").innerHTML = name;\n",
+        "fetch(\"http://portal.example.com/api/users/\" + id);\n",
+        "localStorage.setItem(\"token\", token);\n",
+        "const API_SECRET = \"supersecret-apikey-123456\";\n",
+        "console.log(\"debug\", data);\n",
+    ],
+    "typescript": [
+        "eval(userCode);\n",
+        "const apiKey: string = \"sk-test-1234567890\";\n",
+        "element.innerHTML = userInput;\n",
+        "fetch(\"http://insecure.example.com/data\");\n",
+        "localStorage.setItem(\"authToken\", token);\n",
+    ],
+    "jsx": [
+        "<div dangerouslySetInnerHTML={{ __html: userInput }} />\n",
+        "eval(props.code);\n",
+        "localStorage.setItem(\"token\", token);\n",
+        "<a href={userUrl} target=\"_blank\">link</a>\n",
+        "fetch(\"http://api.example.com/\" + id);\n",
+    ],
+    "php": [
+        "eval($_GET['code']);\n",
+        "$output = shell_exec($_POST['shell']);\n",
+        "$result = $conn->query(\"SELECT * FROM bookings WHERE id = '$id'\");\n",
+        "echo $_GET['name'];\n",
+        "$db_pass = 'govpass123';\n",
+        "include($_GET['page']);\n",
+        "$hash = md5($password);\n",
+    ],
+    "html": [
+        "<script>document.write(location.hash)</script>\n",
+        "<form action=\"http://insecure.example.com/login\" method=\"get\">\n",
+        "<input type=\"password\" name=\"password\" autocomplete=\"on\">\n",
+        "<img src=\"x\" onerror=\"alert(1)\">\n",
+        "<iframe src=\"http://example.com\"></iframe>\n",
+        "<!-- admin password: hunter2 -->\n",
+    ],
+    "cpp": [
+        "gets(buffer);\n",
+        "strcpy(dest, src);\n",
+        "sprintf(buffer, \"%s\", name);\n",
+        "int* data = (int*)malloc(100 * sizeof(int));\n",
+        "char* ptr = NULL;\n",
+        "system(command);\n",
+        "while (true) { }\n",
+    ],
+}
+
+# Prepended so content-based language detection has something to go on
+HEADERS = {
+    "python": "import os\nimport logging\n\n",
+    "javascript": "'use strict';\n\n",
+    "typescript": "import { Service } from \"./service\";\n\n",
+    "jsx": "import React from \"react\";\n\n",
+    "php": "<?php\n\n",
+    "html": "<!DOCTYPE html>\n<html>\n<body>\n",
+    "cpp": "#include <vector>\n#include <cstring>\n\n",
+}
+
+WORDS = (
+    "account", "booking", "citizen", "report", "invoice", "session", "profile", "ticket",
+    "order", "payment", "schedule", "office", "record", "queue", "status", "message",
+)
+
+
+def generate_source(language: str, size: int, density: float = 0.01, seed: int = 0) -> str:
+    """
+    Return exactly `size` characters of `language` source. `density` is the fraction of
+    emitted blocks that are vulnerable lines (0 produces clean code).
+    """
+    rng = random.Random(f"{language}:{size}:{density}:{seed}")
+    templates = BENIGN_TEMPLATES[language]
+    vulnerable = VULNERABLE_LINES[language]
+    parts = [HEADERS[language]]
+    length = len(parts[0])
+    while length < size:
+        if density and rng.random() < density:
+            block = rng.choice(vulnerable)
+        else:
+            name = rng.choice(WORDS) + "_" + rng.choice(WORDS)
+            block = rng.choice(templates).format(
+                name=name,
+                Name=name.title().replace("_", ""),
+                other=rng.choice(WORDS),
+                n=rng.randrange(1, 1000),
+            )
+        parts.append(block)
+        length += len(block)
+    return "".join(parts)[:size]
+
+
+# Headers for upload inputs: scanner_controller rejects "import os" and "<?php" outright
+UPLOAD_HEADERS = {
+    **HEADERS,
+    "python": "import logging\n\n",
+    "php": "// Listing helpers\n\n",
+}
+# scanner_controller.MAX_ALLOWED_SIZE_HARD: larger uploads are rejected before scanning
+MAX_UPLOAD_SIZE = 2_000_000
+
+
+def generate_upload_source(language: str, size: int, seed: int = 0) -> str:
+    """
+    Clean source that passes scanner_controller validation, for timing the scan behind it:
+    no vulnerable lines (they match the controller's blocked patterns), a header the
+    controller accepts, and at most MAX_UPLOAD_SIZE characters.
+    """
+    size = min(size, MAX_UPLOAD_SIZE)
+    body = generate_source(language, size + len(UPLOAD_HEADERS[language]), density=0.0, seed=seed)
+    return (UPLOAD_HEADERS[language] + body[len(HEADERS[language]):])[:size]
+
+
+def parse_size(value: str) -> int:
+    """Parse sizes like 1KB, 100kb, 1MB, 2048 into bytes."""
+    value = value.strip().upper()
+    for suffix, factor in (("KB", 1024), ("MB", 1024 * 1024), ("B", 1)):
+        if value.endswith(suffix):
+            return int(float(value[:-len(suffix)]) * factor)
+    return int(value)
+
+
+def format_size(size: int) -> str:
+    if size >= 1024 * 1024 and size % (1024 * 1024) == 0:
+        return f"{size // (1024 * 1024)}MB"
+    if size >= 1024 and size % 1024 == 0:
+        return f"{size // 1024}KB"
+    return f"{size}B"
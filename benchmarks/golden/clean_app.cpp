@@ -0,0 +1,11 @@
+// Clean C++ fixture for the golden corpus: no findings expected.
+#include <string>
+#include <vector>
+
+int totalLength(const std::vector<std::string>& items) {
+    int total = 0;
+    for (const auto& item : items) {
+        total += static_cast<int>(item.size());
+    }
+    return total;
+}
@@ -0,0 +1,10 @@
+// Clean JavaScript fixture for the golden corpus: no findings expected.
+
+function formatTotal(items) {
+  const total = items.reduce((sum, item) => sum + item.price, 0);
+  return total.toFixed(2);
+}
+
+function renderName(element, name) {
+  element.textContent = name;
+}
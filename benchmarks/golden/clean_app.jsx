@@ -0,0 +1,6 @@
+// Clean JSX fixture for the golden corpus: no findings expected.
+import React from "react";
+
+export function Greeting({ name }) {
+  return <p className="greeting">Hello, {name}</p>;
+}
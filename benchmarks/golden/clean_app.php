@@ -0,0 +1,10 @@
+<?php
+// Clean PHP fixture for the golden corpus: no findings expected.
+
+function format_total(array $items): string {
+    $total = 0;
+    foreach ($items as $item) {
+        $total += $item['price'];
+    }
+    return number_format($total, 2);
+}
@@ -0,0 +1,13 @@
+"""Clean Python fixture for the golden corpus: no findings expected."""
+
+import json
+from pathlib import Path
+
+
+def load_settings(path: Path) -> dict:
+    with path.open(encoding="utf-8") as f:
+        return json.load(f)
+
+
+def total_size(items):
+    return sum(len(item) for item in items)
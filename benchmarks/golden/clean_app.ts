@@ -0,0 +1,8 @@
+// Clean TypeScript fixture for the golden corpus: no findings expected.
+
+type Item = { id: number; price: number };
+
+export function formatTotal(items: Item[]): string {
+  const total = items.reduce((sum, item) => sum + item.price, 0);
+  return total.toFixed(2);
+}
@@ -0,0 +1,218 @@
+"""
+File: import_time.py
+
+Description:
+Cold-start budget check for the CLI (run.py) and the API server (backend/server.py).
+
+Each target is imported in fresh interpreters under `python -X importtime`; the import
+time of the target module (everything it pulls in that the interpreter had not already
+loaded) is compared against its budget, and the slowest imports are listed so that a
+new eager import is easy to spot. Exits non-zero when a target is over budget or fails
+to import.
+
+Heavy subsystems (database engine, Redis, the AI SDK, individual scanners) are loaded
+on first use, so none of them should show up in these numbers.
+
+A target whose deployment-provided modules are absent (backend/config.py for the server)
+is skipped with the reason printed, rather than failed. The check also runs as part of
+the regression gate (python -m benchmarks.compare --run).
+
+Usage (from the project root):
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --targets run --runs 10 --budget run=80
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional
+
+TARGETS = {
+    "run": "run",
+    "server": "backend.server",
+}
+DEFAULT_BUDGETS_MS = {
+    "run": 150.0,
+    "server": 750.0,
+}
+# Files a target needs that are provided per deployment rather than committed
+TARGET_REQUIRES = {
+    "server": {
+        "backend/config.py": "backend.config (get_config, validate_config) is deployment-provided "
+                             "and not present in this checkout",
+    },
+}
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+
+def parse_importtime(stderr: str) -> Dict[str, Dict]:
+    """Map module -> {self_us, cumulative_us, depth} from -X importtime output."""
+    modules = {}
+    for line in stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            modules[name] = {
+                "self_us": int(self_us),
+                "cumulative_us": int(cumulative_us),
+                "depth": (len(indent) - 1) // 2,
+            }
+    return modules
+
+
+def import_once(module: str, cwd: str) -> Dict:
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=cwd, capture_output=True, text=True,
+    )
+    wall = time.perf_counter() - started
+    if proc.returncode != 0:
+        errors = [l for l in proc.stderr.splitlines() if not l.startswith("import time:")]
+        return {"ok": False, "error": "\n".join(errors[-5:])}
+    modules = parse_importtime(proc.stderr)
+    return {
+        "ok": True,
+        "wall_ms": wall * 1000,
+        "import_ms": modules.get(module, {"cumulative_us": 0})["cumulative_us"] / 1000,
+        "modules": modules,
+    }
+
+
+def missing_requirement(name: str, cwd: str) -> Optional[str]:
+    for path, reason in TARGET_REQUIRES.get(name, {}).items():
+        if not os.path.exists(os.path.join(cwd, path)):
+            return reason
+    return None
+
+
+def measure_target(name: str, runs: int, top: int, cwd: str) -> Dict:
+    module = TARGETS[name]
+    skip_reason = missing_requirement(name, cwd)
+    if skip_reason:
+        return {"target": name, "module": module, "ok": True, "skipped": skip_reason}
+    import_once(module, cwd)  # warm-up: writes bytecode caches, fills the OS page cache
+    samples = []
+    for _ in range(runs):
+        sample = import_once(module, cwd)
+        if not sample["ok"]:
+            return {"target": name, "module": module, "ok": False, "error": sample["error"]}
+        samples.append(sample)
+
+    slowest = {}
+    for mod in samples[0]["modules"]:
+        values = [s["modules"][mod]["self_us"] for s in samples if mod in s["modules"]]
+        slowest[mod] = statistics.median(values) / 1000
+    return {
+        "target": name,
+        "module": module,
+        "ok": True,
+        "runs": runs,
+        "import_ms": round(statistics.median(s["import_ms"] for s in samples), 2),
+        "wall_ms": round(statistics.median(s["wall_ms"] for s in samples), 2),
+        "slowest": [
+            {"module": mod, "self_ms": round(ms, 2)}
+            for mod, ms in sorted(slowest.items(), key=lambda kv: -kv[1])[:top]
+        ],
+    }
+
+
+def parse_budgets(values: List[str]) -> Dict[str, float]:
+    budgets = dict(DEFAULT_BUDGETS_MS)
+    for value in values or []:
+        name, _, ms = value.partition("=")
+        if name not in TARGETS or not ms:
+            raise argparse.ArgumentTypeError(f"invalid budget {value!r} (expected e.g. run=150)")
+        budgets[name] = float(ms)
+    return budgets
+
+
+def check_targets(targets: List[str], budgets: Dict[str, float], runs: int = 5, top: int = 10,
+                  cwd: Optional[str] = None) -> List[Dict]:
+    """Measure each target and mark it ok / skipped / failed against its budget."""
+    cwd = cwd or os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    results = []
+    for name in targets:
+        result = measure_target(name, max(1, runs), top, cwd)
+        result["budget_ms"] = budgets[name]
+        if result.get("skipped"):
+            result["status"] = "skipped"
+        elif not result["ok"]:
+            result["status"] = "failed"
+        else:
+            result["status"] = "over budget" if result["import_ms"] > budgets[name] else "ok"
+        results.append(result)
+    return results
+
+
+def print_results(results: List[Dict]) -> int:
+    """Print the results; returns the number of failed targets."""
+    failures = 0
+    for result in results:
+        name = result["target"]
+        if result["status"] == "skipped":
+            print(f"\n⏭️ {name}: skipped, {result['skipped']}")
+            continue
+        if result["status"] == "failed":
+            failures += 1
+            print(f"\n❌ {name}: `import {result['module']}` failed\n{result['error']}")
+            continue
+
+        over = result["status"] == "over budget"
+        failures += over
+        status = "❌ over budget" if over else "✅"
+        print(f"\n⏱️ {name}: import {result['import_ms']:.1f} ms (budget {result['budget_ms']:g} ms), "
+              f"process {result['wall_ms']:.1f} ms, median of {result['runs']}  {status}")
+        for entry in result["slowest"]:
+            print(f"   {entry['self_ms']:>8.2f} ms  {entry['module']}")
+    return failures
+
+
+def to_markdown(results: List[Dict]) -> str:
+    lines = [
+        "## Import time (cold start)",
+        "",
+        "| Target | Import (ms) | Budget (ms) | Status |",
+        "|---|---:|---:|---|",
+    ]
+    labels = {"ok": "✅ ok", "over budget": "❌ over budget", "failed": "❌ import failed", "skipped": "⏭️ skipped"}
+    for r in results:
+        measured = f"{r['import_ms']:.1f}" if "import_ms" in r else "-"
+        note = f" ({r['skipped']})" if r["status"] == "skipped" else ""
+        lines.append(f"| `{r['target']}` | {measured} | {r['budget_ms']:g} | {labels[r['status']]}{note} |")
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Import-time (cold start) budget check")
+    parser.add_argument("--targets", default=",".join(TARGETS),
+                        help=f"Comma-separated targets (default: {','.join(TARGETS)})")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per target (default: 5)")
+    parser.add_argument("--top", type=int, default=10, help="Slowest imports listed per target (default: 10)")
+    parser.add_argument("--budget", action="append", metavar="TARGET=MS",
+                        help="Override a budget in milliseconds (repeatable)")
+    args = parser.parse_args(argv)
+
+    targets = [t.strip() for t in args.targets.split(",") if t.strip()]
+    unknown = [t for t in targets if t not in TARGETS]
+    if unknown:
+        parser.error(f"unknown target(s): {', '.join(unknown)}")
+    try:
+        budgets = parse_budgets(args.budget)
+    except argparse.ArgumentTypeError as e:
+        parser.error(str(e))
+
+    failures = print_results(check_targets(targets, budgets, args.runs, args.top))
+    if failures:
+        print(f"\n❌ {failures} target(s) failed the cold-start budget")
+        return 1
+    print("\n✅ All measured targets within their cold-start budgets")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,371 @@
+"""
+File: load_test.py
+
+Description:
+End-to-end load test for the Nuvai Flask API.
+
+Boots server.create_app() in a threaded WSGI server against local stand-ins
+(benchmarks/stand_ins.py: SQLite or a local Postgres, fakeredis, stub SMTP and AI servers),
+seeds test accounts, then drives /scan, /auth/login and /auth/register from concurrent
+keep-alive clients. Reports throughput, p50/p90/p99 latency and error rates per endpoint
+for each concurrency level, to size gunicorn workers and to check concurrency features.
+
+With --url the test drives an already running server instead (e.g. gunicorn started with
+the exports printed by `python -m benchmarks.stand_ins`); accounts are then seeded
+through /auth/register.
+
+Usage (from the project root):
+    python -m benchmarks.load_test --concurrency 1,4,16 --duration 20
+    python -m benchmarks.load_test --mix scan=1 --sizes 1KB=1,1MB=1 --output load.json
+    python -m benchmarks.load_test --url http://127.0.0.1:5000 --concurrency 32
+"""
+
+import argparse
+import http.client
+import json
+import logging
+import random
+import sys
+import threading
+import time
+import uuid
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from benchmarks.corpus import LANGUAGES, FILE_EXTENSIONS, generate_source, parse_size, format_size
+from benchmarks.run_benchmarks import percentile
+
+ENDPOINTS = {"scan": "/scan", "login": "/auth/login", "register": "/auth/register"}
+DEFAULT_MIX = "scan=8,login=1,register=1"
+DEFAULT_SIZES = "1KB=6,10KB=3,100KB=1"
+SEED_PASSWORD = "Load-test-password-1!"
+
+
+def parse_weights(value: str, allowed=None) -> List[Tuple[str, float]]:
+    """Parse 'a=3,b=1' (or 'a,b' for equal weights) into [(name, weight)]."""
+    weights = []
+    for item in value.split(","):
+        name, _, weight = item.strip().partition("=")
+        if not name:
+            continue
+        if allowed and name not in allowed:
+            raise argparse.ArgumentTypeError(f"unknown name {name!r} (expected one of: {', '.join(allowed)})")
+        weights.append((name, float(weight or 1)))
+    if not weights or sum(w for _, w in weights) <= 0:
+        raise argparse.ArgumentTypeError(f"invalid weights: {value!r}")
+    return weights
+
+
+def multipart_body(filename: str, content: bytes) -> Tuple[bytes, str]:
+    boundary = uuid.uuid4().hex
+    body = (
+        f"--{boundary}\r\n"
+        f"Content-Disposition: form-data; name=\"file\"; filename=\"{filename}\"\r\n"
+        f"Content-Type: application/octet-stream\r\n\r\n"
+    ).encode() + content + f"\r\n--{boundary}--\r\n".encode()
+    return body, f"multipart/form-data; boundary={boundary}"
+
+
+class Workload:
+    """Builds requests for the configured endpoint and file-size mixes."""
+
+    def __init__(self, mix, sizes, users: List[Dict], seed: int = 0):
+        self.ops, self.op_weights = zip(*mix)
+        self.users = users
+        self.run_id = uuid.uuid4().hex[:8]
+        self._registered = 0
+        self._lock = threading.Lock()
+
+        # Pre-built uploads: every size in the mix, cycling through the languages
+        self.uploads = []
+        self.upload_weights = []
+        for i, (size_name, weight) in enumerate(sizes):
+            size = parse_size(size_name)
+            for language in LANGUAGES:
+                code = generate_source(language, size, seed=seed + i).encode()
+                body, content_type = multipart_body(f"load_{format_size(size)}{FILE_EXTENSIONS[language]}", code)
+                self.uploads.append((body, content_type, len(code)))
+                self.upload_weights.append(weight / len(LANGUAGES))
+
+    def next_email(self) -> str:
+        with self._lock:
+            self._registered += 1
+            n = self._registered
+        return f"load-{self.run_id}-{n}@example.com"
+
+    def build(self, op: str, rng: random.Random) -> Tuple[str, bytes, str, int]:
+        """Return (path, body, content type, scanned bytes) for one request."""
+        if op == "scan":
+            body, content_type, size = rng.choices(self.uploads, self.upload_weights)[0]
+            return ENDPOINTS[op], body, content_type, size
+        if op == "login":
+            user = rng.choice(self.users)
+            payload = {"email": user["email"], "password": user["password"]}
+        else:
+            payload = {
+                "email": self.next_email(),
+                "password": SEED_PASSWORD,
+                "firstName": "Load",
+                "lastName": "Test",
+            }
+        return ENDPOINTS[op], json.dumps(payload).encode(), "application/json", 0
+
+    def pick(self, rng: random.Random) -> str:
+        return rng.choices(self.ops, self.op_weights)[0]
+
+
+def is_error(op: str, status: int, body: bytes) -> bool:
+    if status >= 400:
+        return True
+    if op == "scan":
+        # Per-file failures are reported inside a 200 response
+        try:
+            data = json.loads(body)
+        except ValueError:
+            return True
+        results = data if isinstance(data, list) else [data]
+        return any(isinstance(r, dict) and "error" in r for r in results)
+    return False
+
+
+def client_loop(base_url: str, workload: Workload, rng: random.Random, deadline: float,
+                samples: List[Tuple], max_requests: Optional[int], counter: List[int],
+                lock: threading.Lock) -> None:
+    parts = urlsplit(base_url)
+    connection_class = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+    conn = connection_class(parts.hostname, parts.port, timeout=60)
+    try:
+        while time.perf_counter() < deadline:
+            if max_requests is not None:
+                with lock:
+                    if counter[0] >= max_requests:
+                        return
+                    counter[0] += 1
+            op = workload.pick(rng)
+            path, body, content_type, size = workload.build(op, rng)
+            started = time.perf_counter()
+            try:
+                conn.request("POST", path, body=body, headers={"Content-Type": content_type})
+                response = conn.getresponse()
+                data = response.read()
+                status = response.status
+                failed = is_error(op, status, data)
+            except (OSError, http.client.HTTPException):
+                conn.close()  # reconnects on the next request
+                status, failed = 0, True
+            samples.append((op, status, time.perf_counter() - started, size, failed))
+    finally:
+        conn.close()
+
+
+def run_level(base_url: str, workload: Workload, concurrency: int, duration: float,
+              max_requests: Optional[int], seed: int) -> Dict:
+    samples: List[Tuple] = []
+    counter, lock = [0], threading.Lock()
+    started = time.perf_counter()
+    deadline = started + duration
+    threads = [
+        threading.Thread(
+            target=client_loop,
+            args=(base_url, workload, random.Random(f"{seed}:{concurrency}:{i}"), deadline,
+                  samples, max_requests, counter, lock),
+            daemon=True,
+        )
+        for i in range(concurrency)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    return summarize_level(samples, concurrency, elapsed)
+
+
+def summarize_samples(samples: List[Tuple], elapsed: float) -> Dict:
+    latencies = sorted(s[2] for s in samples)
+    errors = sum(1 for s in samples if s[4])
+    statuses: Dict[str, int] = {}
+    for s in samples:
+        key = str(s[1]) if s[1] else "connection_error"
+        statuses[key] = statuses.get(key, 0) + 1
+    scanned = sum(s[3] for s in samples)
+    summary = {
+        "requests": len(samples),
+        "errors": errors,
+        "error_rate": errors / len(samples) if samples else 0.0,
+        "throughput_rps": len(samples) / elapsed if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3) if latencies else None,
+        "p90_ms": round(percentile(latencies, 90) * 1000, 3) if latencies else None,
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3) if latencies else None,
+        "statuses": statuses,
+    }
+    if scanned:
+        summary["scanned_mb_per_s"] = round(scanned / elapsed / 1e6, 3)
+    return summary
+
+
+def summarize_level(samples: List[Tuple], concurrency: int, elapsed: float) -> Dict:
+    by_op: Dict[str, List[Tuple]] = {}
+    for s in samples:
+        by_op.setdefault(s[0], []).append(s)
+    return {
+        "concurrency": concurrency,
+        "elapsed_s": round(elapsed, 3),
+        "total": summarize_samples(samples, elapsed),
+        "endpoints": {op: summarize_samples(op_samples, elapsed) for op, op_samples in sorted(by_op.items())},
+    }
+
+
+def print_level(level: Dict) -> None:
+    print(f"\n👥 Concurrency {level['concurrency']} ({level['elapsed_s']:.1f}s)")
+    print(f"{'Endpoint':<10} {'Requests':>9} {'Req/s':>9} {'p50 (ms)':>10} {'p90 (ms)':>10} "
+          f"{'p99 (ms)':>10} {'Errors':>8} {'Rate':>7}")
+    rows = list(level["endpoints"].items()) + [("total", level["total"])]
+    for name, s in rows:
+        if not s["requests"]:
+            continue
+        print(f"{name:<10} {s['requests']:>9} {s['throughput_rps']:>9.1f} {s['p50_ms']:>10.2f} "
+              f"{s['p90_ms']:>10.2f} {s['p99_ms']:>10.2f} {s['errors']:>8} {s['error_rate']:>7.1%}")
+    statuses = ", ".join(f"{k}: {v}" for k, v in sorted(level["total"]["statuses"].items()))
+    print(f"Statuses: {statuses}")
+
+
+def seed_users_direct(count: int) -> List[Dict]:
+    from backend.src.models.user import User, UserRole
+
+    run_id = uuid.uuid4().hex[:8]
+    users = []
+    for n in range(count):
+        email = f"seed-{run_id}-{n}@example.com"
+        user = User(email=email, role=UserRole.USER)
+        user.set_password(SEED_PASSWORD)
+        user.save()
+        users.append({"email": email, "password": SEED_PASSWORD})
+    return users
+
+
+def seed_users_http(base_url: str, count: int) -> List[Dict]:
+    parts = urlsplit(base_url)
+    connection_class = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+    conn = connection_class(parts.hostname, parts.port, timeout=60)
+    run_id = uuid.uuid4().hex[:8]
+    users = []
+    try:
+        for n in range(count):
+            email = f"seed-{run_id}-{n}@example.com"
+            body = json.dumps({"email": email, "password": SEED_PASSWORD, "firstName": "Seed", "lastName": "User"})
+            conn.request("POST", ENDPOINTS["register"], body=body, headers={"Content-Type": "application/json"})
+            response = conn.getresponse()
+            response.read()
+            if response.status == 200:
+                users.append({"email": email, "password": SEED_PASSWORD})
+    finally:
+        conn.close()
+    if len(users) < count:
+        print(f"⚠️ Only {len(users)} of {count} seed accounts could be registered; logins will fail for the rest")
+    return users or [{"email": f"missing-{run_id}@example.com", "password": SEED_PASSWORD}]
+
+
+def boot_app(port: int):
+    """Import and start the API in a threaded WSGI server; stand-in env must already be set."""
+    try:
+        from backend.server import create_app
+    except ModuleNotFoundError as e:
+        raise RuntimeError(f"Cannot import backend.server: {e}") from e
+    from backend.src.core.db import init_db
+    from werkzeug.serving import make_server
+
+    init_db()
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+    server = make_server("127.0.0.1", port, create_app(), threaded=True)
+    thread = threading.Thread(target=server.serve_forever, name="nuvai-api", daemon=True)
+    thread.start()
+    return server
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Nuvai API load test")
+    parser.add_argument("--url", help="Drive a running server instead of booting one with stand-ins")
+    parser.add_argument("--concurrency", default="1,4,16",
+                        help="Comma-separated concurrent client counts, run in turn (default: 1,4,16)")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per concurrency level (default: 10)")
+    parser.add_argument("--requests", type=int, help="Stop each level after this many requests")
+    parser.add_argument("--mix", type=lambda v: parse_weights(v, ENDPOINTS), default=parse_weights(DEFAULT_MIX),
+                        help=f"Endpoint weights (default: {DEFAULT_MIX})")
+    parser.add_argument("--sizes", type=parse_weights, default=parse_weights(DEFAULT_SIZES),
+                        help=f"Upload size weights for /scan (default: {DEFAULT_SIZES})")
+    parser.add_argument("--users", type=int, default=20, help="Seeded accounts used by /auth/login (default: 20)")
+    parser.add_argument("--warmup", type=int, default=20, help="Unmeasured requests before the first level")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--database-url", help="Database for the booted app (default: temporary SQLite)")
+    parser.add_argument("--redis-url", help="Redis for the booted app (default: fakeredis)")
+    parser.add_argument("--ai-latency-ms", type=float, default=0.0, help="Delay of the stub AI server")
+    parser.add_argument("--max-error-rate", type=float,
+                        help="Exit non-zero when any level's total error rate exceeds this fraction")
+    parser.add_argument("--output", help="JSON results path")
+    args = parser.parse_args(argv)
+
+    try:
+        levels = [int(c) for c in args.concurrency.split(",") if c.strip()]
+    except ValueError:
+        parser.error(f"invalid --concurrency: {args.concurrency!r}")
+
+    stand_ins = server = None
+    try:
+        if args.url:
+            base_url = args.url.rstrip("/")
+            users = seed_users_http(base_url, args.users)
+        else:
+            from benchmarks.stand_ins import free_port, start_stand_ins
+
+            stand_ins = start_stand_ins(args.database_url, args.redis_url, args.ai_latency_ms)
+            port = free_port()
+            server = boot_app(port)
+            base_url = f"http://127.0.0.1:{port}"
+            users = seed_users_direct(args.users)
+        print(f"🚀 Load testing {base_url} with {len(users)} seeded account(s)")
+
+        workload = Workload(args.mix, args.sizes, users, args.seed)
+        if args.warmup:
+            run_level(base_url, workload, 1, float("inf"), args.warmup, args.seed)
+
+        levels_report = []
+        for concurrency in levels:
+            level = run_level(base_url, workload, concurrency, args.duration, args.requests, args.seed)
+            print_level(level)
+            levels_report.append(level)
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        return 2
+    finally:
+        if server is not None:
+            server.shutdown()
+        if stand_ins is not None:
+            stand_ins.stop()
+
+    report = {
+        "meta": {
+            "url": args.url or "in-process",
+            "mix": dict(args.mix),
+            "sizes": dict(args.sizes),
+            "duration_s": args.duration,
+            "requests": args.requests,
+            "stand_ins": stand_ins.stats() if stand_ins else None,
+        },
+        "levels": levels_report,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n📁 Load test results saved to: {args.output}")
+
+    if args.max_error_rate is not None:
+        failing = [lv["concurrency"] for lv in levels_report if lv["total"]["error_rate"] > args.max_error_rate]
+        if failing:
+            print(f"❌ Error rate above {args.max_error_rate:.1%} at concurrency {', '.join(map(str, failing))}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
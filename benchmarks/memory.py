@@ -0,0 +1,329 @@
+"""
+File: memory.py
+
+Description:
+tracemalloc-based memory harness for the Nuvai scan pipeline, with budgets.
+
+Every pipeline stage runs on its own, on deterministic corpora with a trailing newline (as
+real files have), so that each full-string copy shows up where it is made:
+- read: run.load_code() (file read and UTF-8 decode)
+- strip: the code.strip() done by scan_code_controller and again by scan_code
+- is_binary_content: the encode().decode() round-trip in scanner_controller
+- scan_code: src.nuvai.scanner.scan_code (CLI engine)
+- api_scan: backend.src.nuvai.scanner.scan_code (engine behind /scan)
+- scan_code_controller: validation + scan, as a whole, on clean input that passes the
+  controller's validation (capped at its 2 MB upload limit)
+- directory_scan: run.process_file over one file per language (folder scans); files are
+  scanned one after another, so its budget is keyed on the per-file size
+
+For each stage and size it reports peak traced memory above the pre-stage level, memory
+still held by the result, bytes per MB scanned and the top allocation sites at the peak
+(snapshotted by a profile hook on a second run, so the hook does not skew the numbers).
+Peaks are checked against benchmarks/memory_budgets.json (peak <= per_mb * MB scanned +
+overhead); the command exits non-zero on a breach. The same check runs as part of the
+regression gate (python -m benchmarks.compare --run, at GATE_SIZES).
+
+Usage (from the project root):
+    python -m benchmarks.memory
+    python -m benchmarks.memory --sizes 2MB --stages scan_code,api_scan --top 10
+    python -m benchmarks.memory --update-budgets      # accept the current numbers (+ headroom)
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.corpus import (
+    LANGUAGES, FILE_EXTENSIONS, generate_source, generate_upload_source, parse_size, format_size,
+)
+
+STAGES = ("read", "strip", "is_binary_content", "scan_code", "api_scan", "scan_code_controller", "directory_scan")
+DEFAULT_SIZES = "100KB,1MB,2MB"
+GATE_SIZES = "100KB,1MB"
+DEFAULT_BUDGETS = "benchmarks/memory_budgets.json"
+BUDGET_HEADROOM = 1.25
+MB = 1024 * 1024
+
+
+def build_stage(stage: str, language: str, path: str, code: str) -> Callable[[], object]:
+    if stage == "read":
+        from run import load_code
+        return lambda: load_code(path)
+    if stage == "strip":
+        return code.strip
+    if stage == "is_binary_content":
+        from backend.scanner_controller import is_binary_content
+        return lambda: is_binary_content(code)
+    if stage == "scan_code":
+        from src.nuvai.scanner import scan_code
+        return lambda: scan_code(code, language)
+    if stage == "api_scan":
+        from backend.src.nuvai.scanner import scan_code as api_scan_code
+        return lambda: api_scan_code(code, language)
+    if stage == "scan_code_controller":
+        from backend.scanner_controller import scan_code_controller
+        # The scan corpus trips the controller's blocked patterns; measure a scan, not a rejection
+        upload = generate_upload_source(language, len(code))
+        return lambda: scan_code_controller(upload, os.path.basename(path))
+    raise ValueError(f"unknown stage: {stage}")
+
+
+def build_directory_scan(paths: List[str]) -> Callable[[], object]:
+    from run import process_file
+
+    def scan_directory():
+        findings = []
+        # process_file prints every finding; only memory is of interest here
+        with contextlib.redirect_stdout(io.StringIO()):
+            for path in paths:
+                findings.extend(process_file(path))
+        return findings
+
+    return scan_directory
+
+
+def is_own_frame(trace_filename: str) -> bool:
+    return trace_filename == __file__ or "tracemalloc" in trace_filename
+
+
+def peak_snapshot(fn: Callable[[], object], min_step: int):
+    """
+    Run fn with a profile hook that snapshots the traces whenever traced memory reaches a
+    new high (by at least min_step bytes), so transient copies are attributed to their sites.
+    """
+    best = {"current": -1, "snapshot": None}
+
+    def hook(frame, event, arg):
+        if event in ("return", "c_return"):
+            current = tracemalloc.get_traced_memory()[0]
+            if current >= best["current"] + min_step:
+                best["current"] = current
+                best["snapshot"] = tracemalloc.take_snapshot()
+
+    sys.setprofile(hook)
+    try:
+        fn()
+    finally:
+        sys.setprofile(None)
+    return best["snapshot"]
+
+
+def top_sites(snapshot, before, top: int) -> List[Dict]:
+    sites = []
+    if snapshot is None:
+        return sites
+    for stat in snapshot.compare_to(before, "lineno"):
+        frame = stat.traceback[0]
+        if stat.size_diff <= 0 or is_own_frame(frame.filename):
+            continue
+        sites.append({
+            "site": f"{os.path.relpath(frame.filename)}:{frame.lineno}",
+            "bytes": stat.size_diff,
+            "blocks": stat.count_diff,
+        })
+        if len(sites) >= top:
+            break
+    return sites
+
+
+def measure_stage(fn: Callable[[], object], size: int, top: int) -> Dict:
+    fn()  # warm-up: imports, regex compilation and caches are not per-scan costs
+    gc.collect()
+    baseline, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    result = fn()
+    current, peak = tracemalloc.get_traced_memory()
+    del result
+    if top <= 0:
+        return {"peak_bytes": peak - baseline, "retained_bytes": current - baseline, "top_sites": []}
+
+    # Second, hooked run: slower, so it only attributes the peak and does not measure it
+    gc.collect()
+    before = tracemalloc.take_snapshot()
+    snapshot = peak_snapshot(fn, max(4096, size // 100))
+    return {
+        "peak_bytes": peak - baseline,
+        "retained_bytes": current - baseline,
+        "top_sites": top_sites(snapshot, before, top),
+    }
+
+
+def budget_for(budgets: Dict, stage: str) -> Optional[Dict]:
+    return budgets.get("stages", {}).get(stage)
+
+
+def check_budget(result: Dict, budget: Optional[Dict]) -> Optional[bool]:
+    if budget is None:
+        return None
+    allowed = budget["per_mb"] * result["size"] / MB + budget["overhead"]
+    result["budget_bytes"] = int(allowed)
+    return result["peak_bytes"] <= allowed
+
+
+def run(languages, sizes, stages, top: int, budgets: Dict, on_result=None) -> Dict:
+    results = []
+    workdir = tempfile.mkdtemp(prefix="nuvai-memory-")
+    tracemalloc.start()
+    try:
+        for size in sizes:
+            paths = []
+            for language in languages:
+                # Trailing newline as in real files, so strip() copies like it does in production
+                code = generate_source(language, size - 1) + "\n"
+                path = os.path.join(workdir, f"sample_{format_size(size)}{FILE_EXTENSIONS[language]}")
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write(code)
+                paths.append(path)
+
+                for stage in stages:
+                    if stage == "directory_scan":
+                        continue
+                    result = {"stage": stage, "language": language, "size": size,
+                              **measure_stage(build_stage(stage, language, path, code), size, top)}
+                    results.append(result)
+                    if on_result:
+                        on_result(result, check_budget(result, budget_for(budgets, stage)))
+                del code
+
+            if "directory_scan" in stages:
+                # Peak follows the largest file, not the total: files are scanned one at a time
+                result = {"stage": "directory_scan", "language": "*", "size": size, "files": len(paths),
+                          **measure_stage(build_directory_scan(paths), size, top)}
+                results.append(result)
+                if on_result:
+                    on_result(result, check_budget(result, budget_for(budgets, "directory_scan")))
+    finally:
+        tracemalloc.stop()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    for result in results:
+        result["bytes_per_mb"] = int(result["peak_bytes"] / (result["size"] / MB))
+        result["within_budget"] = check_budget(result, budget_for(budgets, result["stage"]))
+    return {"results": results, "breaches": [r for r in results if r["within_budget"] is False]}
+
+
+def fit_budgets(results: List[Dict], headroom: float = BUDGET_HEADROOM) -> Dict:
+    """Smallest per-MB slope and overhead (with headroom) that cover every measured peak."""
+    stages = {}
+    for stage in sorted({r["stage"] for r in results}):
+        rows = [r for r in results if r["stage"] == stage]
+        per_mb = max(r["peak_bytes"] / (r["size"] / MB) for r in rows if r["size"] >= MB) \
+            if any(r["size"] >= MB for r in rows) else 0.0
+        overhead = max(max(r["peak_bytes"] - per_mb * r["size"] / MB for r in rows), 0.0)
+        stages[stage] = {"per_mb": int(per_mb * headroom), "overhead": int(overhead * headroom) + 64 * 1024}
+    return {"headroom": headroom, "stages": stages}
+
+
+def load_budgets(path: str) -> Dict:
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def check_budgets(budgets_path: str = DEFAULT_BUDGETS, sizes: str = GATE_SIZES, on_result=None) -> Dict:
+    """Every stage and language at `sizes` against the committed budgets (no site attribution)."""
+    budgets = load_budgets(budgets_path)
+    if not budgets:
+        raise FileNotFoundError(f"no memory budgets at {budgets_path}")
+    return run(list(LANGUAGES), [parse_size(s) for s in sizes.split(",")], list(STAGES), 0, budgets,
+               on_result=on_result)
+
+
+def to_markdown(report: Dict) -> str:
+    breaches = report["breaches"]
+    lines = [
+        "## Memory budgets",
+        "",
+        f"**{len(breaches)} breach(es)** in {len(report['results'])} measurement(s).",
+    ]
+    if breaches:
+        lines += ["", "| Stage | Language | Size | Peak | Budget |", "|---|---|---:|---:|---:|"]
+        for r in breaches:
+            lines.append(f"| `{r['stage']}` | {r['language']} | {format_size(r['size'])} "
+                         f"| {format_bytes(r['peak_bytes'])} | {format_bytes(r['budget_bytes'])} |")
+    return "\n".join(lines) + "\n"
+
+
+def format_bytes(n: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(n) < 1024 or unit == "GB":
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+
+
+def print_result(result: Dict, within_budget: Optional[bool]) -> None:
+    status = {None: "", True: "✅", False: "❌ over budget"}[within_budget]
+    per_mb = result["peak_bytes"] / (result["size"] / MB)
+    print(f"{result['stage']:<21} {result['language']:<11} {format_size(result['size']):>6}  "
+          f"peak {format_bytes(result['peak_bytes']):>9}  held {format_bytes(result['retained_bytes']):>9}  "
+          f"{format_bytes(per_mb):>9}/MB  {status}")
+
+
+def print_top_sites(results: List[Dict]) -> None:
+    worst: Dict[str, Dict] = {}
+    for r in results:
+        if r["top_sites"] and r["peak_bytes"] > worst.get(r["stage"], {"peak_bytes": -1})["peak_bytes"]:
+            worst[r["stage"]] = r
+    for stage, r in worst.items():
+        print(f"\n🔎 {stage} ({r['language']}, {format_size(r['size'])}): allocation sites at peak")
+        for site in r["top_sites"]:
+            print(f"   {format_bytes(site['bytes']):>9} in {site['blocks']:>6} block(s)  {site['site']}")
+
+
+def parse_list(value: str, allowed) -> List[str]:
+    items = [v.strip().lower() for v in value.split(",") if v.strip()]
+    invalid = [v for v in items if v not in allowed]
+    if not items or invalid:
+        raise argparse.ArgumentTypeError(f"invalid value(s): {', '.join(invalid) or value!r}")
+    return items
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Nuvai scan pipeline memory harness")
+    parser.add_argument("--languages", type=lambda v: parse_list(v, LANGUAGES), default=list(LANGUAGES))
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help=f"Comma-separated sizes (default: {DEFAULT_SIZES})")
+    parser.add_argument("--stages", type=lambda v: parse_list(v, STAGES), default=list(STAGES))
+    parser.add_argument("--top", type=int, default=5, help="Allocation sites reported per stage (default: 5)")
+    parser.add_argument("--budgets", default=DEFAULT_BUDGETS)
+    parser.add_argument("--update-budgets", action="store_true",
+                        help=f"Write budgets covering this run (x{BUDGET_HEADROOM:g} headroom) instead of checking")
+    parser.add_argument("--output", help="JSON results path")
+    args = parser.parse_args(argv)
+
+    sizes = [parse_size(s) for s in args.sizes.split(",")]
+    budgets = {} if args.update_budgets else load_budgets(args.budgets)
+
+    print(f"🧠 Tracing {len(args.stages)} stage(s) x {len(args.languages)} language(s) x {len(sizes)} size(s)")
+    report = run(args.languages, sizes, args.stages, args.top, budgets, on_result=print_result)
+    print_top_sites(report["results"])
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n📁 Memory results saved to: {args.output}")
+
+    if args.update_budgets:
+        with open(args.budgets, "w", encoding="utf-8") as f:
+            json.dump(fit_budgets(report["results"]), f, indent=2)
+            f.write("\n")
+        print(f"\n📁 Memory budgets updated: {args.budgets}")
+        return 0
+
+    if report["breaches"]:
+        print(f"\n❌ {len(report['breaches'])} stage(s) over their memory budget")
+        return 1
+    print("\n✅ All stages within their memory budgets" if budgets else "\n⚠️ No memory budgets found")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
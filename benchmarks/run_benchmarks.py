@@ -0,0 +1,206 @@
+"""
+File: run_benchmarks.py
+
+Description:
+Benchmark suite for the Nuvai scanning engine on deterministic synthetic corpora.
+
+For every language and file size, measures latency percentiles and throughput (MB/s) of:
+- scan_code (src.nuvai.scanner)
+- get_language (extension lookup and content-signature fallback)
+- scanner_controller.scan_code_controller (validation + scan, as used by the backend), on
+  clean inputs that pass validation, capped at the controller's 2 MB upload limit
+- report_saver.save_report (JSON report of the scan findings)
+
+Results are written as JSON, raw samples included; benchmarks/compare.py checks a run
+against the committed baseline.
+
+Usage (from the project root):
+    python -m benchmarks.run_benchmarks
+    python -m benchmarks.run_benchmarks --languages python,php --sizes 1KB,1MB --density 0.05
+    python -m benchmarks.run_benchmarks --quick --output bench.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Tuple
+
+from benchmarks.corpus import (
+    LANGUAGES, FILE_EXTENSIONS, generate_source, generate_upload_source, parse_size, format_size,
+)
+
+DEFAULT_SIZES = "1KB,10KB,100KB,1MB,10MB"
+QUICK_SIZES = "1KB,100KB"
+BENCHMARKS = ("scan_code", "get_language", "scan_code_controller", "save_report")
+
+
+def measure(fn: Callable[[], object], repeat: int, min_time: float, max_runs: int = 1000) -> List[float]:
+    """Run fn at least `repeat` times and until `min_time` seconds have been spent."""
+    fn()  # warm-up: imports, regex compilation, caches
+    samples = []
+    spent = 0.0
+    while len(samples) < repeat or (spent < min_time and len(samples) < max_runs):
+        started = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - started
+        samples.append(elapsed)
+        spent += elapsed
+    return samples
+
+
+def percentile(ordered: List[float], pct: float) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def summarize(samples: List[float], size: int) -> Dict:
+    ordered = sorted(samples)
+    median = statistics.median(ordered)
+    mad = statistics.median(abs(s - median) for s in ordered)
+    return {
+        "runs": len(samples),
+        "median_s": median,
+        "mad_s": mad,
+        "p50_ms": round(percentile(ordered, 50) * 1000, 4),
+        "p90_ms": round(percentile(ordered, 90) * 1000, 4),
+        "p99_ms": round(percentile(ordered, 99) * 1000, 4),
+        "mb_per_s": round(size / median / 1e6, 3) if median else None,
+        "samples_s": samples,
+    }
+
+
+def build_cases(language: str, code: str, seed: int = 0) -> Dict[str, Tuple[Callable[[], object], int]]:
+    """Benchmark name -> (callable, bytes of input it processes)."""
+    from src.nuvai.scanner import get_language, scan_code
+    from src.nuvai.report_saver import save_report
+    from backend.scanner_controller import scan_code_controller, is_potentially_malicious
+
+    filename = "sample" + FILE_EXTENSIONS[language]
+    findings = scan_code(code, language)
+    # Generated vulnerable lines (and some headers) are blocked by the controller, which would
+    # then time its rejection path instead of the scan
+    upload = generate_upload_source(language, len(code), seed)
+    if is_potentially_malicious(upload):
+        raise RuntimeError(f"{language} upload corpus is blocked by scanner_controller")
+
+    def save():
+        for path in save_report(findings, "json"):
+            os.remove(path)
+
+    return {
+        "scan_code": (lambda: scan_code(code, language), len(code)),
+        # No extension: exercises the content-signature fallback
+        "get_language": (lambda: get_language("sample", code), len(code)),
+        "scan_code_controller": (lambda: scan_code_controller(upload, filename), len(upload)),
+        "save_report": (save, len(code)),
+    }
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def run(languages, sizes, benchmarks, density, seed, repeat, min_time, on_result=None) -> Dict:
+    results = []
+    # save_report writes to ~/security_reports; keep benchmark reports out of the user's home
+    report_home = tempfile.mkdtemp(prefix="nuvai-bench-")
+    previous_home = os.environ.get("HOME")
+    os.environ["HOME"] = report_home
+    try:
+        for language in languages:
+            for size in sizes:
+                code = generate_source(language, size, density, seed)
+                cases = build_cases(language, code, seed)
+                for name in benchmarks:
+                    fn, input_size = cases[name]
+                    samples = measure(fn, repeat, min_time)
+                    result = {
+                        "name": f"{name}[{language}-{format_size(size)}]",
+                        "benchmark": name,
+                        "language": language,
+                        "size": size,
+                        "input_size": input_size,
+                        **summarize(samples, input_size),
+                    }
+                    results.append(result)
+                    if on_result:
+                        on_result(result)
+    finally:
+        if previous_home is None:
+            os.environ.pop("HOME", None)
+        else:
+            os.environ["HOME"] = previous_home
+        shutil.rmtree(report_home, ignore_errors=True)
+
+    return {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(),
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "density": density,
+            "seed": seed,
+            "repeat": repeat,
+            "min_time_s": min_time,
+        },
+        "results": results,
+    }
+
+
+def print_result(result: Dict) -> None:
+    print(
+        f"{result['name']:<44} {result['runs']:>5} runs  p50 {result['p50_ms']:>10.3f} ms  "
+        f"p99 {result['p99_ms']:>10.3f} ms  {result['mb_per_s'] or 0:>9.2f} MB/s"
+    )
+
+
+def parse_list(value: str, allowed=None) -> List[str]:
+    items = [v.strip().lower() for v in value.split(",") if v.strip()]
+    invalid = [v for v in items if allowed and v not in allowed]
+    if not items or invalid:
+        raise argparse.ArgumentTypeError(f"invalid value(s): {', '.join(invalid) or value!r}")
+    return items
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Nuvai scanner benchmarks")
+    parser.add_argument("--languages", type=lambda v: parse_list(v, LANGUAGES), default=list(LANGUAGES))
+    parser.add_argument("--sizes", default=None, help=f"Comma-separated sizes (default: {DEFAULT_SIZES})")
+    parser.add_argument("--benchmarks", type=lambda v: parse_list(v, BENCHMARKS), default=list(BENCHMARKS))
+    parser.add_argument("--density", type=float, default=0.01,
+                        help="Fraction of generated blocks that are vulnerable lines (default: 0.01)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5, help="Minimum runs per benchmark (default: 5)")
+    parser.add_argument("--min-time", type=float, default=0.5,
+                        help="Minimum seconds spent per benchmark (default: 0.5)")
+    parser.add_argument("--quick", action="store_true", help=f"Small sizes only ({QUICK_SIZES}), fewer runs")
+    parser.add_argument("--output", default="benchmark_results.json", help="JSON results path")
+    args = parser.parse_args(argv)
+
+    sizes = [parse_size(s) for s in (args.sizes or (QUICK_SIZES if args.quick else DEFAULT_SIZES)).split(",")]
+    if args.quick:
+        args.repeat, args.min_time = min(args.repeat, 3), min(args.min_time, 0.1)
+
+    print(f"⏱️ Benchmarking {len(args.languages)} language(s) x {len(sizes)} size(s) x {len(args.benchmarks)} benchmark(s)")
+    report = run(args.languages, sizes, args.benchmarks, args.density, args.seed,
+                 args.repeat, args.min_time, on_result=print_result)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\n📁 Benchmark results saved to: {args.output}")
+    return report
+
+
+if __name__ == "__main__":
+    main()
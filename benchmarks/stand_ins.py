@@ -0,0 +1,329 @@
+"""
+File: stand_ins.py
+
+Description:
+Local stand-ins for the external services the Nuvai API talks to, so the app can be
+booted and load-tested on one machine without touching real infrastructure.
+
+Features:
+- SQLite database in a temporary directory (DATABASE_URL), or any URL given, e.g. a
+  throwaway local Postgres
+- fakeredis TCP server (REDIS_URL); requires `pip install fakeredis`
+- StubSMTPServer: accepts and counts plain SMTP messages (STARTTLS is refused, so
+  password-reset mail fails fast instead of reaching a real server)
+- StubAIServer: OpenAI-compatible /v1/chat/completions with canned, optionally
+  delayed, plain and streamed responses; faults (HTTP errors, dropped connections,
+  slow replies) can be queued with inject() to exercise the client's retries,
+  circuit breaker and deadlines
+
+start_stand_ins() starts everything and returns the environment variables that point
+the app at them; it must run before backend.server is imported.
+
+Usage (from the project root), e.g. to load-test gunicorn against the same stand-ins:
+    python -m benchmarks.stand_ins        # prints the exports, runs until Ctrl+C
+"""
+
+import json
+import os
+import shutil
+import socket
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+STUB_AI_REPLY = "Stub analysis: review the reported findings and apply the recommendations."
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _serve(server) -> threading.Thread:
+    thread = threading.Thread(target=server.serve_forever, name=type(server).__name__, daemon=True)
+    thread.start()
+    return thread
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    def reply(self, line: str) -> None:
+        self.wfile.write(line.encode() + b"\r\n")
+
+    def handle(self):
+        self.reply("220 nuvai-stub-smtp ready")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode("utf-8", "replace").strip().split(" ", 1)[0].upper()
+            if command == "EHLO":
+                self.wfile.write(b"250-nuvai-stub-smtp\r\n250 AUTH PLAIN LOGIN\r\n")
+            elif command in ("HELO", "MAIL", "RCPT", "RSET", "NOOP"):
+                self.reply("250 OK")
+            elif command == "AUTH":
+                self.reply("235 Authentication successful")
+            elif command == "STARTTLS":
+                self.reply("454 TLS not available on the stub server")
+            elif command == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                while self.rfile.readline() not in (b".\r\n", b".\n", b""):
+                    pass
+                self.server.count_message()
+                self.reply("250 OK: queued")
+            elif command == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("502 Command not implemented")
+
+
+class StubSMTPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, port: int = 0):
+        super().__init__(("127.0.0.1", port), _SMTPHandler)
+        self.messages = 0
+        self._lock = threading.Lock()
+
+    def count_message(self) -> None:
+        with self._lock:
+            self.messages += 1
+
+
+class _AIHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass  # keep load-test output readable
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)) or 0)
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self.send_error(404)
+            return
+        try:
+            payload = json.loads(body or b"{}")
+        except ValueError:
+            self.send_error(400)
+            return
+
+        fault = self.server.count_call()
+        if fault is not None:
+            kind, value = fault
+            if kind == "drop":
+                # Close without a response: the client sees a dropped connection
+                self.close_connection = True
+                return
+            if kind == "status":
+                self._send_json({"error": {"message": f"Injected {value} error", "type": "stub_error",
+                                           "code": value}}, status=value)
+                return
+            time.sleep(value)  # "delay"
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        model = payload.get("model", "stub")
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+        if payload.get("stream"):
+            self._stream(completion_id, model)
+        else:
+            self._send_json({
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": STUB_AI_REPLY},
+                    "finish_reason": "stop",
+                }],
+                "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+            })
+
+    def _send_json(self, data: Dict, status: int = 200) -> None:
+        encoded = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(encoded)))
+        self.end_headers()
+        self.wfile.write(encoded)
+
+    def _stream(self, completion_id: str, model: str) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        words = STUB_AI_REPLY.split(" ")
+        for i, word in enumerate(words):
+            self._event(completion_id, model, {"content": word + (" " if i < len(words) - 1 else "")}, None)
+        self._event(completion_id, model, {}, "stop")
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.close_connection = True
+
+    def _event(self, completion_id: str, model: str, delta: Dict, finish_reason: Optional[str]) -> None:
+        chunk = {
+            "id": completion_id,
+            "object": "chat.completion.chunk",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+        }
+        self.wfile.write(b"data: " + json.dumps(chunk).encode() + b"\n\n")
+
+
+class StubAIServer(ThreadingHTTPServer):
+    """
+    Faults are consumed one per request, in order; once the queue is empty the
+    server answers normally again. Supported faults:
+    - an HTTP status code (e.g. 429, 500, 503): JSON error response
+    - "drop": the connection is closed without a response
+    - ("delay", seconds): the normal response, sent after a pause
+    """
+
+    daemon_threads = True
+
+    def __init__(self, port: int = 0, latency_ms: float = 0.0):
+        super().__init__(("127.0.0.1", port), _AIHandler)
+        self.latency = latency_ms / 1000
+        self.calls = 0
+        self._faults = deque()
+        self._lock = threading.Lock()
+
+    def inject(self, *faults) -> None:
+        parsed = []
+        for fault in faults:
+            if isinstance(fault, int):
+                parsed.append(("status", fault))
+            elif fault == "drop":
+                parsed.append(("drop", None))
+            elif isinstance(fault, tuple) and len(fault) == 2 and fault[0] == "delay":
+                parsed.append(("delay", float(fault[1])))
+            else:
+                raise ValueError(f"unsupported fault: {fault!r}")
+        with self._lock:
+            self._faults.extend(parsed)
+
+    def count_call(self):
+        """Count the request and return the next queued fault, if any."""
+        with self._lock:
+            self.calls += 1
+            return self._faults.popleft() if self._faults else None
+
+    def handle_error(self, request, client_address):
+        # Clients that gave up (deadline tests) reset the connection mid-response
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+def start_fake_redis():
+    try:
+        from fakeredis import TcpFakeServer
+    except ImportError as e:
+        raise RuntimeError("fakeredis with TcpFakeServer is required for the Redis stand-in "
+                           "(pip install fakeredis), or pass a Redis URL") from e
+    server = TcpFakeServer(("127.0.0.1", free_port()), server_type="redis")
+    _serve(server)
+    return server
+
+
+class StandIns:
+    """Running stand-ins; env holds the variables that point the app at them."""
+
+    def __init__(self):
+        self.env: Dict[str, str] = {}
+        self.smtp: Optional[StubSMTPServer] = None
+        self.ai: Optional[StubAIServer] = None
+        self._servers: List = []
+        self._tmpdir: Optional[str] = None
+
+    def stats(self) -> Dict:
+        return {
+            "smtp_messages": self.smtp.messages if self.smtp else None,
+            "ai_calls": self.ai.calls if self.ai else None,
+        }
+
+    def stop(self) -> None:
+        for server in self._servers:
+            server.shutdown()
+            server.server_close()
+        self._servers = []
+        if self._tmpdir:
+            shutil.rmtree(self._tmpdir, ignore_errors=True)
+            self._tmpdir = None
+
+
+def start_stand_ins(database_url: Optional[str] = None, redis_url: Optional[str] = None,
+                    ai_latency_ms: float = 0.0, apply_env: bool = True) -> StandIns:
+    stand_ins = StandIns()
+    try:
+        if not database_url:
+            stand_ins._tmpdir = tempfile.mkdtemp(prefix="nuvai-load-")
+            database_url = "sqlite:///" + os.path.join(stand_ins._tmpdir, "nuvai.db")
+
+        if not redis_url:
+            redis_server = start_fake_redis()
+            stand_ins._servers.append(redis_server)
+            host, port = redis_server.server_address[:2]
+            redis_url = f"redis://{host}:{port}/0"
+
+        stand_ins.smtp = StubSMTPServer()
+        _serve(stand_ins.smtp)
+        stand_ins._servers.append(stand_ins.smtp)
+
+        stand_ins.ai = StubAIServer(latency_ms=ai_latency_ms)
+        _serve(stand_ins.ai)
+        stand_ins._servers.append(stand_ins.ai)
+    except Exception:
+        stand_ins.stop()
+        raise
+
+    stand_ins.env = {
+        "DATABASE_URL": database_url,
+        "REDIS_URL": redis_url,
+        "SMTP_SERVER": "127.0.0.1",
+        "SMTP_PORT": str(stand_ins.smtp.server_address[1]),
+        "SMTP_USER": "load-test",
+        "SMTP_PASSWORD": "load-test",
+        "MAIL_FROM": "load-test@localhost",
+        "OPENAI_BASE_URL": f"http://127.0.0.1:{stand_ins.ai.server_address[1]}/v1",
+        "OPENAI_API_KEY": "stub-key",
+        "JWT_SECRET": os.getenv("JWT_SECRET") or uuid.uuid4().hex,
+    }
+    if apply_env:
+        os.environ.update(stand_ins.env)
+    return stand_ins
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run local stand-ins for the Nuvai API")
+    parser.add_argument("--database-url", help="Use this database instead of a temporary SQLite file")
+    parser.add_argument("--redis-url", help="Use this Redis instead of fakeredis")
+    parser.add_argument("--ai-latency-ms", type=float, default=0.0, help="Delay of the stub AI server")
+    args = parser.parse_args()
+
+    stand_ins = start_stand_ins(args.database_url, args.redis_url, args.ai_latency_ms, apply_env=False)
+    print("🧪 Stand-ins running; point the API at them with:\n")
+    for key, value in stand_ins.env.items():
+        print(f"export {key}={value}")
+    print("\nPress Ctrl+C to stop.")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stand_ins.stop()
+        print(f"\n🛑 Stand-ins stopped: {stand_ins.stats()}")
+
+
+if __name__ == "__main__":
+    main()
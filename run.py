@@ -10,8 +10,13 @@ Features:
 - Auto-detects code language by file extension or content
 - Runs static analysis using language-specific modules
 - Outputs clear terminal results and saves report to file
-- Supports export formats: json, txt, html, pdf (auto fallback if PDF not available)
-- Prompts user for export format and filename
+- Supports export formats: json, ndjson, txt, html, html-app, pdf, sarif, sqlite (auto fallback if PDF not available)
+- Optionally adds rule ids and finding locations to JSON reports with --locations
+- Prompts user for export format and filename, or streams the report(s) while scanning with --format
+- Renders PDF reports in a background process so other formats are not held up
+- Aggregates findings across files by rule, with occurrence counts and top offenders
+- Writes one entry per rule with its list of occurrences instead of one per finding with --aggregate
+- Profiles per-rule scan time, throughput and hit counts with --profile (table + JSON)
 - Provides contextual security improvement suggestions based on findings
 - Handles unexpected input or format errors gracefully
 
@@ -20,10 +25,18 @@ Suitable for technical and non-technical users.
 
 import argparse
 import os
-from src.nuvai.scanner import get_language, scan_code
-from src.nuvai.report_saver import save_report
+from datetime import datetime
+from src.nuvai.scanner import get_language, scan_code, GUIDANCE_RULE
+from src.nuvai.report_saver import save_report, open_report_writer, start_pdf_report, ensure_report_directory
+from src.nuvai.aggregate import FindingAggregator
+from src.nuvai.profiler import enable_profiling, disable_profiling
 
 SUPPORTED_EXTENSIONS = [".py", ".js", ".html", ".jsx", ".php", ".cpp", ".ts"]
+EXPORT_FORMATS = ["json", "ndjson", "txt", "html", "html-app", "pdf", "sarif", "sqlite"]
+# Formats that can hold a rule's occurrence list (--aggregate)
+AGGREGATED_FORMATS = ["json", "ndjson"]
+# File-independent advice, written to reports once rather than once per scanned file
+COLLAPSED_RULES = (GUIDANCE_RULE,)
 
 def load_code(file_path):
     try:
@@ -62,13 +75,91 @@ def print_results(file_path, findings):
         for tip in sorted(unique_tips):
             print(f"- {tip}")
 
-def prompt_export_settings():
+def prompt_export_settings(formats=EXPORT_FORMATS):
     print("\n💾 Export Report")
-    format_choice = input("Select export format (json / txt / html / pdf): ").strip().lower()
-    while format_choice not in ["json", "txt", "html", "pdf"]:
-        format_choice = input("❗ Invalid format. Please choose from (json / txt / html / pdf): ").strip().lower()
+    choices = " / ".join(formats)
+    format_choice = input(f"Select export format ({choices}): ").strip().lower()
+    while format_choice not in formats:
+        format_choice = input(f"❗ Invalid format. Please choose from ({choices}): ").strip().lower()
     return format_choice
 
+def print_aggregate_summary(aggregate, top=5):
+    if aggregate.file_count < 2:
+        return
+    print(f"\n📊 Summary: {aggregate.total} findings in {aggregate.file_count} files")
+    print("\n🔁 Most frequent rules:")
+    for o in aggregate.top_rules(top):
+        print(f"- [{o.rule.severity.name}] {o.rule.type}: {o.count} occurrence(s) in {o.file_count} file(s)")
+    print("\n📂 Files with the most findings:")
+    for path, count in aggregate.top_files(top):
+        print(f"- {path}: {count}")
+
+def print_profile(profile, path, top=25):
+    if not profile.scanners:
+        return
+    if not path:
+        date_str = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        path = os.path.join(ensure_report_directory(), f"profile_{date_str}.json")
+    print(f"\n⏱️ Slowest rules (top {top}):")
+    print(profile.format_table(top))
+    print(f"\n📁 Rule profile saved to: {profile.save(path)}")
+
+def parse_formats(value):
+    formats = [fmt.strip().lower() for fmt in value.split(",") if fmt.strip()]
+    invalid = [fmt for fmt in formats if fmt not in EXPORT_FORMATS]
+    if not formats or invalid:
+        raise argparse.ArgumentTypeError(
+            f"invalid format(s): {', '.join(invalid) or value!r} (choose from {', '.join(EXPORT_FORMATS)})"
+        )
+    return list(dict.fromkeys(formats))
+
+def open_writers(formats, locations=False, base_dir=None):
+    writers = []
+    for fmt in formats:
+        if fmt == "pdf":
+            job = start_pdf_report(on_ready=lambda j: print(
+                f"\n📁 PDF report ready: {', '.join(j.paths)}" if j.paths else f"\n❌ PDF report failed: {j.error}"
+            ))
+            if job:
+                writers.append(job)
+        else:
+            writers.append(open_report_writer(fmt, locations=locations, base_dir=base_dir))
+    return writers
+
+def source_root(target):
+    """
+    Directory that report paths are made relative to (SARIF SRCROOT): the enclosing
+    repository (nearest parent with a .git entry), or the scanned folder itself.
+    """
+    target = os.path.abspath(target)
+    folder = target if os.path.isdir(target) else os.path.dirname(target)
+    current = folder
+    while True:
+        if os.path.exists(os.path.join(current, ".git")):
+            return current
+        parent = os.path.dirname(current)
+        if parent == current:
+            return folder
+        current = parent
+
+def collapse_repeats(findings, seen):
+    """Drop COLLAPSED_RULES findings already reported, as FindingAggregator.iter_findings does."""
+    for f in findings:
+        if f.rule in COLLAPSED_RULES:
+            if f.rule in seen:
+                continue
+            seen.add(f.rule)
+        yield f
+
+def iter_target_files(target):
+    if os.path.isfile(target):
+        yield target
+        return
+    for root, _, files in os.walk(target):
+        for fname in files:
+            if os.path.splitext(fname)[1].lower() in SUPPORTED_EXTENSIONS:
+                yield os.path.join(root, fname)
+
 def process_file(file_path):
     code = load_code(file_path)
     if not code:
@@ -78,35 +169,86 @@ def process_file(file_path):
         print(f"❌ Skipping unsupported file: {file_path}")
         return []
     findings = scan_code(code, language)
+    for f in findings:
+        f.file = file_path
+        f.language = language
     print_results(file_path, findings)
     return findings
 
 def main():
     parser = argparse.ArgumentParser(description="Nuvai AI Code Security Scanner")
     parser.add_argument("target", help="Path to the code file or folder to scan")
+    parser.add_argument("--format", type=parse_formats,
+                        help=f"Comma-separated formats ({', '.join(EXPORT_FORMATS)}) to stream while scanning "
+                             "instead of prompting afterwards")
+    parser.add_argument("--profile", nargs="?", const="", metavar="PATH",
+                        help="Time every rule; print the slowest and write a JSON profile "
+                             "(default: ~/security_reports/profile_<date>.json)")
+    parser.add_argument("--locations", action="store_true",
+                        help="Add rule_id, file, language, line and offsets to json/ndjson findings")
+    parser.add_argument("--aggregate", action="store_true",
+                        help="Write one entry per rule with its occurrences (file, line, offsets) "
+                             f"instead of one per finding ({', '.join(AGGREGATED_FORMATS)})")
     args = parser.parse_args()
 
-    all_findings = []
+    if args.aggregate and args.format and not set(args.format) <= set(AGGREGATED_FORMATS):
+        parser.error(f"--aggregate supports only: {', '.join(AGGREGATED_FORMATS)}")
 
-    if os.path.isfile(args.target):
-        findings = process_file(args.target)
-        all_findings.extend(findings)
-
-    elif os.path.isdir(args.target):
-        for root, _, files in os.walk(args.target):
-            for fname in files:
-                if os.path.splitext(fname)[1].lower() in SUPPORTED_EXTENSIONS:
-                    full_path = os.path.join(root, fname)
-                    findings = process_file(full_path)
-                    all_findings.extend(findings)
-    else:
+    if not os.path.exists(args.target):
         print("❌ Invalid path. Please provide a valid file or folder.")
         return
 
-    format_choice = prompt_export_settings()
-    saved = save_report(all_findings, format_choice)
+    aggregate = FindingAggregator()
+    profile = enable_profiling() if args.profile is not None else None
+
+    if args.format:
+        writers = open_writers(args.format, locations=args.locations, base_dir=source_root(args.target))
+        try:
+            for writer in writers:
+                print(f"\n📝 Writing report to: {writer.path}")
+            reported = set()
+            for full_path in iter_target_files(args.target):
+                findings = process_file(full_path)
+                aggregate.add_all(findings)
+                if args.aggregate:
+                    continue  # written once the scan is complete
+                findings = list(collapse_repeats(findings, reported))
+                for writer in writers:
+                    writer.write_all(findings)
+            if args.aggregate:
+                for writer in writers:
+                    writer.write_all(aggregate.iter_aggregated())
+        finally:
+            for writer in writers:
+                writer.close()
+        print_aggregate_summary(aggregate)
+        if profile:
+            print_profile(disable_profiling(), args.profile)
+        pdf_jobs = [writer for writer in writers if hasattr(writer, "wait")]
+        for writer in writers:
+            if writer not in pdf_jobs:
+                print(f"\n📁 Report saved to: {writer.path} ({writer.count} {'rules' if args.aggregate else 'findings'})")
+        for job in pdf_jobs:
+            if not job.done():
+                print("\n⏳ Waiting for PDF rendering to finish...")
+            job.wait()
+        return
+
+    for full_path in iter_target_files(args.target):
+        aggregate.add_all(process_file(full_path))
+    print_aggregate_summary(aggregate)
+    if profile:
+        print_profile(disable_profiling(), args.profile)
+
+    if args.aggregate:
+        format_choice = prompt_export_settings(AGGREGATED_FORMATS)
+        entries = aggregate.iter_aggregated()
+    else:
+        format_choice = prompt_export_settings()
+        entries = aggregate.iter_findings(collapse=COLLAPSED_RULES)
+    saved = save_report(entries, format_choice, locations=args.locations, base_dir=source_root(args.target))
     if saved:
-        print(f"\n📁 Report saved to: {saved}")
+        print(f"\n📁 Report saved to: {', '.join(saved)}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
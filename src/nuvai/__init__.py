@@ -0,0 +1 @@
+from .scanner import get_language, scan_code
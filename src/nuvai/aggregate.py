@@ -0,0 +1,170 @@
+"""
+File: aggregate.py
+
+Description:
+Cross-file aggregation of scan findings for the Nuvai engine.
+
+Folder scans report the same rule (e.g. "Debugging Artifact", or the per-file
+"Security Guidance" tip) in thousands of files. Instead of keeping one finding per
+occurrence, FindingAggregator groups findings by their interned Rule and keeps compact
+per-rule occurrence arrays (path id, line, start offset). Totals, per-severity counts
+and top offenders are maintained incrementally as findings are added.
+
+Output:
+- iter_findings(): the findings replayed in scan order, one report entry per finding
+- iter_aggregated(): one report entry per rule with its occurrence list, so the rule's
+  text is written once instead of once per occurrence (run.py --aggregate)
+- to_prompt_text(): a bounded, deduplicated description for AI analysis prompts
+"""
+
+import heapq
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .finding import Finding, Rule
+
+NO_LOCATION = -1
+
+
+class RuleOccurrences:
+    __slots__ = ("rule", "count", "seqs", "path_ids", "lines", "starts", "ends")
+
+    def __init__(self, rule: Rule):
+        self.rule = rule
+        self.count = 0
+        self.seqs = array("q")  # position of each occurrence among all added findings
+        self.path_ids = array("i")
+        self.lines = array("i")
+        self.starts = array("q")
+        self.ends = array("q")
+
+    @property
+    def file_count(self) -> int:
+        return len(set(self.path_ids))
+
+
+class FindingAggregator:
+    def __init__(self):
+        self.total = 0
+        self.paths: List[str] = []
+        self.path_languages: List[Optional[str]] = []
+        self.rules: Dict[Rule, RuleOccurrences] = {}
+        self.severity_counts: Dict[str, int] = {}
+        self._path_ids: Dict[Optional[str], int] = {}
+        self._file_counts = array("i")
+
+    def _path_id(self, path: Optional[str], language: Optional[str]) -> int:
+        path_id = self._path_ids.get(path)
+        if path_id is None:
+            path_id = self._path_ids[path] = len(self.paths)
+            self.paths.append(path)
+            self.path_languages.append(language)
+            self._file_counts.append(0)
+        return path_id
+
+    def add(self, finding: Finding) -> None:
+        occurrences = self.rules.get(finding.rule)
+        if occurrences is None:
+            occurrences = self.rules[finding.rule] = RuleOccurrences(finding.rule)
+        path_id = self._path_id(finding.file, finding.language)
+        occurrences.count += 1
+        occurrences.seqs.append(self.total)
+        occurrences.path_ids.append(path_id)
+        occurrences.lines.append(finding.line if finding.line is not None else NO_LOCATION)
+        occurrences.starts.append(finding.start if finding.start is not None else NO_LOCATION)
+        occurrences.ends.append(finding.end if finding.end is not None else NO_LOCATION)
+        self._file_counts[path_id] += 1
+        level = finding.rule.severity.name
+        self.severity_counts[level] = self.severity_counts.get(level, 0) + 1
+        self.total += 1
+
+    def add_all(self, findings: Iterable[Finding]) -> None:
+        for finding in findings:
+            self.add(finding)
+
+    @property
+    def file_count(self) -> int:
+        return sum(1 for p in self.paths if p is not None)
+
+    def rule_file_count(self, occurrences: RuleOccurrences) -> int:
+        """Files the rule occurred in, not counting findings without a file."""
+        return sum(1 for path_id in set(occurrences.path_ids) if self.paths[path_id] is not None)
+
+    def top_rules(self, n: int = 10) -> List[RuleOccurrences]:
+        """Most frequent rules, most severe first on ties."""
+        return heapq.nlargest(n, self.rules.values(), key=lambda o: (o.count, o.rule.severity))
+
+    def top_files(self, n: int = 10) -> List[Tuple[str, int]]:
+        """Files with the most findings."""
+        ranked = heapq.nlargest(n, range(len(self.paths)), key=self._file_counts.__getitem__)
+        return [(self.paths[i], self._file_counts[i]) for i in ranked if self.paths[i] is not None]
+
+    def iter_findings(self, collapse: Iterable[Rule] = ()) -> Iterator[Finding]:
+        """
+        Re-expand the aggregate into findings, in the order they were added. Rules in
+        `collapse` (file-independent advice such as the "Security Guidance" tip) are
+        emitted once, at their first occurrence, instead of once per file.
+        """
+        collapse = set(collapse)
+
+        def occurrences_of(occurrences: RuleOccurrences):
+            count = 1 if occurrences.rule in collapse else occurrences.count
+            for i in range(count):
+                yield occurrences.seqs[i], i, occurrences
+
+        streams = [occurrences_of(o) for o in self.rules.values()]
+        for _, i, occurrences in heapq.merge(*streams, key=lambda item: item[0]):
+            line = occurrences.lines[i]
+            path_id = occurrences.path_ids[i]
+            yield Finding(
+                occurrences.rule,
+                start=occurrences.starts[i] if line != NO_LOCATION else None,
+                end=occurrences.ends[i] if line != NO_LOCATION else None,
+                line=line if line != NO_LOCATION else None,
+                file=self.paths[path_id],
+                language=self.path_languages[path_id],
+            )
+
+    def iter_aggregated(self) -> Iterator[Dict[str, Any]]:
+        """
+        One report entry per rule, in order of first occurrence: the rule's report keys
+        and id, its occurrence and file counts, and one {file, line, start, end} entry per
+        occurrence (keys without a value are left out, as in Finding.to_dict).
+        """
+        for o in sorted(self.rules.values(), key=lambda o: o.seqs[0]):
+            occurrences = []
+            for i in range(o.count):
+                occurrence = {}
+                path = self.paths[o.path_ids[i]]
+                if path is not None:
+                    occurrence["file"] = path
+                if o.lines[i] != NO_LOCATION:
+                    occurrence["line"] = o.lines[i]
+                    occurrence["start"] = o.starts[i]
+                    occurrence["end"] = o.ends[i]
+                occurrences.append(occurrence)
+            yield {
+                "level": o.rule.severity.name,
+                "type": o.rule.type,
+                "message": o.rule.message,
+                "recommendation": o.rule.recommendation,
+                "rule_id": o.rule.id,
+                "count": o.count,
+                "files": self.rule_file_count(o),
+                "occurrences": occurrences,
+            }
+
+    def to_prompt_text(self, limit: int = 25) -> str:
+        """Compact, deduplicated description of the aggregate for AI analysis prompts."""
+        where = f" across {self.file_count} file(s)" if self.file_count else ""
+        lines = [f"Total findings: {self.total}{where}"]
+        for o in sorted(self.rules.values(), key=lambda o: (-o.rule.severity, -o.count, o.seqs[0]))[:limit]:
+            files = self.rule_file_count(o)
+            where = f" in {files} file(s)" if files else ""
+            lines.append(
+                f"- [{o.rule.severity.name}] {o.rule.type}: {o.count} occurrence(s){where}. "
+                f"{o.rule.message} Recommendation: {o.rule.recommendation}"
+            )
+        if len(self.rules) > limit:
+            lines.append(f"- ... {len(self.rules) - limit} more rule(s) omitted")
+        return "\n".join(lines)
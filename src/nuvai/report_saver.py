@@ -12,10 +12,16 @@ Security Standards:
 - Follows OWASP recommendations: input validation, output encoding, and secure error handling
 
 Features:
-- Supports export formats: .json, .txt, .html, .pdf
+- Supports export formats: .json, .ndjson, .txt, .html, .pdf, .sarif (SARIF 2.1.0)
+- "sqlite": queryable database with indexed findings and per-rule / per-file aggregate tables
+- "html-app": self-contained HTML report (.app.html) with a gzip-compressed data island,
+  virtual scrolling and client-side filtering, openable at any scan size
+- Streaming writers accept any iterator of findings and write incrementally through a
+  buffered file, so memory stays constant and the report grows while the scan runs
 - Automatically names reports using a timestamp (e.g., scanner_2025-04-20_14-00-00.txt)
 - Creates export directory if it doesn't exist
 - Handles fallback for PDF generation dynamically inside the function
+- Renders PDFs in a separate worker process fed in batches, split into volumes of bounded size
 - Adds a summary and highlights for critical issues
 - Displays and saves actionable recommendations
 
@@ -23,8 +29,25 @@ Compatible with systems where pip is restricted (e.g., Kali Linux, Windows lockd
 """
 
 import os
+import pathlib
+import json
+import zlib
+import base64
+import sqlite3
+import queue
+import threading
+import multiprocessing
 from datetime import datetime
-from typing import List, Dict, Optional
+from html import escape
+from typing import List, Dict, Optional, Iterable, Callable
+from urllib.parse import quote
+from .finding import Finding, Rule, as_dict, one_off_rule
+
+WRITE_BUFFER_SIZE = 1 << 16  # 64 KB
+SQLITE_BATCH_SIZE = 10_000    # rows per executemany/transaction
+PDF_BATCH_SIZE = 200          # findings per message to the PDF worker
+PDF_MAX_QUEUED_BATCHES = 8    # back-pressure bound on findings in flight
+PDF_PAGES_PER_VOLUME = 500    # start a new file once a document reaches this size
 
 def ensure_report_directory() -> str:
     home = os.path.expanduser("~")
@@ -36,66 +59,716 @@ def ensure_report_directory() -> str:
         raise
     return report_dir
 
+# Report formats whose file extension differs from the format name; every format needs a
+# distinct one, as reports streamed in one run share the timestamp in their name
+FILE_EXTENSIONS = {"html-app": "app.html"}
+
 def generate_filename(extension: str) -> str:
     date_str = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    return f"scanner_{date_str}.{extension}"
+    return f"scanner_{date_str}.{FILE_EXTENSIONS.get(extension, extension)}"
+
+class ReportWriter:
+    """
+    Incremental report writer: header on open, one record per write(), footer on close().
+    Output goes through a large write buffer instead of many small unbuffered writes.
+    With locations=True, JSON records also carry the rule id, file, language and position;
+    base_dir is the source root that formats with relative paths (SARIF) resolve against.
+    """
+
+    def __init__(self, path: str, locations: bool = False, base_dir: Optional[str] = None):
+        self.path = path
+        self.count = 0
+        self.locations = locations
+        self.base_dir = os.path.abspath(base_dir or os.getcwd())
+        self._file = open(path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE)
+        self.write_header()
+
+    def write_header(self) -> None:
+        pass
+
+    def write_finding(self, fnd: Dict) -> None:
+        raise NotImplementedError
+
+    def write_footer(self) -> None:
+        pass
+
+    def write(self, fnd: Dict) -> None:
+        self.write_finding(fnd)
+        self.count += 1
+
+    def write_all(self, findings: Iterable[Dict]) -> None:
+        for fnd in findings:
+            self.write(fnd)
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        try:
+            self.write_footer()
+        finally:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class JsonReportWriter(ReportWriter):
+    def write_header(self) -> None:
+        self._file.write("[")
+
+    def write_finding(self, fnd: Dict) -> None:
+        self._file.write(",\n    " if self.count else "\n    ")
+        self._file.write(json.dumps(as_dict(fnd, locations=self.locations), ensure_ascii=False))
+
+    def write_footer(self) -> None:
+        self._file.write("\n]\n" if self.count else "]\n")
+
+
+class NdjsonReportWriter(ReportWriter):
+    def write_finding(self, fnd: Dict) -> None:
+        self._file.write(json.dumps(as_dict(fnd, locations=self.locations), ensure_ascii=False))
+        self._file.write("\n")
+
+
+class TxtReportWriter(ReportWriter):
+    def write_finding(self, fnd: Dict) -> None:
+        self._file.write(
+            f"[{fnd['level']}] {fnd['type']}\n"
+            f"- Description: {fnd['message']}\n"
+            f"- Recommendation: {fnd['recommendation']}\n\n"
+        )
+
+
+class HtmlReportWriter(ReportWriter):
+    def write_header(self) -> None:
+        self._file.write(
+            "<html><head><meta charset='UTF-8'><title>Scan Report</title>"
+            "<style>body { font-family: sans-serif; padding: 20px; } h2 { color: #B30000; }</style>"
+            "</head><body><h1>Nuvai Security Scan Report</h1>"
+        )
+
+    def write_finding(self, fnd: Dict) -> None:
+        self._file.write(
+            f"<h2>[{escape(str(fnd['level']))}] {escape(str(fnd['type']))}</h2>"
+            f"<p><strong>Description:</strong> {escape(str(fnd['message']))}</p>"
+            f"<p><strong>Recommendation:</strong> {escape(str(fnd['recommendation']))}</p><hr>"
+        )
+
+    def write_footer(self) -> None:
+        self._file.write("</body></html>")
+
+
+class SarifReportWriter(ReportWriter):
+    """
+    SARIF 2.1.0 writer. Results are streamed as they arrive and reference their rule by
+    ruleId/ruleIndex and a message id, so descriptions and recommendations are written
+    once in the rules table (emitted after the results, once all rules are known).
+    File locations are relative to the SRCROOT base URI (base_dir, by default the working
+    directory), so reports do not embed machine-specific absolute paths.
+    """
+
+    SCHEMA_URI = "https://json.schemastore.org/sarif-2.1.0.json"
+    SRCROOT = "SRCROOT"
+    LEVELS = {
+        "CRITICAL": "error",
+        "HIGH": "error",
+        "ERROR": "error",
+        "MEDIUM": "warning",
+        "WARNING": "warning",
+    }
+
+    def __init__(self, path: str, locations: bool = False, base_dir: Optional[str] = None):
+        self.rules: Dict[Rule, int] = {}
+        self._dict_rules: Dict[tuple, Rule] = {}
+        super().__init__(path, locations, base_dir)
+
+    def write_header(self) -> None:
+        self._file.write(f'{{"$schema":"{self.SCHEMA_URI}","version":"2.1.0","runs":[{{"results":[')
+
+    def rule_for(self, fnd: Dict) -> tuple:
+        if isinstance(fnd, Finding):
+            rule = fnd.rule  # interned, shared by every finding of the rule
+        else:
+            # Plain dict findings (e.g. controller errors) may carry per-input text
+            key = (str(fnd["level"]), str(fnd["type"]), fnd["message"], fnd["recommendation"])
+            rule = self._dict_rules.get(key)
+            if rule is None:
+                rule = self._dict_rules[key] = one_off_rule(*key)
+        index = self.rules.get(rule)
+        if index is None:
+            index = self.rules[rule] = len(self.rules)
+        return rule.id, index
+
+    def artifact_location(self, file_path: str) -> Dict:
+        path = os.path.abspath(file_path)
+        relative = os.path.relpath(path, self.base_dir)
+        if relative.startswith(os.pardir):
+            return {"uri": pathlib.Path(path).as_uri()}
+        return {"uri": quote(relative.replace(os.sep, "/")), "uriBaseId": self.SRCROOT}
+
+    def write_finding(self, fnd: Dict) -> None:
+        rule_id, rule_index = self.rule_for(fnd)
+        result = {
+            "ruleId": rule_id,
+            "ruleIndex": rule_index,
+            "level": self.LEVELS.get(str(fnd["level"]).upper(), "note"),
+            "message": {"id": "default"},
+        }
+        if fnd.get("file"):
+            location = {"artifactLocation": self.artifact_location(fnd["file"])}
+            if fnd.get("line"):
+                location["region"] = {"startLine": fnd["line"]}
+            result["locations"] = [{"physicalLocation": location}]
+        self._file.write(",\n" if self.count else "\n")
+        self._file.write(json.dumps(result, ensure_ascii=False, separators=(",", ":")))
+
+    def write_footer(self) -> None:
+        rules = [
+            {
+                "id": rule.id,
+                "name": rule.type,
+                "shortDescription": {"text": rule.type},
+                "help": {"text": rule.recommendation},
+                "messageStrings": {"default": {"text": rule.message}},
+                "defaultConfiguration": {"level": self.LEVELS.get(rule.severity.name, "note")},
+                "properties": {"nuvai-level": rule.severity.name},
+            }
+            for rule in self.rules
+        ]
+        run = {
+            "tool": {"driver": {"name": "Nuvai", "rules": rules}},
+            "originalUriBaseIds": {self.SRCROOT: {"uri": pathlib.Path(self.base_dir).as_uri().rstrip("/") + "/"}},
+        }
+        # The run object is still open after the results array: splice its remaining keys in
+        tail = json.dumps(run, ensure_ascii=False, separators=(",", ":"))[1:]
+        self._file.write(f"\n],{tail}]}}\n")
+
+
+HTML_APP_TEMPLATE_HEAD = """<!DOCTYPE html>
+<html><head><meta charset="UTF-8"><title>Nuvai Scan Report</title>
+<style>
+body { font-family: sans-serif; margin: 0; padding: 20px; color: #222; }
+h1 { margin-top: 0; }
+#summary span { display: inline-block; margin: 0 8px 8px 0; padding: 6px 10px; border-radius: 4px; background: #eee; }
+#filters { margin: 12px 0; display: flex; gap: 8px; flex-wrap: wrap; }
+#filters select, #filters input { padding: 4px; }
+#viewport { height: 60vh; overflow-y: auto; border: 1px solid #ccc; position: relative; }
+#spacer { position: relative; }
+.row { position: absolute; left: 0; right: 0; height: 28px; line-height: 28px; padding: 0 8px;
+       white-space: nowrap; overflow: hidden; text-overflow: ellipsis; border-bottom: 1px solid #f0f0f0; cursor: pointer; }
+.row:hover, .row.selected { background: #f5f5ff; }
+.lvl { display: inline-block; width: 90px; font-weight: bold; }
+.CRITICAL, .HIGH, .ERROR { color: #B30000; } .MEDIUM, .WARNING { color: #B36B00; }
+#detail { margin-top: 12px; padding: 12px; border: 1px solid #ccc; white-space: pre-wrap; min-height: 3em; }
+</style></head><body>
+<h1>Nuvai Security Scan Report</h1>
+<div id="summary">Loading report&hellip;</div>
+<div id="filters">
+<select id="f-level"><option value="">All severities</option></select>
+<select id="f-rule"><option value="">All rules</option></select>
+<input id="f-file" type="search" placeholder="Filter by file path">
+<span id="f-count"></span>
+</div>
+<div id="viewport"><div id="spacer"></div></div>
+<div id="detail">Select a finding to see its description and recommendation.</div>
+<script type="application/octet-stream" id="nuvai-data">
+"""
+
+HTML_APP_SCRIPT = """<script>
+(async function () {
+  var ROW_HEIGHT = 28;
+  var meta = JSON.parse(document.getElementById("nuvai-meta").textContent);
+  var raw = atob(document.getElementById("nuvai-data").textContent.replace(/\\s+/g, ""));
+  var bytes = new Uint8Array(raw.length);
+  for (var i = 0; i < raw.length; i++) bytes[i] = raw.charCodeAt(i);
+  raw = null;
+  var text = await new Response(new Blob([bytes]).stream().pipeThrough(new DecompressionStream("gzip"))).text();
+  bytes = null;
+
+  // Column storage: rule index, file index, line
+  var n = meta.total, rules = new Int32Array(n), files = new Int32Array(n), lines = new Int32Array(n);
+  var row = 0, start = 0, end;
+  while (row < n && (end = text.indexOf("\\n", start)) !== -1) {
+    var rec = JSON.parse(text.slice(start, end));
+    rules[row] = rec[0]; files[row] = rec[1]; lines[row] = rec[2];
+    row++; start = end + 1;
+  }
+  text = null;
+
+  var summary = document.getElementById("summary");
+  summary.innerHTML = "";
+  function badge(label, count, cls) {
+    var el = document.createElement("span");
+    el.className = cls || "";
+    el.textContent = label + ": " + count;
+    summary.appendChild(el);
+  }
+  badge("Total findings", meta.total);
+  badge("Files", meta.files.length);
+  Object.keys(meta.severities).forEach(function (lvl) { badge(lvl, meta.severities[lvl], lvl); });
+
+  var fLevel = document.getElementById("f-level"), fRule = document.getElementById("f-rule"),
+      fFile = document.getElementById("f-file"), fCount = document.getElementById("f-count");
+  Object.keys(meta.severities).forEach(function (lvl) { fLevel.add(new Option(lvl, lvl)); });
+  meta.rules.forEach(function (r, idx) { fRule.add(new Option(r.type + " [" + r.level + "] (" + r.count + ")", idx)); });
+
+  var viewport = document.getElementById("viewport"), spacer = document.getElementById("spacer"),
+      detail = document.getElementById("detail");
+  var visible = new Int32Array(n), visibleCount = 0, selected = -1;
+
+  function applyFilters() {
+    var lvl = fLevel.value, rule = fRule.value === "" ? -1 : +fRule.value, needle = fFile.value.toLowerCase();
+    var fileOk = null;
+    if (needle) fileOk = meta.files.map(function (f) { return f.path.toLowerCase().indexOf(needle) !== -1; });
+    visibleCount = 0;
+    for (var i = 0; i < n; i++) {
+      if (rule !== -1 && rules[i] !== rule) continue;
+      if (lvl && meta.rules[rules[i]].level !== lvl) continue;
+      if (fileOk && !fileOk[files[i]]) continue;
+      visible[visibleCount++] = i;
+    }
+    fCount.textContent = visibleCount + " shown";
+    spacer.style.height = (visibleCount * ROW_HEIGHT) + "px";
+    viewport.scrollTop = 0;
+    render();
+  }
+
+  function render() {
+    var first = Math.floor(viewport.scrollTop / ROW_HEIGHT);
+    var last = Math.min(visibleCount, first + Math.ceil(viewport.clientHeight / ROW_HEIGHT) + 1);
+    spacer.textContent = "";
+    for (var v = first; v < last; v++) {
+      var i = visible[v], r = meta.rules[rules[i]], f = meta.files[files[i]];
+      var el = document.createElement("div");
+      el.className = "row" + (i === selected ? " selected" : "");
+      el.style.top = (v * ROW_HEIGHT) + "px";
+      el.dataset.index = i;
+      var lvl = document.createElement("span");
+      lvl.className = "lvl " + r.level;
+      lvl.textContent = "[" + r.level + "]";
+      el.appendChild(lvl);
+      el.appendChild(document.createTextNode(r.type + (f.path ? " \\u2014 " + f.path + (lines[i] ? ":" + lines[i] : "") : "")));
+      spacer.appendChild(el);
+    }
+  }
+
+  var pending = false;
+  viewport.addEventListener("scroll", function () {
+    if (!pending) { pending = true; requestAnimationFrame(function () { pending = false; render(); }); }
+  });
+  spacer.addEventListener("click", function (e) {
+    var el = e.target.closest(".row");
+    if (!el) return;
+    selected = +el.dataset.index;
+    var r = meta.rules[rules[selected]], f = meta.files[files[selected]];
+    detail.textContent = "[" + r.level + "] " + r.type + "\\n" + (f.path ? "File: " + f.path + (lines[selected] ? ":" + lines[selected] : "") + "\\n" : "") +
+      "\\nDescription: " + r.message + "\\nRecommendation: " + r.recommendation;
+    render();
+  });
+  [fLevel, fRule].forEach(function (el) { el.addEventListener("change", applyFilters); });
+  var timer;
+  fFile.addEventListener("input", function () { clearTimeout(timer); timer = setTimeout(applyFilters, 150); });
+  applyFilters();
+})();
+</script>
+</body></html>
+"""
+
+
+class HtmlAppReportWriter(ReportWriter):
+    """
+    Self-contained HTML report for very large scans. Findings are written as compact
+    [rule, file, line] rows into a gzip-compressed, base64-encoded data island while the
+    scan runs; rule/file tables and summary counts follow once at the end. The page
+    decompresses the island and renders only the rows in view (virtual scrolling).
+    """
+
+    def __init__(self, path: str, locations: bool = False, base_dir: Optional[str] = None):
+        self.rules = {}
+        self.files = {}
+        self.severities = {}
+        self._compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # gzip container
+        self._pending = b""
+        super().__init__(path, locations, base_dir)
+
+    def write_header(self) -> None:
+        self._file.write(HTML_APP_TEMPLATE_HEAD)
+
+    def _emit(self, data: bytes, final: bool = False) -> None:
+        data = self._pending + data
+        cut = len(data) if final else len(data) - len(data) % 3  # base64 needs 3-byte groups
+        if cut:
+            self._file.write(base64.b64encode(data[:cut]).decode("ascii"))
+            self._file.write("\n")
+        self._pending = data[cut:]
+
+    def write_finding(self, fnd: Dict) -> None:
+        key = (fnd["level"], fnd["type"], fnd["message"], fnd["recommendation"])
+        rule = self.rules.get(key)
+        if rule is None:
+            rule = self.rules[key] = [len(self.rules), 0]
+        rule[1] += 1
+        path = fnd.get("file") or ""
+        file_entry = self.files.get(path)
+        if file_entry is None:
+            file_entry = self.files[path] = [len(self.files), 0]
+        file_entry[1] += 1
+        level = str(fnd["level"])
+        self.severities[level] = self.severities.get(level, 0) + 1
 
-def save_report(findings: List[Dict], extension: str) -> Optional[str]:
-    report_dir = ensure_report_directory()
-    filename = generate_filename(extension)
-    full_path = os.path.join(report_dir, filename)
+        row = f"[{rule[0]},{file_entry[0]},{int(fnd.get('line') or 0)}]\n".encode("ascii")
+        compressed = self._compressor.compress(row)
+        if compressed:
+            self._emit(compressed)
 
+    def write_footer(self) -> None:
+        self._emit(self._compressor.flush(), final=True)
+        meta = {
+            "total": self.count,
+            "severities": self.severities,
+            "rules": [
+                {"level": level, "type": ftype, "message": message, "recommendation": recommendation, "count": count}
+                for (level, ftype, message, recommendation), (_, count) in self.rules.items()
+            ],
+            "files": [{"path": path, "count": count} for path, (_, count) in self.files.items()],
+        }
+        meta_json = json.dumps(meta, ensure_ascii=False).replace("</", "<\\/")
+        self._file.write('</script>\n<script type="application/json" id="nuvai-meta">')
+        self._file.write(meta_json)
+        self._file.write("</script>\n")
+        self._file.write(HTML_APP_SCRIPT)
+
+
+SQLITE_SCHEMA = """
+CREATE TABLE rules (
+    id INTEGER PRIMARY KEY,
+    level TEXT NOT NULL,
+    type TEXT NOT NULL,
+    message TEXT NOT NULL,
+    recommendation TEXT NOT NULL
+);
+CREATE TABLE files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL,
+    language TEXT
+);
+CREATE TABLE findings (
+    id INTEGER PRIMARY KEY,
+    rule_id INTEGER NOT NULL REFERENCES rules(id),
+    file_id INTEGER NOT NULL REFERENCES files(id),
+    severity TEXT NOT NULL,
+    line INTEGER
+);
+CREATE VIEW finding_details AS
+    SELECT f.id, f.severity, r.type AS rule, fl.language, fl.path, f.line, r.message, r.recommendation
+    FROM findings f JOIN rules r ON r.id = f.rule_id JOIN files fl ON fl.id = f.file_id;
+"""
+
+# Indexes and aggregates are built once after the bulk load, which is much faster
+# than maintaining them row by row
+SQLITE_FINALIZE = """
+CREATE INDEX idx_findings_severity ON findings(severity, rule_id);
+CREATE INDEX idx_findings_rule ON findings(rule_id, file_id);
+CREATE INDEX idx_findings_file ON findings(file_id);
+CREATE INDEX idx_rules_type ON rules(type);
+CREATE UNIQUE INDEX idx_files_path ON files(path);
+CREATE INDEX idx_files_language ON files(language);
+CREATE TABLE rule_summary AS
+    SELECT r.id AS rule_id, r.level, r.type AS rule, COUNT(f.id) AS findings, COUNT(DISTINCT f.file_id) AS files
+    FROM rules r LEFT JOIN findings f ON f.rule_id = r.id
+    GROUP BY r.id;
+CREATE TABLE file_summary AS
+    SELECT fl.id AS file_id, fl.path, fl.language, COUNT(f.id) AS findings,
+           SUM(f.severity = 'CRITICAL') AS critical, SUM(f.severity = 'HIGH') AS high,
+           SUM(f.severity IN ('MEDIUM', 'WARNING')) AS medium, SUM(f.severity IN ('INFO', 'TIP', 'LOW')) AS low
+    FROM files fl LEFT JOIN findings f ON f.file_id = fl.id
+    GROUP BY fl.id;
+CREATE INDEX idx_file_summary_critical ON file_summary(critical DESC);
+ANALYZE;
+"""
+
+
+class SqliteReportWriter(ReportWriter):
+    """
+    SQLite report for ad-hoc triage queries. Rule text and file paths are stored once and
+    findings reference them by id; rows are bulk-inserted with executemany in batched
+    transactions, then indexes and rule_summary / file_summary tables are built on close().
+    """
+
+    def __init__(self, path: str, locations: bool = False, base_dir: Optional[str] = None):
+        self.path = path
+        self.count = 0
+        self.locations = locations
+        self.base_dir = os.path.abspath(base_dir or os.getcwd())
+        self.rules = {}
+        self.files = {}
+        self._rows = []
+        if os.path.exists(path):
+            os.remove(path)
+        self._conn = sqlite3.connect(path)
+        # The report is rebuilt from scratch on failure, so durability is not needed while loading
+        self._conn.execute("PRAGMA journal_mode = OFF")
+        self._conn.execute("PRAGMA synchronous = OFF")
+        self._conn.executescript(SQLITE_SCHEMA)
+
+    def write_finding(self, fnd: Dict) -> None:
+        key = (fnd["level"], fnd["type"], fnd["message"], fnd["recommendation"])
+        rule_id = self.rules.get(key)
+        if rule_id is None:
+            rule_id = self.rules[key] = len(self.rules) + 1
+            self._conn.execute("INSERT INTO rules VALUES (?, ?, ?, ?, ?)", (rule_id, *key))
+        path = fnd.get("file") or ""
+        file_id = self.files.get(path)
+        if file_id is None:
+            file_id = self.files[path] = len(self.files) + 1
+            self._conn.execute("INSERT INTO files VALUES (?, ?, ?)", (file_id, path, fnd.get("language")))
+        self._rows.append((rule_id, file_id, str(fnd["level"]), fnd.get("line")))
+        if len(self._rows) >= SQLITE_BATCH_SIZE:
+            self.flush()
+
+    def flush(self) -> None:
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO findings (rule_id, file_id, severity, line) VALUES (?, ?, ?, ?)", self._rows
+            )
+        self._rows = []
+
+    def close(self) -> None:
+        if self._conn is None:
+            return
+        try:
+            self.flush()
+            self._conn.executescript(SQLITE_FINALIZE)
+        finally:
+            self._conn.close()
+            self._conn = None
+
+
+STREAM_WRITERS = {
+    "json": JsonReportWriter,
+    "ndjson": NdjsonReportWriter,
+    "txt": TxtReportWriter,
+    "html": HtmlReportWriter,
+    "sarif": SarifReportWriter,
+    "html-app": HtmlAppReportWriter,
+    "sqlite": SqliteReportWriter,
+}
+
+
+def open_report_writer(extension: str, full_path: Optional[str] = None, locations: bool = False,
+                       base_dir: Optional[str] = None) -> ReportWriter:
+    """
+    Open a streaming writer for the given format. Findings can then be written one at a time
+    while the scan is still running; call close() (or use it as a context manager) to finish.
+    """
+    writer_cls = STREAM_WRITERS.get(extension)
+    if writer_cls is None:
+        raise ValueError(f"Unsupported streaming format: {extension}")
+    if full_path is None:
+        full_path = os.path.join(ensure_report_directory(), generate_filename(extension))
+    return writer_cls(full_path, locations=locations, base_dir=base_dir)
+
+
+def stream_report(findings: Iterable[Dict], extension: str, full_path: Optional[str] = None,
+                  locations: bool = False, base_dir: Optional[str] = None) -> Optional[str]:
+    """
+    Write findings from any iterable (e.g. a generator) without materializing them in memory.
+    """
     try:
-        if extension == "json":
-            import json
-            with open(full_path, "w", encoding="utf-8") as f:
-                json.dump(findings, f, indent=4, ensure_ascii=False)
-
-        elif extension == "txt":
-            with open(full_path, "w", encoding="utf-8") as f:
-                for fnd in findings:
-                    f.write(f"[{fnd['level']}] {fnd['type']}\n")
-                    f.write(f"- Description: {fnd['message']}\n")
-                    f.write(f"- Recommendation: {fnd['recommendation']}\n\n")
-
-        elif extension == "html":
-            with open(full_path, "w", encoding="utf-8") as f:
-                f.write("<html><head><meta charset='UTF-8'><title>Scan Report</title>")
-                f.write("<style>body { font-family: sans-serif; padding: 20px; } h2 { color: #B30000; }</style>")
-                f.write("</head><body><h1>Nuvai Security Scan Report</h1>")
-                for fnd in findings:
-                    f.write(f"<h2>[{fnd['level']}] {fnd['type']}</h2>")
-                    f.write(f"<p><strong>Description:</strong> {fnd['message']}</p>")
-                    f.write(f"<p><strong>Recommendation:</strong> {fnd['recommendation']}</p><hr>")
-                f.write("</body></html>")
-
-        elif extension == "pdf":
-            try:
-                from fpdf import FPDF
-            except ImportError:
-                print("⚠️ PDF export not available. To enable it, install fpdf using a virtual environment:")
-                print("💡 Example: python3 -m venv .venv && source .venv/bin/activate && pip install fpdf")
-                return None
+        with open_report_writer(extension, full_path, locations, base_dir) as writer:
+            writer.write_all(findings)
+    except Exception as e:
+        print(f"❌ Failed to save report: {e}")
+        return None
+    return writer.path
 
+
+def _pdf_volume_path(full_path: str, volume: int) -> str:
+    if volume == 1:
+        return full_path
+    root, ext = os.path.splitext(full_path)
+    return f"{root}_part{volume}{ext}"
+
+
+def _render_pdf_worker(batches, results, full_path: str, pages_per_volume: int) -> None:
+    """Worker process: render batches of findings until a None sentinel arrives."""
+    try:
+        from fpdf import FPDF
+
+        def new_document():
             pdf = FPDF()
             pdf.add_page()
             pdf.set_font("Arial", size=12)
             pdf.cell(200, 10, txt="Nuvai Security Scan Report", ln=True, align="C")
-            for fnd in findings:
+            return pdf
+
+        paths = []
+        pdf = new_document()
+        while True:
+            batch = batches.get()
+            if batch is None:
+                break
+            for fnd in batch:
+                # The next volume is only started once it has a finding to hold
+                if pdf is None:
+                    pdf = new_document()
                 pdf.set_font("Arial", "B", 12)
                 pdf.cell(200, 10, txt=f"[{fnd['level']}] {fnd['type']}", ln=True)
                 pdf.set_font("Arial", size=11)
                 pdf.multi_cell(0, 10, txt=f"Description: {fnd['message']}")
                 pdf.multi_cell(0, 10, txt=f"Recommendation: {fnd['recommendation']}")
                 pdf.ln()
-            pdf.output(full_path)
+                # FPDF keeps every page in memory until output(), so cap document size
+                if pdf.page_no() >= pages_per_volume:
+                    paths.append(_pdf_volume_path(full_path, len(paths) + 1))
+                    pdf.output(paths[-1])
+                    pdf = None
+        if pdf is not None:
+            paths.append(_pdf_volume_path(full_path, len(paths) + 1))
+            pdf.output(paths[-1])
+        results.put(("ok", paths))
+    except Exception as e:
+        results.put(("error", str(e)))
+
+
+class PdfRenderJob:
+    """
+    Handle for a PDF report rendered in a separate process.
+
+    Exposes the same write()/write_all()/close() interface as ReportWriter so it can be fed
+    from the streaming findings iterator. close() returns immediately; use done(), wait()
+    or an on_ready callback to learn when the file(s) are ready.
+    """
 
+    def __init__(self, path: str, on_ready: Optional[Callable[["PdfRenderJob"], None]] = None,
+                 batch_size: int = PDF_BATCH_SIZE, pages_per_volume: int = PDF_PAGES_PER_VOLUME):
+        self.path = path
+        self.count = 0
+        self.paths: List[str] = []
+        self.error: Optional[str] = None
+        self._on_ready = on_ready
+        self._batch_size = batch_size
+        self._batch: List[Dict] = []
+        self._closed = False
+        self._finished = threading.Event()
+        self._batches = multiprocessing.Queue(maxsize=PDF_MAX_QUEUED_BATCHES)
+        self._results = multiprocessing.Queue()
+        self._process = multiprocessing.Process(
+            target=_render_pdf_worker,
+            args=(self._batches, self._results, path, pages_per_volume),
+            daemon=True,
+        )
+        self._process.start()
+        self._watcher = threading.Thread(target=self._watch, daemon=True)
+        self._watcher.start()
+
+    def _watch(self) -> None:
+        status, payload = None, "PDF worker exited unexpectedly."
+        while self._process.is_alive() or not self._results.empty():
+            try:
+                status, payload = self._results.get(timeout=0.5)
+                break
+            except queue.Empty:
+                continue
+        self._process.join()
+        if status == "ok":
+            self.paths = payload
         else:
-            print(f"❌ Unsupported format: {extension}")
-            return None
+            self.error = payload
+        self._finished.set()
+        if self._on_ready:
+            self._on_ready(self)
+
+    def write(self, fnd: Dict) -> None:
+        self._batch.append({k: fnd[k] for k in ("level", "type", "message", "recommendation")})
+        self.count += 1
+        if len(self._batch) >= self._batch_size:
+            self._put(self._batch)
+            self._batch = []
+
+    def _put(self, item) -> None:
+        # Blocks while the worker is behind, but never on a worker that has stopped
+        while True:
+            try:
+                self._batches.put(item, timeout=0.5)
+                return
+            except queue.Full:
+                if self._finished.is_set():
+                    raise RuntimeError(self.error or "PDF worker stopped.")
+
+    def write_all(self, findings: Iterable[Dict]) -> None:
+        for fnd in findings:
+            self.write(fnd)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        if self._batch:
+            self._put(self._batch)
+            self._batch = []
+        self._put(None)
+
+    def done(self) -> bool:
+        return self._finished.is_set()
 
+    def wait(self, timeout: Optional[float] = None) -> List[str]:
+        """Block until rendering finishes; returns the written file paths (empty on failure)."""
+        self._finished.wait(timeout)
+        return self.paths
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def start_pdf_report(full_path: Optional[str] = None,
+                     on_ready: Optional[Callable[[PdfRenderJob], None]] = None) -> Optional[PdfRenderJob]:
+    """Start a background PDF render; returns None if PDF support is not installed."""
+    try:
+        import fpdf  # noqa: F401
+    except ImportError:
+        print("⚠️ PDF export not available. To enable it, install fpdf using a virtual environment:")
+        print("💡 Example: python3 -m venv .venv && source .venv/bin/activate && pip install fpdf")
+        return None
+    if full_path is None:
+        full_path = os.path.join(ensure_report_directory(), generate_filename("pdf"))
+    return PdfRenderJob(full_path, on_ready=on_ready)
+
+
+def save_report(findings: List[Dict], extension: str, locations: bool = False,
+                base_dir: Optional[str] = None) -> Optional[List[str]]:
+    """
+    Write a complete report; returns every file written (PDFs are split into volumes),
+    or None on failure.
+    """
+    if extension in STREAM_WRITERS:
+        path = stream_report(findings, extension, locations=locations, base_dir=base_dir)
+        return [path] if path else None
+
+    if extension != "pdf":
+        print(f"❌ Unsupported format: {extension}")
+        return None
+
+    try:
+        job = start_pdf_report()
+        if job is None:
+            return None
+        with job:
+            job.write_all(findings)
+        paths = job.wait()
+        if job.error:
+            raise RuntimeError(job.error)
     except Exception as e:
         print(f"❌ Failed to save report: {e}")
         return None
 
-    return full_path
+    return paths
@@ -21,13 +21,16 @@ Supported Languages:
 - PHP (.php)
 - C++ (.cpp)
 
-Returns structured findings, errors, or recommendations for next actions.
+Returns structured findings (compact Finding records referencing interned rules),
+errors, or recommendations for next actions.
 Provides tailored remediation tips based on detected vulnerabilities.
 """
 
 import os
 import logging
 import re
+from .finding import Finding, intern_rule, one_off_rule
+from .profiler import get_active_profile
 
 logger = logging.getLogger(__name__)
 
@@ -62,16 +65,41 @@ def get_language(file_path, code=None):
                     return lang
     return language
 
+MISSING_INPUT_RULE = intern_rule(
+    "ERROR", "Missing Input",
+    "Missing source code or language type.",
+    "Please check the input and try again."
+)
+NO_ISSUES_RULE = intern_rule(
+    "INFO", "No Issues Detected",
+    "The scan completed but no issues were found.",
+    "Continue following secure coding practices."
+)
+GUIDANCE_RULE = intern_rule(
+    "TIP", "Security Guidance",
+    "Consider applying secure development best practices.",
+    (
+        "- Validate all user inputs strictly.\n"
+        "- Avoid insecure default configurations.\n"
+        "- Use secure libraries and keep them updated.\n"
+        "- Avoid exposing debug or verbose logs in production.\n"
+        "- Perform code reviews and vulnerability assessments regularly."
+    )
+)
+SCANNER_ERROR_RULE = intern_rule(
+    "ERROR", "Unexpected Scanner Error",
+    "A critical error occurred during scanning.",
+    "Please try again or contact support."
+)
+
 def scan_code(code, language):
     try:
+        # Finding locations are reported relative to the original, unstripped input
+        lead = len(code) - len(code.lstrip())
+        line_shift = code.count("\n", 0, lead)
         code = code.strip()
         if not code or not language:
-            return [{
-                "level": "ERROR",
-                "type": "Missing Input",
-                "message": "Missing source code or language type.",
-                "recommendation": "Please check the input and try again."
-            }]
+            return [Finding(MISSING_INPUT_RULE)]
 
         scanner = None
         if language == "python":
@@ -96,53 +124,38 @@ def scan_code(code, language):
             from .typescript_scanner import TypeScriptScanner
             scanner = TypeScriptScanner(code)
         else:
-            return [{
-                "level": "ERROR",
-                "type": "Unsupported Language",
-                "message": f"The language '{language}' is currently not supported.",
-                "recommendation": "Check for updates or verify file extension."
-            }]
-
-        findings = scanner.run_all_checks()
+            return [Finding(one_off_rule(
+                "ERROR", "Unsupported Language",
+                f"The language '{language}' is currently not supported.",
+                "Check for updates or verify file extension."
+            ))]
+
+        profile = get_active_profile()
+        findings = scanner.run_all_checks() if profile is None else profile.run(scanner)
+
+        if lead:
+            for f in findings:
+                if f.start is not None:
+                    f.start += lead
+                    f.end += lead
+                    f.line += line_shift
 
         if not findings:
-            return [{
-                "level": "INFO",
-                "type": "No Issues Detected",
-                "message": "The scan completed but no issues were found.",
-                "recommendation": "Continue following secure coding practices."
-            }]
+            return [Finding(NO_ISSUES_RULE)]
 
         # Add tips if issues were found
-        findings.append({
-            "level": "TIP",
-            "type": "Security Guidance",
-            "message": "Consider applying secure development best practices.",
-            "recommendation": (
-                "- Validate all user inputs strictly.\n"
-                "- Avoid insecure default configurations.\n"
-                "- Use secure libraries and keep them updated.\n"
-                "- Avoid exposing debug or verbose logs in production.\n"
-                "- Perform code reviews and vulnerability assessments regularly."
-            )
-        })
+        findings.append(Finding(GUIDANCE_RULE))
 
         return findings
 
     except ImportError as e:
         logger.exception("Scanner module import failed")
-        return [{
-            "level": "ERROR",
-            "type": "Scanner Import Failure",
-            "message": str(e),
-            "recommendation": f"Ensure the '{language}_scanner.py' file is present and properly named."
-        }]
+        return [Finding(one_off_rule(
+            "ERROR", "Scanner Import Failure",
+            str(e),
+            f"Ensure the '{language}_scanner.py' file is present and properly named."
+        ))]
 
     except Exception as e:
         logger.exception("Unhandled exception during scan")
-        return [{
-            "level": "ERROR",
-            "type": "Unexpected Scanner Error",
-            "message": "A critical error occurred during scanning.",
-            "recommendation": "Please try again or contact support."
-        }]
\ No newline at end of file
+        return [Finding(SCANNER_ERROR_RULE)]
\ No newline at end of file
@@ -0,0 +1,61 @@
+"""
+FindingAggregator outputs: per-finding replay, per-rule entries with occurrence lists
+(run.py --aggregate) and the deduplicated prompt text used for AI analysis.
+"""
+
+from src.nuvai.aggregate import FindingAggregator
+from src.nuvai.finding import Finding, intern_rule
+from src.nuvai.scanner import GUIDANCE_RULE
+
+DEBUG_RULE = intern_rule("INFO", "Debugging Artifact", "Code contains print statements.", "Remove them.")
+EVAL_RULE = intern_rule("HIGH", "Use of eval()", "eval() executes arbitrary code.", "Avoid eval().")
+
+
+def build_aggregate(files=("a.py", "b.py", "c.py")):
+    aggregate = FindingAggregator()
+    for n, path in enumerate(files):
+        aggregate.add(Finding(DEBUG_RULE, start=0, end=6, line=1, file=path, language="python"))
+        if n == 1:
+            aggregate.add(Finding(EVAL_RULE, start=10, end=15, line=2, file=path, language="python"))
+        aggregate.add(Finding(GUIDANCE_RULE, file=path, language="python"))
+    return aggregate
+
+
+def test_aggregated_entries_hold_one_rule_each_with_its_occurrences():
+    entries = list(build_aggregate().iter_aggregated())
+
+    assert [e["rule_id"] for e in entries] == [DEBUG_RULE.id, GUIDANCE_RULE.id, EVAL_RULE.id]
+    debug = entries[0]
+    assert (debug["level"], debug["count"], debug["files"]) == ("INFO", 3, 3)
+    assert debug["occurrences"][1] == {"file": "b.py", "line": 1, "start": 0, "end": 6}
+    assert entries[1]["occurrences"] == [{"file": "a.py"}, {"file": "b.py"}, {"file": "c.py"}]
+
+
+def test_iter_findings_collapses_only_the_given_rules():
+    findings = list(build_aggregate().iter_findings(collapse=[GUIDANCE_RULE]))
+
+    assert [f.rule for f in findings].count(GUIDANCE_RULE) == 1
+    assert [f.file for f in findings if f.rule is DEBUG_RULE] == ["a.py", "b.py", "c.py"]
+
+
+def test_prompt_text_lists_each_rule_once_most_severe_first():
+    text = build_aggregate().to_prompt_text(limit=2)
+    lines = text.splitlines()
+
+    assert lines[0] == "Total findings: 7 across 3 file(s)"
+    assert lines[1].startswith("- [HIGH] Use of eval(): 1 occurrence(s) in 1 file(s).")
+    assert lines[2].startswith("- [INFO] Debugging Artifact: 3 occurrence(s) in 3 file(s).")
+    assert lines[3] == "- ... 1 more rule(s) omitted"
+
+
+def test_ai_prompt_is_built_from_the_aggregate():
+    from backend.src.ai_analyzer import format_vulnerabilities
+
+    finding = {"severity": "high", "title": "Use of eval()", "description": "eval() executes arbitrary code.",
+               "recommendation": "Avoid eval()."}
+    text = format_vulnerabilities([finding] * 50)
+
+    assert text.splitlines() == [
+        "Total findings: 50",
+        "- [HIGH] Use of eval(): 50 occurrence(s). eval() executes arbitrary code. Recommendation: Avoid eval().",
+    ]
@@ -0,0 +1,189 @@
+"""
+ResilientAIClient against the stub AI server with injected faults: retries with
+jittered backoff, the circuit breaker (open, half-open probe) and the per-call deadline.
+"""
+
+import time
+
+import pytest
+
+openai = pytest.importorskip("openai")
+
+from backend.src import ai_client as ai_client_module
+from backend.src.ai_client import CircuitBreaker, CircuitOpenError, ResilientAIClient
+from benchmarks.stand_ins import StubAIServer, STUB_AI_REPLY, _serve
+
+MESSAGES = [{"role": "user", "content": "Analyze this code"}]
+
+
+@pytest.fixture
+def server():
+    stub = StubAIServer()
+    _serve(stub)
+    yield stub
+    stub.shutdown()
+    stub.server_close()
+
+
+def make_client(server, **kwargs):
+    kwargs.setdefault("backoff_base", 0.01)
+    kwargs.setdefault("backoff_max", 0.05)
+    return ResilientAIClient(
+        api_key="stub",
+        base_url=f"http://127.0.0.1:{server.server_address[1]}/v1",
+        **kwargs,
+    )
+
+
+def complete(client, **kwargs):
+    return client.create_chat_completion(model="stub", messages=MESSAGES, **kwargs)
+
+
+@pytest.fixture
+def backoffs(monkeypatch):
+    """Record every jitter draw (upper bound) made by the client."""
+    bounds = []
+    real_uniform = ai_client_module.random.uniform
+
+    def uniform(low, high):
+        bounds.append((low, high))
+        return real_uniform(low, high)
+
+    monkeypatch.setattr(ai_client_module.random, "uniform", uniform)
+    return bounds
+
+
+def test_retries_rate_limit_and_server_errors_with_jittered_backoff(server, backoffs):
+    server.inject(429, 503, "drop")
+    client = make_client(server, max_retries=3, backoff_base=0.01, backoff_max=0.02)
+
+    response = complete(client)
+
+    assert response.choices[0].message.content == STUB_AI_REPLY
+    assert server.calls == 4
+    # Full jitter: uniform(0, min(max, base * 2**attempt)) before each retry
+    assert backoffs == [(0, 0.01), (0, 0.02), (0, 0.02)]
+    assert client.health()["failures"] == 0
+    assert client.breaker.state == CircuitBreaker.CLOSED
+
+
+def test_gives_up_after_max_retries(server):
+    server.inject(500, 500, 500, 500)
+    client = make_client(server, max_retries=2)
+
+    with pytest.raises(openai.InternalServerError):
+        complete(client)
+
+    assert server.calls == 3
+    assert client.health()["failures"] == 1
+
+
+def test_client_errors_are_not_retried_and_keep_the_circuit_closed(server):
+    server.inject(400)
+    client = make_client(server, max_retries=2, breaker=CircuitBreaker(failure_threshold=1))
+
+    with pytest.raises(openai.BadRequestError):
+        complete(client)
+
+    assert server.calls == 1
+    assert client.breaker.state == CircuitBreaker.CLOSED
+
+
+def test_breaker_opens_and_fails_fast(server):
+    server.inject(503, 503)
+    client = make_client(server, max_retries=0, breaker=CircuitBreaker(failure_threshold=2, reset_timeout=60))
+
+    for _ in range(2):
+        with pytest.raises(openai.InternalServerError):
+            complete(client)
+    assert client.breaker.state == CircuitBreaker.OPEN
+
+    with pytest.raises(CircuitOpenError):
+        complete(client)
+    assert server.calls == 2  # rejected without contacting the upstream
+    assert client.health()["rejected"] == 1
+
+
+def test_half_open_probe_closes_circuit_on_success(server):
+    server.inject(500)
+    client = make_client(server, max_retries=0, breaker=CircuitBreaker(failure_threshold=1, reset_timeout=0.2))
+
+    with pytest.raises(openai.InternalServerError):
+        complete(client)
+    assert client.breaker.state == CircuitBreaker.OPEN
+
+    time.sleep(0.25)
+    assert client.breaker.state == CircuitBreaker.HALF_OPEN
+    complete(client)
+    assert client.breaker.state == CircuitBreaker.CLOSED
+    assert server.calls == 2
+
+
+def test_failed_half_open_probe_reopens_circuit(server):
+    server.inject(500, "drop")
+    client = make_client(server, max_retries=0, breaker=CircuitBreaker(failure_threshold=1, reset_timeout=0.2))
+
+    with pytest.raises(openai.InternalServerError):
+        complete(client)
+    time.sleep(0.25)
+    with pytest.raises(openai.APIConnectionError):
+        complete(client)  # the probe hits a dropped connection
+
+    assert client.breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        complete(client)
+    assert server.calls == 2
+
+
+def test_only_one_half_open_probe_is_let_through():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.0)
+    breaker.record_failure()
+
+    assert breaker.allow_request() is True
+    assert breaker.allow_request() is False
+    breaker.record_success()
+    assert breaker.allow_request() is True
+
+
+def test_deadline_bounds_all_attempts(server):
+    server.inject(("delay", 2.0), ("delay", 2.0), ("delay", 2.0))
+    client = make_client(server, max_retries=5)
+
+    started = time.monotonic()
+    with pytest.raises(openai.APITimeoutError):
+        complete(client, deadline=0.3)
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 1.0
+    assert 1 <= server.calls <= 3
+
+
+def test_retry_is_skipped_when_backoff_would_pass_the_deadline(server, monkeypatch):
+    server.inject(503)
+    client = make_client(server, max_retries=3, backoff_base=5.0, backoff_max=5.0)
+    monkeypatch.setattr(ai_client_module.random, "uniform", lambda low, high: high)
+
+    started = time.monotonic()
+    with pytest.raises(openai.InternalServerError):
+        complete(client, deadline=1.0)
+
+    assert time.monotonic() - started < 1.0
+    assert server.calls == 1
+
+
+def test_open_circuit_falls_back_to_local_analysis_through_the_logger(server, monkeypatch, capsys):
+    from backend.src import ai_analyzer
+
+    client = make_client(server, breaker=CircuitBreaker(failure_threshold=1, reset_timeout=60))
+    client.breaker.record_failure()
+    monkeypatch.setattr(ai_analyzer, "get_ai_client", lambda: client)
+    warnings = []
+    monkeypatch.setattr(ai_analyzer.logger, "warning", lambda msg, *args: warnings.append(msg % args))
+
+    scan = {"filename": "app.py", "language": "python", "vulnerabilities": []}
+    result = ai_analyzer.analyze_scan_results(scan, force_model=True)
+
+    assert result["fallback"] is True
+    assert server.calls == 0
+    assert warnings and "circuit is open" in warnings[0]
+    assert "circuit is open" not in capsys.readouterr().out
@@ -0,0 +1,56 @@
+"""
+Cold-start guards: the CLI and the API package load heavy subsystems on first use only.
+The strict timing budgets are checked by benchmarks.import_time (also run by
+benchmarks.compare --run); these tests catch a new eager import deterministically and
+hold the CLI to a looser budget that shared CI machines still meet.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+from benchmarks import import_time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ("sqlalchemy", "redis", "openai", "httpx", "fpdf", "cryptography")
+# 3x the gate budgets: an eager heavy import still blows through these
+CI_BUDGETS_MS = {name: 3 * ms for name, ms in import_time.DEFAULT_BUDGETS_MS.items()}
+
+
+def loaded_after(statement):
+    code = f"{statement}\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))"
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return set(json.loads(out.stdout))
+
+
+def heavy(modules):
+    return sorted(m for m in modules if m.split(".")[0] in HEAVY_MODULES)
+
+
+def test_cli_import_is_lazy():
+    modules = loaded_after("import run")
+    assert heavy(modules) == []
+    assert not any(m.endswith("_scanner") for m in modules)
+
+
+def test_api_package_import_is_lazy():
+    modules = loaded_after("import backend.src.nuvai")
+    assert heavy(modules) == []
+    assert not any(m.endswith("_scanner") for m in modules)
+
+
+def test_ai_client_module_does_not_import_the_sdk():
+    assert heavy(loaded_after("import backend.src.ai_client")) == []
+
+
+def test_import_time_targets_are_within_ci_budgets_or_skipped_with_a_reason():
+    results = import_time.check_targets(list(import_time.TARGETS), CI_BUDGETS_MS, runs=3, top=1)
+    by_target = {r["target"]: r for r in results}
+
+    assert by_target["run"]["status"] == "ok", by_target["run"]
+    server = by_target["server"]
+    if not os.path.exists(os.path.join(ROOT, "backend", "config.py")):
+        assert server["status"] == "skipped" and "backend.config" in server["skipped"]
+    else:
+        assert server["status"] == "ok", server
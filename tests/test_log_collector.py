@@ -0,0 +1,49 @@
+"""
+LogCollector shutdown: every line a worker sent before stop() reaches the log file.
+"""
+
+import logging
+import os
+
+from backend.src.nuvai.utils.log_collector import LogCollector, LogShippingHandler
+
+
+def make_logger(name, socket_path):
+    handler = LogShippingHandler(socket_path)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger = logging.getLogger(name)
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.addHandler(handler)
+    return logger, handler
+
+
+def test_stop_writes_lines_still_being_read(tmp_path):
+    socket_path = str(tmp_path / "collector.sock")
+    log_file = tmp_path / "nuvai.log"
+    collector = LogCollector(socket_path, str(log_file), max_bytes=0, backup_count=0).start()
+
+    loggers = [make_logger(f"worker-{i}", socket_path) for i in range(4)]
+    for i in range(2000):
+        logger, _ = loggers[i % len(loggers)]
+        logger.info(f"line {i}")
+    collector.stop()  # no pause: readers are still draining their connections
+    for logger, handler in loggers:
+        logger.removeHandler(handler)
+        handler.close()
+
+    lines = log_file.read_text().splitlines()
+    assert sorted(lines) == sorted(f"line {i}" for i in range(2000))
+    assert not os.path.exists(socket_path)
+
+
+def test_stop_with_idle_connections_returns(tmp_path):
+    socket_path = str(tmp_path / "collector.sock")
+    collector = LogCollector(socket_path, str(tmp_path / "nuvai.log"), max_bytes=0, backup_count=0).start()
+    logger, handler = make_logger("idle-worker", socket_path)
+    logger.info("hello")
+
+    collector.stop()  # the worker keeps its connection open; stop() must not wait on it
+    logger.removeHandler(handler)
+    handler.close()
+    assert (tmp_path / "nuvai.log").read_text() == "hello\n"
@@ -0,0 +1,28 @@
+"""
+Memory budgets as enforced by benchmarks.compare --run: the committed budgets hold for
+inputs that pass upload validation, and a breach is reported rather than ignored.
+"""
+
+import json
+
+from benchmarks import memory
+
+
+def test_committed_budgets_hold():
+    report = memory.check_budgets(sizes="100KB")
+
+    assert report["results"]
+    assert report["breaches"] == [], memory.to_markdown(report)
+
+
+def test_breaches_are_reported(tmp_path):
+    budgets = tmp_path / "budgets.json"
+    budgets.write_text(json.dumps({
+        "headroom": 1.0,
+        "stages": {stage: {"per_mb": 1, "overhead": 0} for stage in memory.STAGES},
+    }))
+
+    report = memory.check_budgets(str(budgets), sizes="100KB")
+
+    assert len(report["breaches"]) == len(report["results"])
+    assert "| `scan_code` |" in memory.to_markdown(report)
@@ -0,0 +1,86 @@
+"""
+/metrics scrapes, parsed with the Prometheus text parser: single-process, and
+multi-process (samples written by separate worker processes, summed on scrape).
+"""
+
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+pytest.importorskip("prometheus_client")
+from flask import Flask
+from prometheus_client.parser import text_string_to_metric_families
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def samples(text):
+    """{(sample name, sorted labels): value} for every sample in a scrape."""
+    return {
+        (sample.name, tuple(sorted(sample.labels.items()))): sample.value
+        for family in text_string_to_metric_families(text)
+        for sample in family.samples
+    }
+
+
+def scrape():
+    from backend.routes.metrics_routes import metrics_blueprint
+
+    app = Flask(__name__)
+    app.register_blueprint(metrics_blueprint)
+    response = app.test_client().get("/metrics")
+    assert response.status_code == 200
+    assert response.content_type.startswith("text/plain")
+    return response.get_data(as_text=True)
+
+
+def test_scrape_parses_and_reports_cache_lookups():
+    from backend.src import metrics
+    from backend.src.local_analyzer import count_novel_findings
+
+    before = samples(scrape())
+    metrics.REQUESTS.labels("/scan", "POST", 200).inc()
+    metrics.LOG_QUEUE_DEPTH.set(3)
+    count_novel_findings([{"title": "metrics-test-finding"}, {"title": "metrics-test-finding"}])
+
+    after = samples(scrape())
+    miss = ("nuvai_cache_lookups_total", (("cache", "ai_known_titles"), ("result", "miss")))
+    requests = ("nuvai_http_requests_total", (("method", "POST"), ("route", "/scan"), ("status", "200")))
+    assert after[miss] - before.get(miss, 0) == 1
+    assert after[requests] - before.get(requests, 0) == 1
+    assert after[("nuvai_log_queue_depth", ())] == 3
+
+
+WORKER = textwrap.dedent("""
+    from backend.src import metrics
+    metrics.REQUESTS.labels("/scan", "POST", 200).inc(2)
+    metrics.record_cache_lookup("ai_known_titles", hit=True)
+    metrics.REQUESTS_IN_FLIGHT.inc()
+""")
+
+SCRAPER = textwrap.dedent("""
+    from backend.src.metrics import render_metrics
+    body, _ = render_metrics()
+    print(body.decode())
+""")
+
+
+def run_python(code, env):
+    return subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    ).stdout
+
+
+def test_multiprocess_scrape_sums_workers(tmp_path):
+    env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(tmp_path)}
+    for _ in range(3):
+        run_python(WORKER, env)  # each run is a separate worker pid
+
+    scraped = samples(run_python(SCRAPER, env))
+
+    assert scraped[("nuvai_http_requests_total", (("method", "POST"), ("route", "/scan"), ("status", "200")))] == 6
+    assert scraped[("nuvai_cache_lookups_total", (("cache", "ai_known_titles"), ("result", "hit")))] == 3
+    assert scraped[("nuvai_http_requests_in_flight", ())] == 3